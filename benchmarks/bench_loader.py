@@ -0,0 +1,60 @@
+"""
+Compare validated and trusted loading of session records.
+
+Dumps a synthetic series to JSON-mode dicts and JSON lines, then times
+building it back with pydantic validation (model_validate and
+model_validate_json) and with SessionLoader.load_frame (no models), with
+and without sampled validation. Sessions/s is for loading alone; the
+evaluation that follows uses the numpy engine for every loader, so model
+lists and frames go through the same float64 kernel (model lists also pay
+their frame conversion there).
+
+    python -m benchmarks.bench_loader --sessions 20000
+"""
+import argparse
+import time
+import warnings
+
+from evaluator import PerformanceEvaluator, SessionLoader, SessionStats
+
+from benchmarks.synthetic import generate_sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20_000)
+    parser.add_argument("--symbols", type=int, default=20, help="positions per session")
+    parser.add_argument("--sample", type=float, default=0.01, help="sampled validation fraction")
+    args = parser.parse_args()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        sessions = generate_sessions(args.sessions, args.symbols)
+        records = [s.model_dump(mode="json") for s in sessions]
+        lines = [s.model_dump_json() for s in sessions]
+    evaluator = PerformanceEvaluator(risk_free_rate=0.03, engine="numpy")
+
+    loaders = {
+        "model_validate": lambda: [SessionStats.model_validate(r) for r in records],
+        "model_validate_json": lambda: [SessionStats.model_validate_json(line) for line in lines],
+        "load_frame": lambda: SessionLoader.load_frame(records),
+        f"load_frame (validate {args.sample:.0%})": lambda: SessionLoader.load_frame(
+            records, validate_fraction=args.sample
+        ),
+    }
+
+    print(f"sessions: {args.sessions}, positions per session: {args.symbols}")
+    print(f"{'Loader':<32} {'Load (s)':>10} {'Sessions/s':>12} {'Evaluate (s)':>13}")
+    for name, load in loaders.items():
+        start = time.perf_counter()
+        loaded = load()
+        load_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        evaluator.evaluate(loaded)
+        evaluate_seconds = time.perf_counter() - start
+        rate = args.sessions / load_seconds
+        print(f"{name:<32} {load_seconds:>10.3f} {rate:>12,.0f} {evaluate_seconds:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
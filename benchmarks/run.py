@@ -0,0 +1,220 @@
+"""
+Timed benchmark scenarios for the evaluator package.
+
+Each scenario runs against a freshly generated (seeded) session series
+whose cached derived values have not been computed yet: one cold run,
+then ``--repeat`` warm runs, then one run under tracemalloc for
+peak memory. Results are printed and written to JSON so runs can be
+compared over time:
+
+    python -m benchmarks.run --sessions 2000 --symbols 50
+    python -m benchmarks.run --compare benchmarks/results/<earlier>.json
+"""
+import argparse
+import atexit
+import contextlib
+import datetime
+import io
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+import numpy as np
+import pydantic
+
+from evaluator import (
+    FixedPointFrame,
+    PerformanceCache,
+    PerformanceEvaluator,
+    PerformanceFormatter,
+    SessionArchive,
+    SessionFrame,
+    SessionIndex,
+    SessionLedger,
+)
+from evaluator.calculators import PerformanceCalculator, RatioCalculator
+
+from .synthetic import generate_sessions, perturb_sessions
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def _quiet(func: Callable[[], object]) -> Callable[[], object]:
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return func()
+    return run
+
+
+def build_scenarios(sessions, setup_sessions) -> Dict[str, Callable[[], object]]:
+    """Scenario callables over ``sessions``; inputs they need are prepared from ``setup_sessions``."""
+    evaluator = PerformanceEvaluator(risk_free_rate=0.03)
+    numpy_evaluator = PerformanceEvaluator(risk_free_rate=0.03, engine="numpy")
+    fixed_evaluator = PerformanceEvaluator(risk_free_rate=0.03, engine="fixed")
+    cached_evaluator = PerformanceEvaluator(risk_free_rate=0.03, cache=PerformanceCache())
+    other = perturb_sessions(setup_sessions)
+    frame = SessionFrame.from_sessions(setup_sessions)
+    fixed_frame = FixedPointFrame.from_sessions(setup_sessions)
+    position_index = PerformanceCalculator.index_positions(setup_sessions)
+    symbol = max(position_index, key=lambda s: len(position_index[s]))
+    returns = [float(s.profit_loss) for s in setup_sessions]
+    performance = evaluator.evaluate(setup_sessions)
+    comparison = evaluator.compare(setup_sessions, other)
+    index = SessionIndex.from_sessions(setup_sessions)
+    archive_dir = tempfile.TemporaryDirectory()
+    atexit.register(archive_dir.cleanup)
+    archive_path = os.path.join(archive_dir.name, "sessions.evsf")
+    SessionArchive.write(archive_path, setup_sessions)
+    ledger = SessionLedger(risk_free_rate=0.03, sessions=setup_sessions)
+    restated = itertools.cycle([other[-1].model_copy(update={"session": setup_sessions[-1].session}), setup_sessions[-1]])
+    bar_equity = np.repeat([float(s.end_market_value) for s in setup_sessions], 240)
+    bar_equity += np.random.default_rng(0).normal(0.0, 50.0, len(bar_equity))
+    bar_sessions = np.repeat([s.session for s in setup_sessions], 240)
+    range_start = setup_sessions[len(setup_sessions) // 4].session
+    range_end = setup_sessions[3 * len(setup_sessions) // 4].session
+
+    return {
+        "evaluate": lambda: evaluator.evaluate(sessions),
+        "evaluate_numpy": lambda: numpy_evaluator.evaluate(sessions),
+        "evaluate_fixed": lambda: fixed_evaluator.evaluate(sessions),
+        "evaluate_frame": lambda: evaluator.evaluate(frame),
+        "evaluate_fixed_frame": lambda: evaluator.evaluate(fixed_frame),
+        "evaluate_metrics": lambda: numpy_evaluator.evaluate(sessions, metrics=["sharpe_ratio", "max_drawdown"]),
+        "evaluate_cached": lambda: cached_evaluator.evaluate(sessions),
+        "ledger_amend": lambda: (ledger.amend(next(restated)), ledger.performance()),
+        "evaluate_archive": lambda: evaluator.evaluate(SessionArchive.open(archive_path)),
+        "evaluate_rolling": lambda: evaluator.evaluate_rolling(frame, 60),
+        "evaluate_drawdowns": lambda: evaluator.evaluate_drawdowns(frame).top(10),
+        "evaluate_bars": lambda: evaluator.evaluate_bars(frame, bar_equity, bar_sessions, chunk_size=1 << 16),
+        "evaluate_range": lambda: evaluator.evaluate(sessions, start=range_start, end=range_end),
+        "evaluate_range_index": lambda: evaluator.evaluate(index, start=range_start, end=range_end),
+        "compare": lambda: evaluator.compare(sessions, other),
+        "evaluate_position": lambda: evaluator.evaluate_position(position_index[symbol], symbol),
+        "evaluate_all_positions": lambda: evaluator.evaluate_all_positions(sessions),
+        "ratio_sharpe": lambda: RatioCalculator.compute_sharpe_ratio(returns, 0.03, len(returns)),
+        "ratio_sortino": lambda: RatioCalculator.compute_sortino_ratio(returns, 0.03, len(returns)),
+        "ratio_calmar": lambda: RatioCalculator.compute_calmar_ratio(performance.net_profit, performance.max_drawdown),
+        "print_performance_metrics": _quiet(lambda: PerformanceFormatter.print_performance_metrics(performance)),
+        "print_account_summary": _quiet(lambda: PerformanceFormatter.print_account_summary(sessions)),
+        "print_session_details": _quiet(lambda: PerformanceFormatter.print_session_details(sessions)),
+        "print_symbol_breakdown": _quiet(lambda: PerformanceFormatter.print_symbol_breakdown(sessions)),
+        "print_comparison": _quiet(lambda: PerformanceFormatter.print_comparison(comparison)),
+    }
+
+
+def measure(name: str, args) -> Dict[str, object]:
+    sessions = generate_sessions(args.sessions, args.symbols, args.trades, seed=args.seed)
+    setup_sessions = generate_sessions(args.sessions, args.symbols, args.trades, seed=args.seed)
+    func = build_scenarios(sessions, setup_sessions)[name]
+
+    start = time.perf_counter()
+    func()
+    cold = time.perf_counter() - start
+
+    warm = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        func()
+        warm.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(warm) if warm else cold
+    return {
+        "cold_seconds": cold,
+        "warm_seconds": best,
+        "warm_runs": warm,
+        "peak_memory_bytes": peak,
+        "sessions_per_second": args.sessions / best if best > 0 else None,
+    }
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def print_results(results: Dict[str, Dict[str, object]], baseline: Dict[str, Dict[str, object]]):
+    header = f"{'Scenario':<28} {'Cold (s)':>10} {'Warm (s)':>10} {'Sessions/s':>14} {'Peak MiB':>10}"
+    if baseline:
+        header += f" {'vs base':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        line = (
+            f"{name:<28} {r['cold_seconds']:>10.4f} {r['warm_seconds']:>10.4f} "
+            f"{r['sessions_per_second'] or 0:>14,.0f} {r['peak_memory_bytes'] / 2 ** 20:>10.2f}"
+        )
+        if name in baseline:
+            line += f" {baseline[name]['warm_seconds'] / r['warm_seconds']:>8.2f}x"
+        print(line)
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Run evaluator benchmarks.")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--symbols", type=int, default=20, help="positions per session")
+    parser.add_argument("--trades", type=int, default=5, help="trades per session")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="warm runs per scenario")
+    parser.add_argument("--scenario", action="append", help="run only these scenarios")
+    parser.add_argument("--output", help="JSON output path (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", help="earlier JSON result to compare warm times against")
+    args = parser.parse_args(argv)
+
+    tiny = generate_sessions(5, 2, 1, seed=args.seed)
+    available = list(build_scenarios(tiny, tiny))
+    names = args.scenario or available
+    unknown = sorted(set(names) - set(available))
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+
+    results = {name: measure(name, args) for name in names}
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+    print_results(results, baseline)
+
+    timestamp = datetime.datetime.now().strftime("%Y%m%dT%H%M%S")
+    output = args.output or os.path.join(RESULTS_DIR, f"{timestamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "timestamp": timestamp,
+            "git_revision": _git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pydantic": pydantic.VERSION,
+            "params": {
+                "sessions": args.sessions,
+                "symbols": args.symbols,
+                "trades": args.trades,
+                "seed": args.seed,
+                "repeat": args.repeat,
+            },
+            "results": results,
+        }, f, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
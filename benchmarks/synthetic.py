@@ -0,0 +1,135 @@
+"""
+Seeded synthetic session generator for benchmarks.
+
+Produces a realistic-looking account history: weekday session ids
+(YYYYMMDD), a fixed symbol universe, positions carried from one session
+to the next, trades that move cash, commissions, and an occasional
+closed position with realized PnL. The same arguments always produce
+the same series.
+"""
+import datetime
+import random
+from decimal import Decimal
+from typing import List
+
+from evaluator import PositionSessionStats, SessionStats
+
+CENT = Decimal("0.01")
+
+
+def session_ids(count: int, start: datetime.date = datetime.date(2015, 1, 5)) -> List[int]:
+    """Weekday session ids as YYYYMMDD integers."""
+    ids = []
+    day = start
+    while len(ids) < count:
+        if day.weekday() < 5:
+            ids.append(day.year * 10000 + day.month * 100 + day.day)
+        day += datetime.timedelta(days=1)
+    return ids
+
+
+def generate_sessions(
+    num_sessions: int = 1000,
+    symbols_per_session: int = 20,
+    trades_per_session: int = 5,
+    universe_size: int = 0,
+    initial_cash: Decimal = Decimal("1000000"),
+    seed: int = 0,
+) -> List[SessionStats]:
+    """
+    Generate a series of SessionStats.
+
+    ``symbols_per_session`` positions are held each session out of a
+    universe of ``universe_size`` symbols (default: four times as many),
+    and ``trades_per_session`` of them trade each session.
+    """
+    rng = random.Random(seed)
+    universe_size = universe_size or max(symbols_per_session * 4, 1)
+    universe = [f"{600000 + i:06d}" for i in range(universe_size)]
+
+    held = {symbol: (0, Decimal("0")) for symbol in rng.sample(universe, symbols_per_session)}
+    cash = initial_cash
+    sessions = []
+
+    for session in session_ids(num_sessions):
+        traded = set(rng.sample(sorted(held), min(trades_per_session, len(held))))
+        start_positions = []
+        end_positions = []
+        trades = []
+        net_cashflow_total = Decimal("0")
+        commission_total = Decimal("0")
+
+        for symbol in sorted(held):
+            volume, value = held[symbol]
+            price = Decimal(rng.randint(500, 5000)) / 100
+            start_value = value
+            end_volume = volume
+            net_cashflow = Decimal("0")
+            realized = Decimal("0")
+            commission = Decimal("0")
+            trade_count = 0
+
+            if symbol in traded:
+                trade_count = 1
+                if volume > 0 and rng.random() < 0.5:
+                    proceeds = (price * volume).quantize(CENT)
+                    realized = (proceeds - value).quantize(CENT)
+                    net_cashflow = proceeds
+                    end_volume = 0
+                    trades.append({"code": symbol, "type": "sell", "volume": volume, "price": float(price)})
+                else:
+                    lot = rng.randint(1, 10) * 100
+                    net_cashflow = -(price * lot).quantize(CENT)
+                    end_volume = volume + lot
+                    trades.append({"code": symbol, "type": "buy", "volume": lot, "price": float(price)})
+                commission = max((abs(net_cashflow) * Decimal("0.0003")).quantize(CENT), Decimal("5"))
+
+            drift = Decimal(rng.randint(-300, 320)) / 10000
+            end_value = (price * end_volume * (1 + drift)).quantize(CENT)
+
+            position = PositionSessionStats(
+                session=session,
+                symbol=symbol,
+                start_volume=volume,
+                start_value=start_value,
+                end_volume=end_volume,
+                end_value=end_value,
+                net_cashflow=net_cashflow,
+                realized_profit=realized,
+                commission=commission,
+                trade_count=trade_count,
+            )
+            if volume > 0:
+                start_positions.append(position)
+            end_positions.append(position)
+
+            net_cashflow_total += net_cashflow
+            commission_total += commission
+            held[symbol] = (end_volume, end_value)
+
+        for symbol in [s for s, (volume, _) in held.items() if volume == 0]:
+            del held[symbol]
+            replacement = rng.choice([s for s in universe if s not in held])
+            held[replacement] = (0, Decimal("0"))
+
+        end_cash = cash + net_cashflow_total - commission_total
+        sessions.append(SessionStats(
+            session=session,
+            start_cash=cash,
+            end_cash=end_cash,
+            start_positions=start_positions,
+            end_positions=end_positions,
+            trades=trades,
+        ))
+        cash = end_cash
+
+    return sessions
+
+
+def perturb_sessions(sessions: List[SessionStats], seed: int = 1) -> List[SessionStats]:
+    """A second run of the same history with small cash differences, e.g. live vs backtest."""
+    rng = random.Random(seed)
+    return [
+        s.model_copy(update={"end_cash": s.end_cash + Decimal(rng.randint(-5000, 5000)) / 100})
+        for s in sessions
+    ]
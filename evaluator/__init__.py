@@ -1,13 +1,40 @@
 from .evaluator import PerformanceEvaluator
+from .streaming import StreamingEvaluator
+from .session_index import SessionIndex
+from .aggregate import PerformanceAggregate
+from .archive import SessionArchive
+from .loader import SessionLoader
+from .cache import PerformanceCache
+from .fingerprint import SessionFingerprint
+from .ledger import SessionLedger
 from .formatters import PerformanceFormatter
-from .models import Performance, SessionStats, PositionSessionStats, PerformanceComparison, SessionComparison
+from .instrumentation import StageTimings
+from .models import Performance, SessionStats, PositionSessionStats, PerformanceComparison, SessionComparison, SessionComparisonTable, SessionFrame, FixedPointFrame, RollingMetrics, DrawdownAnalysis, DrawdownEpisode, BarMetrics, PerformanceRecord, PerformanceBatch
 
 __all__ = [
     "PerformanceEvaluator",
+    "StreamingEvaluator",
+    "SessionIndex",
+    "PerformanceAggregate",
+    "SessionArchive",
+    "SessionLoader",
+    "PerformanceCache",
+    "SessionFingerprint",
+    "SessionLedger",
     "PerformanceFormatter",
+    "StageTimings",
     "Performance",
     "SessionStats",
     "PositionSessionStats",
     "PerformanceComparison",
     "SessionComparison",
+    "SessionComparisonTable",
+    "SessionFrame",
+    "FixedPointFrame",
+    "RollingMetrics",
+    "DrawdownAnalysis",
+    "DrawdownEpisode",
+    "BarMetrics",
+    "PerformanceRecord",
+    "PerformanceBatch",
 ]
@@ -0,0 +1,267 @@
+import bisect
+import copy
+from decimal import Decimal
+from typing import Iterable, List, Optional
+
+from .instrumentation import NO_TIMINGS, StageTimings
+from .models.performance import Performance
+from .models.session_stats import SessionStats
+from .calculators import PerformanceCalculator, RatioCalculator
+from .calculators.accumulators import RunningMoments
+from .calculators.drawdown import DrawdownSegment
+
+
+class PerformanceAggregate:
+    """
+    可合并的账户绩效部分聚合。
+
+    对一段连续交易日累计计数、金额、收益矩、回撤摘要和边界权益，merge 满足结合律，
+    可把长序列分块在不同进程或机器上聚合后按顺序合并。首个交易日的盈亏调整依赖
+    整体第一个有期初现金的交易日，因此段首盈亏单独保存，在 to_performance 时才折算。
+
+    金额类字段以 Decimal 累加，与 compute_account_performance 完全一致；
+    夏普/索提诺由合并后的矩计算，在浮点精度内一致。回撤持续时间按段内自身的峰值累计当前和最长
+    水下天数；段首的水下天数取决于此前各段的峰值，因此另外只保存段内创新高的权益及其位置，
+    merge 和 to_performance 时按前段峰值二分查找段首水下天数。
+
+    内存不保留 SessionStats，但不是常数：前 N% 贡献度需要全部盈亏值，wins/losses 为每个盈利/亏损
+    交易日保存一个 float，新高列表随创新高的次数增长，因此为 O(n) 个 float。
+    """
+
+    __slots__ = (
+        "count",
+        "head_pnl",
+        "head_start_cash",
+        "base_amount",
+        "initial_cash",
+        "final_value",
+        "open_positions",
+        "total_commission",
+        "drawdown",
+        "underwater_run",
+        "max_underwater_run",
+        "high_values",
+        "high_positions",
+        "moments",
+        "winning_trades",
+        "losing_trades",
+        "total_win",
+        "total_loss",
+        "max_single_win",
+        "max_single_loss",
+        "wins",
+        "losses",
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.head_pnl = Decimal("0")
+        self.head_start_cash = Decimal("0")
+        self.base_amount: Optional[Decimal] = None
+        self.initial_cash = Decimal("0")
+        self.final_value = Decimal("0")
+        self.open_positions = 0
+        self.total_commission = Decimal("0")
+        self.drawdown: Optional[DrawdownSegment] = None
+        # 按段内峰值(不含期初资金)计算的当前/最长水下天数，以及段内严格创新高的权益与位置
+        self.underwater_run = 0
+        self.max_underwater_run = 0
+        self.high_values: List[float] = []
+        self.high_positions: List[int] = []
+
+        # 以下统计量不含段首交易日
+        self.moments = RunningMoments()
+        self.winning_trades = 0
+        self.losing_trades = 0
+        self.total_win = Decimal("0")
+        self.total_loss = Decimal("0")
+        self.max_single_win = Decimal("0")
+        self.max_single_loss = Decimal("0")
+        self.wins: List[float] = []
+        self.losses: List[float] = []
+
+    def __len__(self) -> int:
+        return self.count
+
+    @classmethod
+    def from_sessions(cls, sessions: Iterable[SessionStats]) -> "PerformanceAggregate":
+        """聚合一段连续交易日"""
+        aggregate = cls()
+        for session in sessions:
+            aggregate.add(session)
+        return aggregate
+
+    def add(self, session: SessionStats):
+        """在段尾加入一个交易日"""
+        equity = session.end_market_value
+        segment = DrawdownSegment.of(equity)
+
+        if self.count == 0:
+            self.head_pnl = session.profit_loss
+            self.head_start_cash = session.start_cash
+            self.initial_cash = session.end_cash
+            self.drawdown = segment
+        else:
+            self._fold(session.profit_loss)
+            self.drawdown = self.drawdown.combine(segment)
+
+        if self.base_amount is None and session.start_cash > 0:
+            self.base_amount = session.start_cash
+
+        value = float(equity)
+        if not self.high_values or value > self.high_values[-1]:
+            self.high_values.append(value)
+            self.high_positions.append(self.count)
+            self.underwater_run = 0
+        elif value < self.high_values[-1]:
+            self.underwater_run += 1
+            self.max_underwater_run = max(self.max_underwater_run, self.underwater_run)
+        else:
+            self.underwater_run = 0
+
+        self.count += 1
+        self.final_value = equity
+        self.open_positions = len(session.end_positions)
+        self.total_commission += session.total_commission
+
+    def merge(self, other: "PerformanceAggregate") -> "PerformanceAggregate":
+        """合并两段相邻聚合(self 在前)，返回新对象"""
+        if other.count == 0:
+            return self.copy()
+        if self.count == 0:
+            return other.copy()
+
+        merged = self.copy()
+        merged._absorb(other)
+        return merged
+
+    @classmethod
+    def merge_all(cls, aggregates: Iterable["PerformanceAggregate"]) -> "PerformanceAggregate":
+        """按顺序合并多段相邻聚合，只复制一次，总耗时与交易日数成正比"""
+        merged = cls()
+        for aggregate in aggregates:
+            if aggregate.count == 0:
+                continue
+            if merged.count == 0:
+                merged = aggregate.copy()
+            else:
+                merged._absorb(aggregate)
+        return merged
+
+    def copy(self) -> "PerformanceAggregate":
+        """复制聚合，可变的矩、新高和盈亏列表各自独立(其余字段不可变，无需 deepcopy)"""
+        copied = PerformanceAggregate.__new__(PerformanceAggregate)
+        for name in self.__slots__:
+            setattr(copied, name, getattr(self, name))
+        copied.moments = copy.copy(self.moments)
+        copied.high_values = list(self.high_values)
+        copied.high_positions = list(self.high_positions)
+        copied.wins = list(self.wins)
+        copied.losses = list(self.losses)
+        return copied
+
+    def to_performance(self, risk_free_rate: float, timings: Optional[StageTimings] = None) -> Performance:
+        """把整体聚合转换为账户绩效(与对全部交易日调用 compute_account_performance 一致)"""
+        clock = timings.start() if timings is not None else NO_TIMINGS
+        if self.count == 0:
+            performance = PerformanceCalculator._empty_account_performance()
+            clock.mark(StageTimings.MODEL_CONSTRUCTION)
+            return performance
+
+        base_amount = self.base_amount if self.base_amount is not None else Decimal("0")
+        head = PerformanceAggregate()
+        head._fold(self.head_pnl - base_amount + self.head_start_cash)
+
+        moments = head.moments.merge(self.moments)
+        winning_trades = head.winning_trades + self.winning_trades
+        losing_trades = head.losing_trades + self.losing_trades
+        total_win = head.total_win + self.total_win
+        total_loss = head.total_loss + self.total_loss
+
+        sharpe_ratio = RatioCalculator.sharpe_from_moments(moments.mean, moments.variance, risk_free_rate)
+        sortino_ratio = (
+            RatioCalculator.sortino_from_moments(moments.mean, moments.downside_variance, risk_free_rate)
+            if moments.downside_count else 0.0
+        )
+        clock.mark(StageTimings.RATIOS)
+
+        total_win_amount = float(total_win) if total_win > 0 else 0.0
+        total_loss_amount = float(abs(total_loss)) if total_loss < 0 else 0.0
+        top_win_contributions = PerformanceCalculator._calculate_top_contributions(
+            head.wins + self.wins, total_win_amount
+        )
+        top_loss_contributions = PerformanceCalculator._calculate_top_contributions(
+            head.losses + self.losses, total_loss_amount, is_loss=True
+        )
+        clock.mark(StageTimings.TOP_CONTRIBUTIONS)
+
+        performance = PerformanceCalculator._assemble_account_performance(
+            initial_cash=self.initial_cash,
+            final_value=self.final_value,
+            total_commission=self.total_commission,
+            max_drawdown=Decimal(self.drawdown.drawdown_from(self.initial_cash)),
+            winning_trades=winning_trades,
+            losing_trades=losing_trades,
+            total_win=total_win,
+            total_loss=total_loss,
+            max_single_win=max(head.max_single_win, self.max_single_win),
+            max_single_loss=min(head.max_single_loss, self.max_single_loss),
+            sharpe_ratio=sharpe_ratio,
+            sortino_ratio=sortino_ratio,
+            top_win_contributions=top_win_contributions,
+            top_loss_contributions=top_loss_contributions,
+            open_positions=self.open_positions,
+            max_drawdown_duration_bars=max(self.max_underwater_run, self._leading_underwater(float(self.initial_cash))),
+        )
+        clock.mark(StageTimings.MODEL_CONSTRUCTION)
+        return performance
+
+    def _leading_underwater(self, peak: float) -> int:
+        # 此前峰值为 peak 时段首连续水下的天数：第一个不低于 peak 的权益必为段内新高
+        i = bisect.bisect_left(self.high_values, peak)
+        return self.high_positions[i] if i < len(self.high_positions) else self.count
+
+    def _absorb(self, other: "PerformanceAggregate"):
+        # 把紧随其后的非空聚合就地并入 self(self 非空)
+        peak = self.high_values[-1]
+        lead = other._leading_underwater(peak)
+        self.max_underwater_run = max(self.max_underwater_run, other.max_underwater_run, self.underwater_run + lead)
+        self.underwater_run = self.underwater_run + other.count if lead == other.count else other.underwater_run
+        first = bisect.bisect_right(other.high_values, peak)
+        self.high_values.extend(other.high_values[first:])
+        self.high_positions.extend(self.count + position for position in other.high_positions[first:])
+
+        self._fold(other.head_pnl)
+        self.moments = self.moments.merge(other.moments)
+        self.winning_trades += other.winning_trades
+        self.losing_trades += other.losing_trades
+        self.total_win += other.total_win
+        self.total_loss += other.total_loss
+        self.max_single_win = max(self.max_single_win, other.max_single_win)
+        self.max_single_loss = min(self.max_single_loss, other.max_single_loss)
+        self.wins.extend(other.wins)
+        self.losses.extend(other.losses)
+
+        self.count += other.count
+        if self.base_amount is None:
+            self.base_amount = other.base_amount
+        self.final_value = other.final_value
+        self.open_positions = other.open_positions
+        self.total_commission += other.total_commission
+        self.drawdown = self.drawdown.combine(other.drawdown)
+
+    def _fold(self, pnl: Decimal):
+        self.moments.add(float(pnl))
+
+        if pnl > 0:
+            self.winning_trades += 1
+            self.total_win += pnl
+            self.wins.append(float(pnl))
+            if pnl > self.max_single_win:
+                self.max_single_win = pnl
+        elif pnl < 0:
+            self.losing_trades += 1
+            self.total_loss += pnl
+            self.losses.append(float(pnl))
+            if pnl < self.max_single_loss:
+                self.max_single_loss = pnl
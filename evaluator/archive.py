@@ -0,0 +1,106 @@
+import json
+import os
+import struct
+from typing import List, Union
+
+import numpy as np
+
+from .models.session_frame import SessionFrame
+from .models.session_stats import SessionStats
+
+
+class SessionArchive:
+    """
+    交易日序列的二进制归档格式。
+
+    单文件布局：8 字节魔数、8 字节头部长度、JSON 头部(版本、行数、代码字典、各列的
+    dtype/偏移/长度)，之后是按 64 字节对齐的定长列(账户列和展平的持仓表)。
+    open 通过 numpy.memmap 映射文件，各列为零拷贝视图，直接组成 SessionFrame。
+    """
+
+    MAGIC = b"EVALSF01"
+    VERSION = 1
+    ALIGNMENT = 64
+
+    COLUMNS = (
+        ("session", "<i8"),
+        ("start_cash", "<f8"),
+        ("end_cash", "<f8"),
+        ("end_market_value", "<f8"),
+        ("commission", "<f8"),
+        ("pnl", "<f8"),
+        ("position_offsets", "<i8"),
+        ("position_symbol", "<i4"),
+        ("position_start_value", "<f8"),
+        ("position_end_value", "<f8"),
+        ("position_end_volume", "<i8"),
+        ("position_realized_profit", "<f8"),
+        ("position_commission", "<f8"),
+        ("position_trade_count", "<i8"),
+    )
+
+    _PREAMBLE = struct.Struct("<8sQ")
+
+    @staticmethod
+    def write(path: Union[str, os.PathLike], sessions: Union[List[SessionStats], SessionFrame]):
+        """把交易日序列写入归档文件"""
+        frame = sessions if isinstance(sessions, SessionFrame) else SessionFrame.from_sessions(sessions)
+
+        arrays = [
+            (name, np.ascontiguousarray(getattr(frame, name), dtype=dtype))
+            for name, dtype in SessionArchive.COLUMNS
+        ]
+
+        columns = {}
+        offset = 0
+        for name, array in arrays:
+            offset = _align(offset)
+            columns[name] = {"dtype": array.dtype.str, "offset": offset, "length": len(array)}
+            offset += array.nbytes
+
+        header = {
+            "version": SessionArchive.VERSION,
+            "sessions": len(frame),
+            "symbols": list(frame.symbols),
+            "columns": columns,
+        }
+        header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        data_start = _align(SessionArchive._PREAMBLE.size + len(header_bytes))
+
+        with open(path, "wb") as f:
+            f.write(SessionArchive._PREAMBLE.pack(SessionArchive.MAGIC, len(header_bytes)))
+            f.write(header_bytes)
+            for name, array in arrays:
+                f.seek(data_start + columns[name]["offset"])
+                f.write(array.tobytes())
+            f.truncate(data_start + offset)
+
+    @staticmethod
+    def open(path: Union[str, os.PathLike]) -> SessionFrame:
+        """以只读内存映射打开归档文件，返回列为零拷贝视图的 SessionFrame"""
+        with open(path, "rb") as f:
+            magic, header_length = SessionArchive._PREAMBLE.unpack(f.read(SessionArchive._PREAMBLE.size))
+            if magic != SessionArchive.MAGIC:
+                raise ValueError(f"{os.fspath(path)!r} is not a session archive")
+            header = json.loads(f.read(header_length).decode("utf-8"))
+        if header["version"] != SessionArchive.VERSION:
+            raise ValueError(f"Unsupported session archive version {header['version']}")
+
+        data_start = _align(SessionArchive._PREAMBLE.size + header_length)
+        if os.path.getsize(path) == data_start:
+            buffer = np.empty(0, dtype=np.uint8)
+        else:
+            buffer = np.memmap(path, dtype=np.uint8, mode="r", offset=data_start)
+
+        values = {}
+        for name, _ in SessionArchive.COLUMNS:
+            column = header["columns"][name]
+            dtype = np.dtype(column["dtype"])
+            start = column["offset"]
+            values[name] = buffer[start:start + column["length"] * dtype.itemsize].view(dtype)
+
+        return SessionFrame(symbols=header["symbols"], **values)
+
+
+def _align(offset: int) -> int:
+    return -(-offset // SessionArchive.ALIGNMENT) * SessionArchive.ALIGNMENT
@@ -0,0 +1,191 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from collections.abc import Sequence as AbcSequence
+from typing import Any, NamedTuple, Optional, Union
+
+import numpy as np
+
+from .fingerprint import SessionFingerprint
+from .models.fixed_frame import FixedPointFrame
+from .models.session_frame import SessionFrame
+from .session_index import SessionIndex
+
+
+class CacheInfo(NamedTuple):
+    """缓存统计"""
+
+    hits: int
+    misses: int
+    disk_hits: int
+    evictions: int
+    entries: int
+    nbytes: int
+
+
+class PerformanceCache:
+    """
+    按内容寻址的评估结果缓存。
+
+    键由 VERSION、fingerprint(输入序列的内容摘要)与 risk_free_rate 等参数组合得到，
+    内存层按 LRU 淘汰，同时受条目数 max_entries 和字节预算 max_bytes(按 pickle 后大小计)
+    限制。指定 directory 时启用磁盘层：写入时同时落盘，内存未命中时从磁盘读取并放回内存，
+    进程重启后仍可命中。磁盘层不做淘汰，需要时用 clear(disk=True) 清理；
+    损坏或无法读取的磁盘条目按未命中处理并删除。
+
+    缓存保存 pickle 后的字节，每次命中都返回新反序列化的副本，调用方修改结果不影响缓存。
+    """
+
+    # 缓存结果的格式版本，结果模型或计算口径变化时递增，使旧的磁盘条目不再命中
+    VERSION = 2
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        directory: Optional[Union[str, os.PathLike]] = None,
+    ):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = os.fspath(directory) if directory is not None else None
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def nbytes(self) -> int:
+        """内存层缓存值的总大小(字节)"""
+        return self._nbytes
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.disk_hits, self.evictions, len(self._entries), self._nbytes)
+
+    @staticmethod
+    def fingerprint(sessions: Any) -> Optional[str]:
+        """
+        输入序列的内容摘要(十六进制)。
+
+        SessionStats 序列为 SessionFingerprint 的链式指纹；SessionFrame、
+        FixedPointFrame 和 SessionIndex 对列数据做摘要。生成器等单次迭代对象无法
+        在不消费的前提下计算摘要，返回 None(不缓存)。
+        """
+        h = hashlib.blake2b(digest_size=16)
+        if isinstance(sessions, SessionIndex):
+            sessions = sessions.frame
+        if isinstance(sessions, SessionFrame):
+            h.update(b"frame")
+            for name in SessionFrame.__slots__:
+                if name == "symbols":
+                    h.update("\x1f".join(sessions.symbols).encode())
+                else:
+                    h.update(np.ascontiguousarray(getattr(sessions, name)).tobytes())
+                h.update(b"\x1e")
+        elif isinstance(sessions, FixedPointFrame):
+            h.update(f"fixed{sessions.decimals}".encode())
+            for name in FixedPointFrame.__slots__[:-1]:
+                h.update(np.ascontiguousarray(getattr(sessions, name)).tobytes())
+                h.update(b"\x1e")
+        elif isinstance(sessions, AbcSequence):
+            return SessionFingerprint(sessions).hexdigest()
+        else:
+            return None
+        return h.hexdigest()
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """由格式版本、指纹与参数组合出缓存键"""
+        return hashlib.blake2b(repr((PerformanceCache.VERSION,) + parts).encode(), digest_size=20).hexdigest()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """读取缓存值的副本(依次查内存层和磁盘层)，未命中返回 default"""
+        payload = self._entries.get(key)
+        if payload is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pickle.loads(payload)
+
+        if self.directory is not None:
+            value = self._load(key)
+            if value is not None:
+                self.hits += 1
+                self.disk_hits += 1
+                return value
+
+        self.misses += 1
+        return default
+
+    def put(self, key: str, value: Any):
+        """写入缓存值"""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._insert(key, payload)
+        if self.directory is not None:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+    def clear(self, disk: bool = False):
+        """清空内存层(disk=True 时同时删除磁盘层文件)，计数器不变"""
+        self._entries.clear()
+        self._nbytes = 0
+        if disk and self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.unlink(os.path.join(self.directory, name))
+
+    def _load(self, key: str) -> Any:
+        # 读取并反序列化磁盘条目，文件损坏或截断时删除它并返回 None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                payload = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            value = pickle.loads(payload)
+        except Exception:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            return None
+        self._insert(key, payload)
+        return value
+
+    def _insert(self, key: str, payload: bytes):
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._nbytes -= len(previous)
+        if len(payload) > self.max_bytes:
+            return
+        self._entries[key] = payload
+        self._nbytes += len(payload)
+        while len(self._entries) > self.max_entries or self._nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._nbytes -= len(evicted)
+            self.evictions += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pkl")
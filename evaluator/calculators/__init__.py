@@ -1,2 +1,6 @@
 from .calculator import PerformanceCalculator
 from .ratio import RatioCalculator
+from .rolling import RollingCalculator
+from .drawdown import DrawdownCalculator
+from .bars import BarAccumulator, BarCalculator
+from .metrics import METRICS, Metric, MetricRegistry
@@ -0,0 +1,112 @@
+import heapq
+from typing import List, Sequence
+
+import numpy as np
+
+from .calculator import TOP_CONTRIBUTION_CUT_POINTS
+
+
+class RunningMoments:
+    """收益序列的在线统计量 - Welford 均值/方差与下行二阶矩"""
+
+    __slots__ = ("count", "mean", "m2", "downside_count", "downside_sumsq")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.downside_count = 0
+        self.downside_sumsq = 0.0
+
+    @classmethod
+    def of(cls, values: np.ndarray) -> "RunningMoments":
+        """一段收益数组的统计量(按数组计算，可再与其他段 merge)"""
+        moments = cls()
+        if len(values) == 0:
+            return moments
+        losses = values[values < 0]
+        moments.count = len(values)
+        moments.mean = float(values.mean())
+        moments.m2 = float(np.sum((values - moments.mean) ** 2))
+        moments.downside_count = len(losses)
+        moments.downside_sumsq = float(np.dot(losses, losses))
+        return moments
+
+    def add(self, value: float):
+        """加入一个收益值，O(1)"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < 0:
+            self.downside_count += 1
+            self.downside_sumsq += value * value
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        """合并两段统计量(Chan 并行公式)，返回新对象"""
+        merged = RunningMoments()
+        merged.count = self.count + other.count
+        merged.downside_count = self.downside_count + other.downside_count
+        merged.downside_sumsq = self.downside_sumsq + other.downside_sumsq
+        if merged.count == 0:
+            return merged
+        delta = other.mean - self.mean
+        merged.mean = self.mean + delta * other.count / merged.count
+        merged.m2 = self.m2 + other.m2 + delta * delta * self.count * other.count / merged.count
+        return merged
+
+    @property
+    def variance(self) -> float:
+        """总体方差(与 RatioCalculator 一致，除以 n)"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def downside_variance(self) -> float:
+        """负收益平方均值"""
+        return self.downside_sumsq / self.downside_count if self.downside_count else 0.0
+
+
+class TopContributionTracker:
+    """
+    在线维护"前 N% 最大值之和"。
+
+    每个分位点用一对堆维护当前前 k 大的值(最小堆)和其余值(最大堆)，
+    插入为 O(log n)，查询为 O(1)。只接受非负值(亏损传入绝对值)。
+    """
+
+    __slots__ = ("_cut_points", "_top", "_rest", "_top_sums", "count")
+
+    def __init__(self, cut_points: Sequence[float] = TOP_CONTRIBUTION_CUT_POINTS):
+        self._cut_points = tuple(cut_points)
+        self._top: List[List[float]] = [[] for _ in self._cut_points]
+        self._rest: List[List[float]] = [[] for _ in self._cut_points]
+        self._top_sums = [0.0 for _ in self._cut_points]
+        self.count = 0
+
+    def add(self, value: float):
+        """加入一个非负值"""
+        self.count += 1
+        for i, n_pct in enumerate(self._cut_points):
+            top = self._top[i]
+            rest = self._rest[i]
+            if top and value > top[0]:
+                heapq.heappush(top, value)
+                self._top_sums[i] += value
+            else:
+                heapq.heappush(rest, -value)
+
+            k = max(1, int(self.count * n_pct / 100))
+            while len(top) > k:
+                moved = heapq.heappop(top)
+                self._top_sums[i] -= moved
+                heapq.heappush(rest, -moved)
+            while len(top) < k and rest:
+                moved = -heapq.heappop(rest)
+                heapq.heappush(top, moved)
+                self._top_sums[i] += moved
+
+    def contributions(self, total: float) -> List[float]:
+        """各分位点贡献占比(%)，与 PerformanceCalculator.compute_top_contributions 一致"""
+        if self.count == 0 or total == 0:
+            return [0.0 for _ in self._cut_points]
+        return [top_sum / total * 100 for top_sum in self._top_sums]
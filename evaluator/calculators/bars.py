@@ -0,0 +1,147 @@
+from typing import Optional
+
+import numpy as np
+
+from ..models.bar_metrics import BarMetrics
+from .accumulators import RunningMoments
+from .drawdown import DrawdownCalculator
+from .ratio import RatioCalculator
+
+
+class BarAccumulator:
+    """
+    日内 bar 权益的分块累计。
+
+    每次 add 一段按时间顺序的 bar(权益与所属交易日)，只在该段上做数组运算，
+    跨段保留峰值、当前连续水下 bar 数、最后一根 bar 的权益和收益矩，
+    因此内存只与单段长度有关，可逐段读取 np.memmap 或文件中的数百万根 bar。
+
+    峰值从 initial_peak 开始(与账户 max_drawdown 一致，为期初资金)；
+    收益为相邻 bar 的权益变化，第一根 bar 没有收益。
+    """
+
+    __slots__ = (
+        "peak",
+        "max_drawdown",
+        "max_drawdown_session",
+        "underwater_bars",
+        "max_drawdown_duration_bars",
+        "bars",
+        "sessions",
+        "moments",
+        "_last_equity",
+        "_last_session",
+    )
+
+    def __init__(self, initial_peak: float):
+        self.peak = float(initial_peak)
+        self.max_drawdown = 0.0
+        self.max_drawdown_session: Optional[int] = None
+        self.underwater_bars = 0
+        self.max_drawdown_duration_bars = 0
+        self.bars = 0
+        self.sessions = 0
+        self.moments = RunningMoments()
+        self._last_equity: Optional[float] = None
+        self._last_session: Optional[int] = None
+
+    def __len__(self) -> int:
+        return self.bars
+
+    def add(self, equity: np.ndarray, session: np.ndarray):
+        """加入紧接在已有 bar 之后的一段 bar，session 须不减"""
+        equity = np.asarray(equity, dtype=np.float64)
+        session = np.asarray(session, dtype=np.int64)
+        if len(equity) != len(session):
+            raise ValueError(f"Got {len(equity)} bar equities but {len(session)} bar sessions")
+        if len(equity) == 0:
+            return
+        steps = np.diff(session)
+        if np.any(steps < 0) or (self._last_session is not None and session[0] < self._last_session):
+            raise ValueError("Bar sessions must be non-decreasing")
+
+        underwater = DrawdownCalculator.underwater(equity, self.peak)
+        self.peak = max(self.peak, float(equity.max()))
+        deepest = int(underwater.argmin())
+        if -underwater[deepest] > self.max_drawdown:
+            self.max_drawdown = -float(underwater[deepest])
+            self.max_drawdown_session = int(session[deepest])
+
+        # 段首的水下区间接续上一段末尾的水下 bar 数
+        start, end = DrawdownCalculator.episode_bounds(underwater)
+        if len(start):
+            lengths = end - start
+            if start[0] == 0:
+                lengths[0] += self.underwater_bars
+            self.max_drawdown_duration_bars = max(self.max_drawdown_duration_bars, int(lengths.max()))
+            self.underwater_bars = int(lengths[-1]) if end[-1] == len(equity) else 0
+        else:
+            self.underwater_bars = 0
+
+        if self._last_equity is None:
+            returns = np.diff(equity)
+        else:
+            returns = np.diff(equity, prepend=self._last_equity)
+        self.moments = self.moments.merge(RunningMoments.of(returns))
+
+        self.sessions += int(np.count_nonzero(steps)) + int(session[0] != self._last_session)
+        self.bars += len(equity)
+        self._last_equity = float(equity[-1])
+        self._last_session = int(session[-1])
+
+    def result(self, risk_free_rate: float) -> BarMetrics:
+        """
+        当前累计的 bar 级绩效。
+
+        夏普比率沿用 RatioCalculator 的口径，无风险利率按每个交易日的平均 bar 数折算到每根 bar。
+        """
+        moments = self.moments
+        bars_per_session = self.bars / self.sessions if self.sessions else 1.0
+        sharpe_ratio = RatioCalculator.sharpe_from_moments(
+            moments.mean, moments.variance, risk_free_rate / bars_per_session
+        )
+        return BarMetrics(
+            bars=self.bars,
+            sessions=self.sessions,
+            max_drawdown=self.max_drawdown,
+            max_drawdown_session=self.max_drawdown_session,
+            max_drawdown_duration_bars=self.max_drawdown_duration_bars,
+            sharpe_ratio=sharpe_ratio,
+        )
+
+
+class BarCalculator:
+    """日内 bar 权益曲线的分块计算"""
+
+    # 每段 bar 数，单段的临时数组约为 CHUNK_SIZE * 8 字节的若干倍
+    CHUNK_SIZE = 1 << 20
+
+    @staticmethod
+    def compute_bar_metrics(
+        equity: np.ndarray,
+        session: np.ndarray,
+        initial_peak: float,
+        risk_free_rate: float,
+        chunk_size: int = CHUNK_SIZE,
+        session_ids: Optional[np.ndarray] = None,
+    ) -> BarMetrics:
+        """
+        按 chunk_size 分段累计 bar 级回撤、回撤持续 bar 数和夏普比率。
+
+        equity 与 session 一一对应(可为 np.memmap，每次只读入一段)；
+        给出 session_ids 时校验每根 bar 都属于其中的交易日。
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        if len(equity) != len(session):
+            raise ValueError(f"Got {len(equity)} bar equities but {len(session)} bar sessions")
+
+        accumulator = BarAccumulator(initial_peak)
+        for lo in range(0, len(equity), chunk_size):
+            chunk_sessions = np.asarray(session[lo:lo + chunk_size], dtype=np.int64)
+            if session_ids is not None:
+                known = np.isin(chunk_sessions, session_ids)
+                if not known.all():
+                    raise ValueError(f"Bars reference unknown session {int(chunk_sessions[~known][0])}")
+            accumulator.add(equity[lo:lo + chunk_size], chunk_sessions)
+        return accumulator.result(risk_free_rate)
@@ -1,21 +1,36 @@
 from decimal import Decimal
-from typing import List
+from typing import Dict, List, Optional, Sequence, Union
 
+import numpy as np
+
+from ..instrumentation import NO_TIMINGS, StageTimings
 from ..models.performance import Performance
+from ..models.performance_record import PerformanceRecord
 from ..models.session_stats import SessionStats
+from ..models.session_frame import SessionFrame
+from ..models.fixed_frame import FixedPointFrame
 from ..models.position_session_stats import PositionSessionStats
+from .drawdown import DrawdownCalculator
 from .ratio import RatioCalculator
 
 
+TOP_CONTRIBUTION_CUT_POINTS = (1, 5, 10, 20)
+
+
 class PerformanceCalculator:
     """绩效计算器 - 计算账户和持仓绩效"""
 
+    # NumPy 实现与 Decimal 实现之间允许的相对误差
+    VECTORIZED_RTOL = 1e-9
+
     @staticmethod
     def compute_account_performance(
         session_stats: List[SessionStats],
         risk_free_rate: float,
+        timings: Optional[StageTimings] = None,
     ) -> Performance:
-        """计算账户绩效"""
+        """计算账户绩效，传入 timings 时记录各阶段耗时"""
+        clock = timings.start() if timings is not None else NO_TIMINGS
         if not session_stats:
             return PerformanceCalculator._empty_account_performance()
 
@@ -28,10 +43,13 @@ class PerformanceCalculator:
         initial_cash = session_stats[0].end_cash
         final_value = session_stats[-1].end_market_value
         total_commission = sum(s.total_commission for s in session_stats)
+        clock.mark(StageTimings.VALIDATION)
 
         equity_curve = []
         peak = initial_cash
         max_drawdown = Decimal("0")
+        underwater_bars = 0
+        max_drawdown_duration_bars = 0
 
         session_pnls = []
         for s in session_stats:
@@ -42,6 +60,13 @@ class PerformanceCalculator:
             drawdown = peak - equity
             if drawdown > max_drawdown:
                 max_drawdown = drawdown
+            if drawdown > 0:
+                underwater_bars += 1
+                if underwater_bars > max_drawdown_duration_bars:
+                    max_drawdown_duration_bars = underwater_bars
+            else:
+                underwater_bars = 0
+        clock.mark(StageTimings.EQUITY_DRAWDOWN)
 
         winning_trades = 0
         losing_trades = 0
@@ -74,7 +99,265 @@ class PerformanceCalculator:
                 losses.append(float(pnl))
                 if pnl < max_single_loss:
                     max_single_loss = pnl
+        clock.mark(StageTimings.PNL_CLASSIFICATION)
+
+        total_win_amount = float(total_win) if total_win > 0 else 0.0
+        total_loss_amount = float(abs(total_loss)) if total_loss < 0 else 0.0
+        top_win_contributions = PerformanceCalculator._calculate_top_contributions(wins, total_win_amount)
+        top_loss_contributions = PerformanceCalculator._calculate_top_contributions(losses, total_loss_amount, is_loss=True)
+        clock.mark(StageTimings.TOP_CONTRIBUTIONS)
+
+        sharpe_ratio = RatioCalculator.compute_sharpe_ratio(session_pnls, risk_free_rate, len(session_stats))
+        sortino_ratio = RatioCalculator.compute_sortino_ratio(session_pnls, risk_free_rate, len(session_stats))
+        clock.mark(StageTimings.RATIOS)
+
+        performance = PerformanceCalculator._assemble_account_performance(
+            initial_cash=initial_cash,
+            final_value=final_value,
+            total_commission=total_commission,
+            max_drawdown=max_drawdown,
+            winning_trades=winning_trades,
+            losing_trades=losing_trades,
+            total_win=total_win,
+            total_loss=total_loss,
+            max_single_win=max_single_win,
+            max_single_loss=max_single_loss,
+            sharpe_ratio=sharpe_ratio,
+            sortino_ratio=sortino_ratio,
+            top_win_contributions=top_win_contributions,
+            top_loss_contributions=top_loss_contributions,
+            open_positions=len(session_stats[-1].end_positions),
+            max_drawdown_duration_bars=max_drawdown_duration_bars,
+        )
+        clock.mark(StageTimings.MODEL_CONSTRUCTION)
+        return performance
 
+    @staticmethod
+    def compute_account_performance_vectorized(
+        session_stats: List[SessionStats],
+        risk_free_rate: float,
+        timings: Optional[StageTimings] = None,
+    ) -> Performance:
+        """计算账户绩效(NumPy 实现)，先转换为 SessionFrame 再按数组计算"""
+        clock = timings.start() if timings is not None else NO_TIMINGS
+        frame = SessionFrame.from_sessions(session_stats)
+        clock.mark(StageTimings.FRAME_CONVERSION)
+        return PerformanceCalculator.compute_frame_performance(frame, risk_free_rate, timings)
+
+    @staticmethod
+    def compute_account_performance_fixed(
+        session_stats: List[SessionStats],
+        risk_free_rate: float,
+        decimals: int = 2,
+        timings: Optional[StageTimings] = None,
+    ) -> Performance:
+        """计算账户绩效(定点整数实现)，先转换为 decimals 位小数的 FixedPointFrame"""
+        clock = timings.start() if timings is not None else NO_TIMINGS
+        frame = FixedPointFrame.from_sessions(session_stats, decimals)
+        clock.mark(StageTimings.FRAME_CONVERSION)
+        return PerformanceCalculator.compute_fixed_performance(frame, risk_free_rate, timings)
+
+    @staticmethod
+    def compute_frame_performance(
+        frame: SessionFrame,
+        risk_free_rate: float,
+        timings: Optional[StageTimings] = None,
+        as_record: bool = False,
+    ) -> Union[Performance, PerformanceRecord]:
+        """
+        基于列式 SessionFrame 按数组计算账户绩效。
+
+        金额以 float64 参与运算，与 Decimal 实现(compute_account_performance)
+        的相对误差不超过 VECTORIZED_RTOL，计数类字段完全一致。
+        as_record 为 True 时返回不经校验的 PerformanceRecord。
+        """
+        clock = timings.start() if timings is not None else NO_TIMINGS
+        if len(frame) == 0:
+            empty = PerformanceCalculator._empty_account_performance()
+            return PerformanceRecord.from_performance(empty) if as_record else empty
+
+        start_cash = frame.start_cash
+        equities = frame.end_market_value
+
+        funded = np.flatnonzero(start_cash > 0)
+        base_amount = float(start_cash[funded[0]]) if len(funded) else 0.0
+
+        initial_cash = float(frame.end_cash[0])
+        final_value = float(equities[-1])
+        total_commission = float(frame.commission.sum())
+        clock.mark(StageTimings.VALIDATION)
+
+        peak = np.maximum(np.maximum.accumulate(equities), initial_cash)
+        max_drawdown = max(float((peak - equities).max()), 0.0)
+        max_drawdown_duration_bars = DrawdownCalculator.longest_duration(equities - peak)
+        clock.mark(StageTimings.EQUITY_DRAWDOWN)
+
+        pnls = frame.pnl.astype(np.float64, copy=True)
+        pnls[0] = pnls[0] - base_amount + float(start_cash[0])
+
+        wins = pnls[pnls > 0]
+        losses = pnls[pnls < 0]
+
+        winning_trades = len(wins)
+        losing_trades = len(losses)
+        total_win = float(wins.sum())
+        total_loss = float(losses.sum())
+        max_single_win = float(wins.max()) if winning_trades else 0.0
+        max_single_loss = float(losses.min()) if losing_trades else 0.0
+        clock.mark(StageTimings.PNL_CLASSIFICATION)
+
+        mean_return = float(pnls.mean())
+        variance = float(np.mean((pnls - mean_return) ** 2))
+        downside_variance = float(np.mean(losses ** 2)) if losing_trades else 0.0
+
+        total_win_amount = total_win if total_win > 0 else 0.0
+        total_loss_amount = abs(total_loss) if total_loss < 0 else 0.0
+        top_win_contributions = PerformanceCalculator._calculate_top_contributions(wins, total_win_amount)
+        top_loss_contributions = PerformanceCalculator._calculate_top_contributions(losses, total_loss_amount, is_loss=True)
+        clock.mark(StageTimings.TOP_CONTRIBUTIONS)
+
+        sharpe_ratio = RatioCalculator.sharpe_from_moments(mean_return, variance, risk_free_rate)
+        sortino_ratio = (
+            RatioCalculator.sortino_from_moments(mean_return, downside_variance, risk_free_rate)
+            if losing_trades else 0.0
+        )
+        clock.mark(StageTimings.RATIOS)
+
+        to_decimal = SessionFrame.to_decimal
+        performance = PerformanceCalculator._assemble_account_performance(
+            initial_cash=to_decimal(initial_cash),
+            final_value=to_decimal(final_value),
+            total_commission=to_decimal(total_commission),
+            max_drawdown=to_decimal(max_drawdown),
+            winning_trades=winning_trades,
+            losing_trades=losing_trades,
+            total_win=to_decimal(total_win),
+            total_loss=to_decimal(total_loss),
+            max_single_win=to_decimal(max_single_win),
+            max_single_loss=to_decimal(max_single_loss),
+            sharpe_ratio=sharpe_ratio,
+            sortino_ratio=sortino_ratio,
+            top_win_contributions=top_win_contributions,
+            top_loss_contributions=top_loss_contributions,
+            open_positions=int(frame.position_offsets[-1] - frame.position_offsets[-2]),
+            max_drawdown_duration_bars=max_drawdown_duration_bars,
+            as_record=as_record,
+        )
+        clock.mark(StageTimings.MODEL_CONSTRUCTION)
+        return performance
+
+    @staticmethod
+    def compute_fixed_performance(
+        frame: FixedPointFrame,
+        risk_free_rate: float,
+        timings: Optional[StageTimings] = None,
+        as_record: bool = False,
+    ) -> Union[Performance, PerformanceRecord]:
+        """
+        基于定点整数 FixedPointFrame 计算账户绩效。
+
+        金额的求和、回撤和最大/最小值在 int64 上计算，与 Decimal 实现
+        (compute_account_performance)完全一致；只有夏普/索提诺和贡献度按浮点计算。
+        """
+        clock = timings.start() if timings is not None else NO_TIMINGS
+        if len(frame) == 0:
+            empty = PerformanceCalculator._empty_account_performance()
+            return PerformanceRecord.from_performance(empty) if as_record else empty
+
+        start_cash = frame.start_cash
+        equities = frame.end_market_value
+
+        funded = np.flatnonzero(start_cash > 0)
+        base_amount = int(start_cash[funded[0]]) if len(funded) else 0
+
+        initial_cash = int(frame.end_cash[0])
+        final_value = int(equities[-1])
+        total_commission = int(frame.commission.sum())
+        clock.mark(StageTimings.VALIDATION)
+
+        peak = np.maximum(np.maximum.accumulate(equities), initial_cash)
+        max_drawdown = max(int((peak - equities).max()), 0)
+        max_drawdown_duration_bars = DrawdownCalculator.longest_duration(equities - peak)
+        clock.mark(StageTimings.EQUITY_DRAWDOWN)
+
+        pnls = frame.pnl.copy()
+        pnls[0] = pnls[0] - base_amount + start_cash[0]
+
+        wins = pnls[pnls > 0]
+        losses = pnls[pnls < 0]
+
+        winning_trades = len(wins)
+        losing_trades = len(losses)
+        total_win = int(wins.sum())
+        total_loss = int(losses.sum())
+        max_single_win = int(wins.max()) if winning_trades else 0
+        max_single_loss = int(losses.min()) if losing_trades else 0
+        clock.mark(StageTimings.PNL_CLASSIFICATION)
+
+        scale = frame.scale
+        returns = pnls / scale
+        loss_returns = losses / scale
+        mean_return = (total_win + total_loss) / len(pnls) / scale
+        variance = float(np.mean((returns - mean_return) ** 2))
+        downside_variance = float(np.mean(loss_returns ** 2)) if losing_trades else 0.0
+
+        top_win_contributions = PerformanceCalculator._calculate_top_contributions(wins / scale, total_win / scale)
+        top_loss_contributions = PerformanceCalculator._calculate_top_contributions(
+            loss_returns, -total_loss / scale, is_loss=True
+        )
+        clock.mark(StageTimings.TOP_CONTRIBUTIONS)
+
+        sharpe_ratio = RatioCalculator.sharpe_from_moments(mean_return, variance, risk_free_rate)
+        sortino_ratio = (
+            RatioCalculator.sortino_from_moments(mean_return, downside_variance, risk_free_rate)
+            if losing_trades else 0.0
+        )
+        clock.mark(StageTimings.RATIOS)
+
+        to_decimal = frame.to_decimal
+        performance = PerformanceCalculator._assemble_account_performance(
+            initial_cash=to_decimal(initial_cash),
+            final_value=to_decimal(final_value),
+            total_commission=to_decimal(total_commission),
+            max_drawdown=to_decimal(max_drawdown),
+            winning_trades=winning_trades,
+            losing_trades=losing_trades,
+            total_win=to_decimal(total_win),
+            total_loss=to_decimal(total_loss),
+            max_single_win=to_decimal(max_single_win),
+            max_single_loss=to_decimal(max_single_loss),
+            sharpe_ratio=sharpe_ratio,
+            sortino_ratio=sortino_ratio,
+            top_win_contributions=top_win_contributions,
+            top_loss_contributions=top_loss_contributions,
+            open_positions=int(frame.open_positions[-1]),
+            max_drawdown_duration_bars=max_drawdown_duration_bars,
+            as_record=as_record,
+        )
+        clock.mark(StageTimings.MODEL_CONSTRUCTION)
+        return performance
+
+    @staticmethod
+    def _assemble_account_performance(
+        initial_cash: Decimal,
+        final_value: Decimal,
+        total_commission: Decimal,
+        max_drawdown: Decimal,
+        winning_trades: int,
+        losing_trades: int,
+        total_win: Decimal,
+        total_loss: Decimal,
+        max_single_win: Decimal,
+        max_single_loss: Decimal,
+        sharpe_ratio: float,
+        sortino_ratio: float,
+        top_win_contributions: List[float],
+        top_loss_contributions: List[float],
+        open_positions: int,
+        max_drawdown_duration_bars: int = 0,
+        as_record: bool = False,
+    ) -> Union[Performance, PerformanceRecord]:
+        """由累计量组装账户绩效，派生字段(胜率、均值、百分比、卡玛比率)统一在此计算"""
         total_trades = winning_trades + losing_trades
         win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0.0
         net_profit = final_value - initial_cash
@@ -92,24 +375,19 @@ class PerformanceCalculator:
         total_loss_val = abs(total_loss)
         commission_loss_pct = float(total_commission / total_loss_val * 100) if total_loss_val > 0 else 0.0
 
-        total_win_amount = float(total_win) if total_win > 0 else 0.0
-        total_loss_amount = float(abs(total_loss)) if total_loss < 0 else 0.0
-        top_win_contributions = PerformanceCalculator._calculate_top_contributions(wins, total_win_amount)
-        top_loss_contributions = PerformanceCalculator._calculate_top_contributions(losses, total_loss_amount, is_loss=True)
-
-        sharpe_ratio = RatioCalculator.compute_sharpe_ratio(session_pnls, risk_free_rate, len(session_stats))
-        sortino_ratio = RatioCalculator.compute_sortino_ratio(session_pnls, risk_free_rate, len(session_stats))
         calmar_ratio = RatioCalculator.compute_calmar_ratio(net_profit, max_drawdown)
 
-        return Performance(
+        result_type = PerformanceRecord if as_record else Performance
+        return result_type(
             total_trades=total_trades,
-            open_positions=len(session_stats[-1].end_positions),
+            open_positions=open_positions,
             winning_trades=winning_trades,
             losing_trades=losing_trades,
             win_rate=win_rate,
             net_profit=net_profit,
             net_profit_pct=net_profit_pct,
             max_drawdown=max_drawdown,
+            max_drawdown_duration_bars=max_drawdown_duration_bars,
             sharpe_ratio=sharpe_ratio,
             final_value=final_value,
             initial_cash=initial_cash,
@@ -139,28 +417,41 @@ class PerformanceCalculator:
         )
 
     @staticmethod
-    def _calculate_top_contributions(values: List[float], total: float, is_loss: bool = False) -> List[float]:
-        if not values or total == 0:
-            return [0.0, 0.0, 0.0, 0.0]
+    def compute_top_contributions(
+        values: Union[Sequence[float], np.ndarray],
+        total: float,
+        cut_points: Sequence[float] = TOP_CONTRIBUTION_CUT_POINTS,
+        is_loss: bool = False,
+    ) -> List[float]:
+        """
+        计算前 N% 笔盈利(或亏损)对总盈利(或总亏损)的贡献占比。
+
+        只对最大的 k 个值(k 由最大的分位点决定)做一次 np.partition 选择，
+        再排序这 k 个值并用累计和得到各分位点的结果，无需对全部值排序。
+        """
+        for n_pct in cut_points:
+            if not 0 < n_pct <= 100:
+                raise ValueError(f"Cut point must be in (0, 100], got {n_pct}")
+
+        arr = np.asarray(values, dtype=np.float64)
+        count = len(arr)
+        if count == 0 or total == 0:
+            return [0.0 for _ in cut_points]
 
         if is_loss:
-            sorted_values = sorted(values, reverse=False)
-        else:
-            sorted_values = sorted(values, reverse=True)
-
-        def calc_contribution_pct(n_pct: float) -> float:
-            n = max(1, int(len(sorted_values) * n_pct / 100))
-            top_n_sum = sum(sorted_values[:n])
-            if is_loss:
-                top_n_sum = abs(top_n_sum)
-            return (top_n_sum / total * 100) if total != 0 else 0.0
-
-        return [
-            calc_contribution_pct(1),
-            calc_contribution_pct(5),
-            calc_contribution_pct(10),
-            calc_contribution_pct(20),
-        ]
+            arr = -arr
+
+        ks = [max(1, int(count * n_pct / 100)) for n_pct in cut_points]
+        k_max = max(ks)
+        if k_max < count:
+            arr = np.partition(arr, count - k_max)[count - k_max:]
+        top_sums = np.cumsum(np.sort(arr)[::-1])
+
+        return [abs(float(top_sums[k - 1])) / total * 100 for k in ks]
+
+    @staticmethod
+    def _calculate_top_contributions(values: List[float], total: float, is_loss: bool = False) -> List[float]:
+        return PerformanceCalculator.compute_top_contributions(values, total, is_loss=is_loss)
 
     @staticmethod
     def compute_position_performance(
@@ -232,6 +523,148 @@ class PerformanceCalculator:
         if total_trades == 0:
             return PerformanceCalculator._empty_position_performance(symbol)
 
+        sharpe_ratio = RatioCalculator.compute_sharpe_ratio(session_pnls, risk_free_rate, len(sessions))
+        sortino_ratio = RatioCalculator.compute_sortino_ratio(session_pnls, risk_free_rate, len(sessions))
+
+        return PerformanceCalculator._assemble_position_performance(
+            symbol=symbol,
+            initial_cash=initial_cash,
+            final_value=final_value,
+            total_commission=total_commission,
+            max_drawdown=max_drawdown,
+            winning_trades=winning_trades,
+            losing_trades=losing_trades,
+            total_win=total_win,
+            total_loss=total_loss,
+            max_single_win=max_single_win,
+            max_single_loss=max_single_loss,
+            sharpe_ratio=sharpe_ratio,
+            sortino_ratio=sortino_ratio,
+        )
+
+    @staticmethod
+    def index_positions(session_stats: List[SessionStats]) -> Dict[str, dict]:
+        """建立 symbol -> {session: {"end_positions": [...]}} 索引，格式与 compute_position_performance 的输入一致"""
+        index: Dict[str, dict] = {}
+        for s in session_stats:
+            for pos in s.end_positions:
+                by_session = index.setdefault(pos.symbol, {})
+                if s.session not in by_session:
+                    by_session[s.session] = {"end_positions": [pos]}
+        return index
+
+    @staticmethod
+    def compute_all_position_performance(
+        frame: SessionFrame,
+        risk_free_rate: float,
+    ) -> Dict[str, Performance]:
+        """
+        一次分组计算所有标的的持仓绩效。
+
+        基于 SessionFrame 的持仓表按 (标的, 交易日) 排序后分组聚合，
+        每个标的每个交易日取第一条持仓，语义与逐个调用
+        compute_position_performance 一致(金额误差不超过 VECTORIZED_RTOL)。
+        """
+        num_rows = len(frame.position_symbol)
+        if num_rows == 0:
+            return {}
+
+        row_session = np.repeat(frame.session, frame.position_counts)
+        order = np.lexsort((np.arange(num_rows), row_session, frame.position_symbol))
+        symbol_codes = frame.position_symbol[order]
+        row_session = row_session[order]
+
+        first_in_session = np.ones(num_rows, dtype=bool)
+        first_in_session[1:] = (symbol_codes[1:] != symbol_codes[:-1]) | (row_session[1:] != row_session[:-1])
+        order = order[first_in_session]
+        symbol_codes = symbol_codes[first_in_session]
+
+        pnls = frame.position_realized_profit[order]
+        end_values = frame.position_end_value[order]
+        start_values = frame.position_start_value[order]
+        commissions = frame.position_commission[order]
+
+        num_rows = len(order)
+        starts = np.flatnonzero(np.r_[True, symbol_codes[1:] != symbol_codes[:-1]])
+        ends = np.r_[starts[1:], num_rows]
+        counts = ends - starts
+
+        is_win = pnls > 0
+        is_loss = pnls < 0
+        winning_trades = np.add.reduceat(is_win.astype(np.int64), starts)
+        losing_trades = np.add.reduceat(is_loss.astype(np.int64), starts)
+        total_win = np.add.reduceat(np.where(is_win, pnls, 0.0), starts)
+        total_loss = np.add.reduceat(np.where(is_loss, pnls, 0.0), starts)
+        max_single_win = np.maximum.reduceat(np.where(is_win, pnls, 0.0), starts)
+        max_single_loss = np.minimum.reduceat(np.where(is_loss, pnls, 0.0), starts)
+        total_commission = np.add.reduceat(commissions, starts)
+        final_value = end_values[ends - 1]
+
+        first_funded = np.minimum.reduceat(np.where(start_values != 0, np.arange(num_rows), num_rows), starts)
+        initial_cash = np.where(first_funded < ends, start_values[np.minimum(first_funded, num_rows - 1)], 0.0)
+
+        group_ids = np.repeat(np.arange(len(starts)), counts)
+        mean_return = np.add.reduceat(pnls, starts) / counts
+        variance = np.add.reduceat((pnls - mean_return[group_ids]) ** 2, starts) / counts
+        downside_sumsq = np.add.reduceat(np.where(is_loss, pnls * pnls, 0.0), starts)
+
+        to_decimal = SessionFrame.to_decimal
+        results: Dict[str, Performance] = {}
+        for g in np.argsort([frame.symbols[c] for c in symbol_codes[starts]], kind="stable"):
+            symbol = frame.symbols[symbol_codes[starts[g]]]
+            wins = int(winning_trades[g])
+            losses = int(losing_trades[g])
+            if wins + losses == 0:
+                results[symbol] = PerformanceCalculator._empty_position_performance(symbol)
+                continue
+
+            values = end_values[starts[g]:ends[g]]
+            peak = np.maximum(np.maximum.accumulate(values), 0.0)
+            max_drawdown = max(float((peak - values).max()), 0.0)
+
+            mean = float(mean_return[g])
+            sortino_ratio = (
+                RatioCalculator.sortino_from_moments(mean, float(downside_sumsq[g]) / losses, risk_free_rate)
+                if losses else 0.0
+            )
+
+            results[symbol] = PerformanceCalculator._assemble_position_performance(
+                symbol=symbol,
+                initial_cash=to_decimal(initial_cash[g]),
+                final_value=to_decimal(final_value[g]),
+                total_commission=to_decimal(total_commission[g]),
+                max_drawdown=to_decimal(max_drawdown),
+                winning_trades=wins,
+                losing_trades=losses,
+                total_win=to_decimal(total_win[g]),
+                total_loss=to_decimal(total_loss[g]),
+                max_single_win=to_decimal(max_single_win[g]),
+                max_single_loss=to_decimal(max_single_loss[g]),
+                sharpe_ratio=RatioCalculator.sharpe_from_moments(mean, float(variance[g]), risk_free_rate),
+                sortino_ratio=sortino_ratio,
+            )
+
+        return results
+
+    @staticmethod
+    def _assemble_position_performance(
+        symbol: str,
+        initial_cash: Decimal,
+        final_value: Decimal,
+        total_commission: Decimal,
+        max_drawdown: Decimal,
+        winning_trades: int,
+        losing_trades: int,
+        total_win: Decimal,
+        total_loss: Decimal,
+        max_single_win: Decimal,
+        max_single_loss: Decimal,
+        sharpe_ratio: float,
+        sortino_ratio: float,
+    ) -> Performance:
+        """由累计量组装持仓绩效"""
+        total_trades = winning_trades + losing_trades
+
         win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0.0
         net_profit = final_value - initial_cash
         net_profit_pct = float(net_profit / initial_cash * 100) if initial_cash != 0 else 0.0
@@ -248,8 +681,6 @@ class PerformanceCalculator:
         total_loss_val = abs(total_loss)
         commission_loss_pct = float(total_commission / total_loss_val * 100) if total_loss_val > 0 else 0.0
 
-        sharpe_ratio = RatioCalculator.compute_sharpe_ratio(session_pnls, risk_free_rate, len(sessions))
-        sortino_ratio = RatioCalculator.compute_sortino_ratio(session_pnls, risk_free_rate, len(sessions))
         calmar_ratio = RatioCalculator.compute_calmar_ratio(net_profit, max_drawdown)
 
         return Performance(
@@ -0,0 +1,157 @@
+import math
+from typing import List, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from ..models.drawdown_analysis import DrawdownAnalysis
+from ..models.fixed_frame import FixedPointFrame
+from ..models.session_frame import SessionFrame
+
+
+class DrawdownSegment(NamedTuple):
+    """
+    一段权益序列的回撤摘要：最高点、最低点、段内最大回撤。
+
+    combine 满足结合律，可用于滑动窗口、线段树和分块合并。
+    """
+
+    peak: float
+    trough: float
+    max_drawdown: float
+
+    @staticmethod
+    def of(value: float) -> "DrawdownSegment":
+        return DrawdownSegment(value, value, 0.0)
+
+    def combine(self, other: "DrawdownSegment") -> "DrawdownSegment":
+        """拼接两段(self 在前)"""
+        return DrawdownSegment(
+            max(self.peak, other.peak),
+            min(self.trough, other.trough),
+            max(self.max_drawdown, other.max_drawdown, self.peak - other.trough),
+        )
+
+    def drawdown_from(self, initial_peak: float) -> float:
+        """以 initial_peak 为起始峰值时该段的最大回撤"""
+        return max(self.max_drawdown, initial_peak - self.trough, 0.0)
+
+
+EMPTY_SEGMENT = DrawdownSegment(-math.inf, math.inf, 0.0)
+
+
+class SlidingDrawdown:
+    """滑动窗口最大回撤(双栈队列)，push/pop/query 均摊 O(1)"""
+
+    def __init__(self):
+        self._front: List[DrawdownSegment] = []
+        self._back: List[float] = []
+        self._back_segment = EMPTY_SEGMENT
+
+    def __len__(self) -> int:
+        return len(self._front) + len(self._back)
+
+    def push(self, value: float):
+        self._back.append(value)
+        self._back_segment = self._back_segment.combine(DrawdownSegment.of(value))
+
+    def pop(self):
+        if not self._front:
+            segment = EMPTY_SEGMENT
+            for value in reversed(self._back):
+                segment = DrawdownSegment.of(value).combine(segment)
+                self._front.append(segment)
+            self._back = []
+            self._back_segment = EMPTY_SEGMENT
+        self._front.pop()
+
+    def query(self) -> DrawdownSegment:
+        front = self._front[-1] if self._front else EMPTY_SEGMENT
+        return front.combine(self._back_segment)
+
+
+class DrawdownCalculator:
+    """
+    回撤分析：水下曲线、逐次回撤(峰值、最低点、收复)及持续时间。
+
+    峰值从期初资金开始，与 max_drawdown 的口径一致。权益低于此前峰值的交易日处于水下，
+    一次回撤为连续的水下交易日，持续时间为其交易日数。全部计算为单次线性的数组运算。
+    """
+
+    @staticmethod
+    def underwater(equities: np.ndarray, initial_peak: Union[float, int]) -> np.ndarray:
+        """权益减去此前最高权益(含 initial_peak)，不大于 0；整数输入保持整数"""
+        equities = np.asarray(equities)
+        return equities - np.maximum(np.maximum.accumulate(equities), initial_peak)
+
+    @staticmethod
+    def episode_bounds(underwater: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """各次回撤的 [start, end) 位置：start 为第一个水下交易日，end 为收复交易日(未收复时为长度)"""
+        mask = np.zeros(len(underwater) + 2, dtype=np.int8)
+        mask[1:-1] = underwater < 0
+        edges = np.diff(mask)
+        return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+    @staticmethod
+    def longest_duration(underwater: np.ndarray) -> int:
+        """水下曲线中最长连续水下交易日数"""
+        start, end = DrawdownCalculator.episode_bounds(underwater)
+        return int((end - start).max()) if len(start) else 0
+
+    @staticmethod
+    def max_duration(equities: np.ndarray, initial_peak: Union[float, int]) -> int:
+        """最长连续水下交易日数(Performance.max_drawdown_duration_bars)"""
+        return DrawdownCalculator.longest_duration(DrawdownCalculator.underwater(equities, initial_peak))
+
+    @staticmethod
+    def analyze(
+        session: np.ndarray,
+        equities: np.ndarray,
+        initial_peak: Union[float, int],
+    ) -> DrawdownAnalysis:
+        """逐次回撤分析，session 与 equities 一一对应"""
+        session = np.asarray(session, dtype=np.int64)
+        underwater = DrawdownCalculator.underwater(equities, initial_peak)
+        start, end = DrawdownCalculator.episode_bounds(underwater)
+        n = len(underwater)
+
+        if len(start):
+            # reduceat 的区间 [start_i, start_{i+1}) 在水下段之后只含 0，不影响最小值
+            lowest = np.minimum.reduceat(underwater, start)
+            opened = np.zeros(n, dtype=np.int64)
+            opened[start] = 1
+            owner = np.maximum(np.cumsum(opened) - 1, 0)
+            positions = np.where(underwater == lowest[owner], np.arange(n), n)
+            trough = np.minimum.reduceat(positions, start)
+            depth = -lowest
+            peak_value = np.asarray(equities)[trough] - underwater[trough]
+        else:
+            trough = start.copy()
+            depth = underwater[:0]
+            peak_value = underwater[:0]
+
+        return DrawdownAnalysis(
+            session=session,
+            underwater=underwater,
+            start=start,
+            trough=trough,
+            end=end,
+            peak_value=peak_value,
+            depth=depth,
+        )
+
+    @staticmethod
+    def analyze_frame(frame: Union[SessionFrame, FixedPointFrame]) -> DrawdownAnalysis:
+        """
+        对 SessionFrame 或 FixedPointFrame 的账户权益做回撤分析。
+
+        FixedPointFrame 在最小单位的整数上划分回撤，金额再按 decimals 换算回货币单位。
+        """
+        if len(frame) == 0:
+            empty = np.zeros(0)
+            return DrawdownCalculator.analyze(frame.session, empty, 0.0)
+        if isinstance(frame, FixedPointFrame):
+            analysis = DrawdownCalculator.analyze(frame.session, frame.end_market_value, int(frame.end_cash[0]))
+            for name in ("underwater", "peak_value", "depth"):
+                setattr(analysis, name, getattr(analysis, name) / frame.scale)
+            return analysis
+        return DrawdownCalculator.analyze(frame.session, frame.end_market_value, float(frame.end_cash[0]))
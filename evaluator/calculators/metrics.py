@@ -0,0 +1,325 @@
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from ..models.session_frame import SessionFrame
+from .calculator import PerformanceCalculator, TOP_CONTRIBUTION_CUT_POINTS
+from .drawdown import DrawdownCalculator
+from .ratio import RatioCalculator
+
+
+class Metric(NamedTuple):
+    """已注册的指标：名称、依赖的指标名和计算函数(按依赖顺序接收参数)"""
+
+    name: str
+    depends: Tuple[str, ...]
+    compute: Callable[..., Any]
+
+
+class MetricRegistry:
+    """
+    带依赖声明的指标注册表。
+
+    每个指标声明其依赖(其他指标或中间量的名称)，compute 只计算所请求指标的
+    依赖闭包，按拓扑顺序逐个求值，共享的中间量只计算一次。
+
+    SOURCES 为计算入口提供的输入：frame(SessionFrame)和 risk_free_rate。
+    内置指标与 compute_frame_performance 的同名 Performance 字段结果一致；
+    第三方可用 register 注册新指标，与内置指标在同一次计算中求值。
+    """
+
+    SOURCES = ("frame", "risk_free_rate")
+
+    def __init__(self, metrics: Iterable[Metric] = ()):
+        self._metrics: Dict[str, Metric] = {m.name: m for m in metrics}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._metrics
+
+    def __iter__(self):
+        return iter(self._metrics)
+
+    def __len__(self) -> int:
+        return len(self._metrics)
+
+    def copy(self) -> "MetricRegistry":
+        """复制注册表(在副本上注册不影响原注册表)"""
+        return MetricRegistry(self._metrics.values())
+
+    def register(self, name: str, depends: Sequence[str] = (), replace: bool = False):
+        """
+        注册指标的装饰器：
+
+            @registry.register("profit_factor", ("total_win", "total_loss"))
+            def profit_factor(total_win, total_loss): ...
+
+        同名指标已存在时抛出 ValueError，replace=True 时覆盖。
+        """
+        if name in self.SOURCES or (name in self._metrics and not replace):
+            raise ValueError(f"Metric {name!r} is already registered")
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            self._metrics[name] = Metric(name, tuple(depends), func)
+            return func
+
+        return decorator
+
+    def resolve(self, names: Sequence[str]) -> List[str]:
+        """所请求指标的依赖闭包(拓扑顺序，不含输入)，未知指标抛出 KeyError，循环依赖抛出 ValueError"""
+        order: List[str] = []
+        state: Dict[str, bool] = {}  # False: 正在访问，True: 已完成
+
+        def visit(name: str, path: Tuple[str, ...]):
+            if name in self.SOURCES or state.get(name):
+                return
+            if name in state:
+                raise ValueError(f"Metric dependency cycle: {' -> '.join(path + (name,))}")
+            metric = self._metrics.get(name)
+            if metric is None:
+                raise KeyError(f"Unknown metric {name!r}")
+            state[name] = False
+            for dependency in metric.depends:
+                visit(dependency, path + (name,))
+            state[name] = True
+            order.append(name)
+
+        for name in names:
+            visit(name, ())
+        return order
+
+    def compute(
+        self,
+        frame: SessionFrame,
+        names: Sequence[str],
+        risk_free_rate: float,
+    ) -> Dict[str, Any]:
+        """
+        计算所请求的指标，返回 {名称: 值}(按请求顺序)。
+
+        空序列时 Performance 字段取空绩效的默认值，其他指标为 None。
+        """
+        order = self.resolve(names)
+        if len(frame) == 0:
+            empty = PerformanceCalculator._empty_account_performance()
+            return {name: getattr(empty, name, None) for name in names}
+
+        values: Dict[str, Any] = {"frame": frame, "risk_free_rate": risk_free_rate}
+        for name in order:
+            metric = self._metrics[name]
+            values[name] = metric.compute(*(values[d] for d in metric.depends))
+        return {name: values[name] for name in names}
+
+
+METRICS = MetricRegistry()
+"""内置指标注册表，PerformanceEvaluator 默认使用"""
+
+_to_decimal = SessionFrame.to_decimal
+
+
+# 中间量
+
+@METRICS.register("base_amount", ("frame",))
+def _base_amount(frame: SessionFrame) -> float:
+    funded = np.flatnonzero(frame.start_cash > 0)
+    return float(frame.start_cash[funded[0]]) if len(funded) else 0.0
+
+
+@METRICS.register("pnls", ("frame", "base_amount"))
+def _pnls(frame: SessionFrame, base_amount: float) -> np.ndarray:
+    pnls = frame.pnl.astype(np.float64, copy=True)
+    pnls[0] = pnls[0] - base_amount + float(frame.start_cash[0])
+    return pnls
+
+
+@METRICS.register("wins", ("pnls",))
+def _wins(pnls: np.ndarray) -> np.ndarray:
+    return pnls[pnls > 0]
+
+
+@METRICS.register("losses", ("pnls",))
+def _losses(pnls: np.ndarray) -> np.ndarray:
+    return pnls[pnls < 0]
+
+
+@METRICS.register("mean_return", ("pnls",))
+def _mean_return(pnls: np.ndarray) -> float:
+    return float(pnls.mean())
+
+
+@METRICS.register("variance", ("pnls", "mean_return"))
+def _variance(pnls: np.ndarray, mean_return: float) -> float:
+    return float(np.mean((pnls - mean_return) ** 2))
+
+
+@METRICS.register("downside_variance", ("losses",))
+def _downside_variance(losses: np.ndarray) -> float:
+    return float(np.mean(losses ** 2)) if len(losses) else 0.0
+
+
+@METRICS.register("top_win_contributions", ("wins",))
+def _top_win_contributions(wins: np.ndarray) -> List[float]:
+    total = float(wins.sum())
+    return PerformanceCalculator.compute_top_contributions(wins, total if total > 0 else 0.0)
+
+
+@METRICS.register("top_loss_contributions", ("losses",))
+def _top_loss_contributions(losses: np.ndarray) -> List[float]:
+    total = float(losses.sum())
+    return PerformanceCalculator.compute_top_contributions(losses, abs(total) if total < 0 else 0.0, is_loss=True)
+
+
+# Performance 字段
+
+@METRICS.register("initial_cash", ("frame",))
+def _initial_cash(frame: SessionFrame) -> Decimal:
+    return _to_decimal(frame.end_cash[0])
+
+
+@METRICS.register("final_value", ("frame",))
+def _final_value(frame: SessionFrame) -> Decimal:
+    return _to_decimal(frame.end_market_value[-1])
+
+
+@METRICS.register("total_commission", ("frame",))
+def _total_commission(frame: SessionFrame) -> Decimal:
+    return _to_decimal(frame.commission.sum())
+
+
+@METRICS.register("open_positions", ("frame",))
+def _open_positions(frame: SessionFrame) -> int:
+    return int(frame.position_offsets[-1] - frame.position_offsets[-2])
+
+
+@METRICS.register("max_drawdown", ("frame",))
+def _max_drawdown(frame: SessionFrame) -> Decimal:
+    equities = frame.end_market_value
+    peak = np.maximum(np.maximum.accumulate(equities), float(frame.end_cash[0]))
+    return _to_decimal(max(float((peak - equities).max()), 0.0))
+
+
+@METRICS.register("max_drawdown_duration_bars", ("frame",))
+def _max_drawdown_duration_bars(frame: SessionFrame) -> int:
+    return DrawdownCalculator.max_duration(frame.end_market_value, float(frame.end_cash[0]))
+
+
+@METRICS.register("winning_trades", ("wins",))
+def _winning_trades(wins: np.ndarray) -> int:
+    return len(wins)
+
+
+@METRICS.register("losing_trades", ("losses",))
+def _losing_trades(losses: np.ndarray) -> int:
+    return len(losses)
+
+
+@METRICS.register("total_trades", ("winning_trades", "losing_trades"))
+def _total_trades(winning_trades: int, losing_trades: int) -> int:
+    return winning_trades + losing_trades
+
+
+@METRICS.register("win_rate", ("winning_trades", "total_trades"))
+def _win_rate(winning_trades: int, total_trades: int) -> float:
+    return (winning_trades / total_trades * 100) if total_trades > 0 else 0.0
+
+
+@METRICS.register("total_win", ("wins",))
+def _total_win(wins: np.ndarray) -> Decimal:
+    return _to_decimal(wins.sum())
+
+
+@METRICS.register("total_loss", ("losses",))
+def _total_loss(losses: np.ndarray) -> Decimal:
+    return _to_decimal(losses.sum())
+
+
+@METRICS.register("max_single_win", ("wins",))
+def _max_single_win(wins: np.ndarray) -> Decimal:
+    return _to_decimal(wins.max() if len(wins) else 0.0)
+
+
+@METRICS.register("max_single_loss", ("losses",))
+def _max_single_loss(losses: np.ndarray) -> Decimal:
+    return _to_decimal(losses.min() if len(losses) else 0.0)
+
+
+@METRICS.register("net_profit", ("final_value", "initial_cash"))
+def _net_profit(final_value: Decimal, initial_cash: Decimal) -> Decimal:
+    return final_value - initial_cash
+
+
+@METRICS.register("net_profit_pct", ("net_profit", "initial_cash"))
+def _net_profit_pct(net_profit: Decimal, initial_cash: Decimal) -> float:
+    return _pct(net_profit, initial_cash)
+
+
+@METRICS.register("avg_win", ("total_win", "winning_trades"))
+def _avg_win(total_win: Decimal, winning_trades: int) -> Decimal:
+    return total_win / winning_trades if winning_trades > 0 else Decimal("0")
+
+
+@METRICS.register("avg_loss", ("total_loss", "losing_trades"))
+def _avg_loss(total_loss: Decimal, losing_trades: int) -> Decimal:
+    return total_loss / losing_trades if losing_trades > 0 else Decimal("0")
+
+
+@METRICS.register("avg_win_pct", ("avg_win", "initial_cash"))
+def _avg_win_pct(avg_win: Decimal, initial_cash: Decimal) -> float:
+    return _pct(avg_win, initial_cash)
+
+
+@METRICS.register("avg_loss_pct", ("avg_loss", "initial_cash"))
+def _avg_loss_pct(avg_loss: Decimal, initial_cash: Decimal) -> float:
+    return _pct(avg_loss, initial_cash)
+
+
+@METRICS.register("odds_ratio", ("avg_win", "avg_loss"))
+def _odds_ratio(avg_win: Decimal, avg_loss: Decimal) -> float:
+    return float(avg_win / avg_loss) if avg_loss != 0 else 0.0
+
+
+@METRICS.register("max_single_win_pct", ("max_single_win", "initial_cash"))
+def _max_single_win_pct(max_single_win: Decimal, initial_cash: Decimal) -> float:
+    return _pct(max_single_win, initial_cash)
+
+
+@METRICS.register("max_single_loss_pct", ("max_single_loss", "initial_cash"))
+def _max_single_loss_pct(max_single_loss: Decimal, initial_cash: Decimal) -> float:
+    return _pct(max_single_loss, initial_cash)
+
+
+@METRICS.register("commission_loss_pct", ("total_commission", "total_loss"))
+def _commission_loss_pct(total_commission: Decimal, total_loss: Decimal) -> float:
+    return _pct(total_commission, abs(total_loss)) if total_loss != 0 else 0.0
+
+
+@METRICS.register("sharpe_ratio", ("mean_return", "variance", "risk_free_rate"))
+def _sharpe_ratio(mean_return: float, variance: float, risk_free_rate: float) -> float:
+    return RatioCalculator.sharpe_from_moments(mean_return, variance, risk_free_rate)
+
+
+@METRICS.register("sortino_ratio", ("mean_return", "downside_variance", "losing_trades", "risk_free_rate"))
+def _sortino_ratio(mean_return: float, downside_variance: float, losing_trades: int, risk_free_rate: float) -> float:
+    if not losing_trades:
+        return 0.0
+    return RatioCalculator.sortino_from_moments(mean_return, downside_variance, risk_free_rate)
+
+
+@METRICS.register("calmar_ratio", ("net_profit", "max_drawdown"))
+def _calmar_ratio(net_profit: Decimal, max_drawdown: Decimal) -> float:
+    return RatioCalculator.compute_calmar_ratio(net_profit, max_drawdown)
+
+
+def _register_top_contributions():
+    for i, n_pct in enumerate(TOP_CONTRIBUTION_CUT_POINTS):
+        for kind in ("win", "loss"):
+            METRICS.register(f"top_{n_pct}pct_{kind}_pct", (f"top_{kind}_contributions",))(
+                lambda contributions, i=i: contributions[i]
+            )
+
+
+_register_top_contributions()
+
+
+def _pct(value: Decimal, base: Decimal) -> float:
+    return float(value / base * 100) if base != 0 else 0.0
@@ -19,22 +19,9 @@ class RatioCalculator:
             return 0.0
 
         mean_return = sum(returns) / len(returns)
-        if mean_return == 0:
-            return 0.0
-
         variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-        std_dev = math.sqrt(variance)
-
-        if std_dev == 0:
-            return 0.0
 
-        annual_rf = risk_free_rate
-        period_rf = annual_rf / RatioCalculator.PERIODS_PER_YEAR
-
-        excess_return = mean_return - period_rf
-        annualized_excess = excess_return * math.sqrt(RatioCalculator.PERIODS_PER_YEAR)
-
-        return annualized_excess / (std_dev * math.sqrt(RatioCalculator.PERIODS_PER_YEAR))
+        return RatioCalculator.sharpe_from_moments(mean_return, variance, risk_free_rate)
 
     @staticmethod
     def compute_sortino_ratio(
@@ -46,25 +33,15 @@ class RatioCalculator:
         if not returns or num_periods == 0:
             return 0.0
 
-        annual_rf = risk_free_rate
-        period_rf = annual_rf / RatioCalculator.PERIODS_PER_YEAR
-
         mean_return = sum(returns) / len(returns)
-        excess_return = mean_return - period_rf
 
         downside_returns = [r for r in returns if r < 0]
         if not downside_returns:
             return 0.0
 
         downside_variance = sum(r ** 2 for r in downside_returns) / len(downside_returns)
-        downside_std = math.sqrt(downside_variance)
-
-        if downside_std == 0:
-            return 0.0
 
-        annualized_excess = excess_return * math.sqrt(RatioCalculator.PERIODS_PER_YEAR)
-
-        return annualized_excess / (downside_std * math.sqrt(RatioCalculator.PERIODS_PER_YEAR))
+        return RatioCalculator.sortino_from_moments(mean_return, downside_variance, risk_free_rate)
 
     @staticmethod
     def compute_calmar_ratio(
@@ -76,3 +53,42 @@ class RatioCalculator:
             return 0.0
 
         return float(net_profit / max_drawdown)
+
+    @staticmethod
+    def sharpe_from_moments(
+        mean_return: float,
+        variance: float,
+        risk_free_rate: float,
+    ) -> float:
+        """由收益均值和(总体)方差计算夏普比率"""
+        if mean_return == 0:
+            return 0.0
+
+        std_dev = math.sqrt(variance) if variance > 0 else 0.0
+        if std_dev == 0:
+            return 0.0
+
+        period_rf = risk_free_rate / RatioCalculator.PERIODS_PER_YEAR
+
+        excess_return = mean_return - period_rf
+        annualized_excess = excess_return * math.sqrt(RatioCalculator.PERIODS_PER_YEAR)
+
+        return annualized_excess / (std_dev * math.sqrt(RatioCalculator.PERIODS_PER_YEAR))
+
+    @staticmethod
+    def sortino_from_moments(
+        mean_return: float,
+        downside_variance: float,
+        risk_free_rate: float,
+    ) -> float:
+        """由收益均值和下行方差(负收益平方均值)计算索提诺比率"""
+        downside_std = math.sqrt(downside_variance) if downside_variance > 0 else 0.0
+        if downside_std == 0:
+            return 0.0
+
+        period_rf = risk_free_rate / RatioCalculator.PERIODS_PER_YEAR
+
+        excess_return = mean_return - period_rf
+        annualized_excess = excess_return * math.sqrt(RatioCalculator.PERIODS_PER_YEAR)
+
+        return annualized_excess / (downside_std * math.sqrt(RatioCalculator.PERIODS_PER_YEAR))
@@ -0,0 +1,157 @@
+import math
+from typing import Optional
+
+import numpy as np
+
+from ..models.rolling_metrics import RollingMetrics
+from ..models.session_frame import SessionFrame
+from .drawdown import SlidingDrawdown
+from .ratio import RatioCalculator
+
+
+class RollingCalculator:
+    """
+    滚动窗口指标计算器。
+
+    每个窗口的结果与对该窗口切片调用 compute_account_performance 一致
+    (包括窗口首日的盈亏调整)。收益统计量由前缀和做差得到，回撤用双栈队列
+    滑动维护，整体为 O(n)，与窗口长度无关。
+    """
+
+    # 方差相对于二阶矩低于该比例时视为 0(窗口求和的舍入误差)
+    VARIANCE_RTOL = 1e-10
+
+    @staticmethod
+    def compute_rolling_metrics(
+        frame: SessionFrame,
+        window: int,
+        risk_free_rate: float,
+        min_periods: Optional[int] = None,
+    ) -> RollingMetrics:
+        """计算以每个交易日结尾的滚动窗口指标"""
+        if window < 1:
+            raise ValueError(f"window must be positive, got {window}")
+        if min_periods is None:
+            min_periods = window
+        if not 1 <= min_periods <= window:
+            raise ValueError(f"min_periods must be in [1, {window}], got {min_periods}")
+
+        n = len(frame)
+        ends = np.arange(n)
+        starts = np.maximum(ends - window + 1, 0)
+        counts = (ends - starts + 1).astype(np.float64)
+
+        pnls = frame.pnl.astype(np.float64, copy=False)
+        start_cash = frame.start_cash
+
+        # 窗口首日盈亏按窗口内第一个有期初现金的交易日调整
+        funded = np.where(start_cash > 0, ends, n)
+        next_funded = np.minimum.accumulate(funded[::-1])[::-1] if n else funded
+        first_funded = next_funded[starts]
+        base_amount = np.where(
+            first_funded <= ends,
+            start_cash[np.minimum(first_funded, max(n - 1, 0))],
+            0.0,
+        )
+        raw_first = pnls[starts]
+        adj_first = raw_first - base_amount + start_cash[starts]
+
+        # 以整体均值为中心求和，减小方差计算中的抵消误差
+        center = float(pnls.mean()) if n else 0.0
+        centered = pnls - center
+        sum_1 = _window_sum(centered, window)
+        sum_2 = _window_sum(centered * centered, window)
+        wins = _window_sum((pnls > 0).astype(np.float64), window)
+        losses = _window_sum((pnls < 0).astype(np.float64), window)
+        downside_sumsq = _window_sum(np.where(pnls < 0, pnls * pnls, 0.0), window)
+
+        sum_1 += adj_first - raw_first
+        sum_2 += (adj_first - center) ** 2 - (raw_first - center) ** 2
+        wins += (adj_first > 0).astype(np.float64) - (raw_first > 0)
+        losses += (adj_first < 0).astype(np.float64) - (raw_first < 0)
+        downside_sumsq += np.where(adj_first < 0, adj_first * adj_first, 0.0)
+        downside_sumsq -= np.where(raw_first < 0, raw_first * raw_first, 0.0)
+
+        mean_return = sum_1 / counts + center
+        second_moment = sum_2 / counts
+        variance = second_moment - (sum_1 / counts) ** 2
+        variance[variance <= second_moment * RollingCalculator.VARIANCE_RTOL] = 0.0
+
+        periods = RatioCalculator.PERIODS_PER_YEAR
+        excess_return = mean_return - risk_free_rate / periods
+        annualized_excess = excess_return * math.sqrt(periods)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            std_dev = np.sqrt(variance)
+            sharpe_ratio = np.where(
+                (mean_return != 0) & (std_dev > 0),
+                annualized_excess / (std_dev * math.sqrt(periods)),
+                0.0,
+            )
+            downside_std = np.sqrt(np.where(losses > 0, downside_sumsq / losses, 0.0))
+            sortino_ratio = np.where(
+                downside_std > 0,
+                annualized_excess / (downside_std * math.sqrt(periods)),
+                0.0,
+            )
+            trades = wins + losses
+            win_rate = np.where(trades > 0, wins / trades * 100, 0.0)
+
+        window_initial_cash = frame.end_cash[starts]
+        net_profit = frame.end_market_value - window_initial_cash
+        max_drawdown = RollingCalculator._rolling_max_drawdown(
+            frame.end_market_value.tolist(), window_initial_cash.tolist(), window
+        )
+
+        warmup = counts < min_periods
+        for values in (sharpe_ratio, sortino_ratio, win_rate, net_profit, max_drawdown):
+            values[warmup] = np.nan
+
+        return RollingMetrics(
+            window=window,
+            min_periods=min_periods,
+            session=frame.session.copy(),
+            sharpe_ratio=sharpe_ratio,
+            sortino_ratio=sortino_ratio,
+            win_rate=win_rate,
+            net_profit=net_profit,
+            max_drawdown=max_drawdown,
+        )
+
+    @staticmethod
+    def _rolling_max_drawdown(equities: list, initial_peaks: list, window: int) -> np.ndarray:
+        """滑动窗口最大回撤，峰值从窗口首日期末现金开始"""
+        result = np.empty(len(equities), dtype=np.float64)
+        sliding = SlidingDrawdown()
+        for i, equity in enumerate(equities):
+            sliding.push(equity)
+            if len(sliding) > window:
+                sliding.pop()
+            result[i] = sliding.query().drawdown_from(initial_peaks[i])
+        return result
+
+
+def _window_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    以每个位置结尾、长度至多 window 的窗口和。
+
+    按 window 分块，块内分别做正向和反向累加：窗口最多跨两个相邻块，
+    等于前一块的后缀和加当前块的前缀和。与全局前缀和做差相比，
+    舍入误差只与窗口内数值有关，不随序列长度增长。
+    """
+    n = len(values)
+    if n == 0:
+        return np.empty(0, dtype=np.float64)
+    num_blocks = -(-n // window)
+    blocks = np.zeros(num_blocks * window, dtype=np.float64)
+    blocks[:n] = values
+    blocks = blocks.reshape(num_blocks, window)
+    forward = np.cumsum(blocks, axis=1).ravel()[:n]
+    backward = np.cumsum(blocks[:, ::-1], axis=1)[:, ::-1].ravel()[:n]
+
+    ends = np.arange(n)
+    starts = ends - window + 1
+    result = forward.copy()
+    spans = (starts >= 0) & (ends % window != window - 1)
+    result[spans] += backward[starts[spans]]
+    return result
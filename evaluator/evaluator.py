@@ -1,59 +1,373 @@
 import logging
+import math
+import os
 from abc import ABC
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
-from typing import List
+from collections.abc import Sequence as AbcSequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 from .models.performance import Performance
+from .models.performance_record import PerformanceRecord
 from .models.session_stats import SessionStats
-from .models.comparison import PerformanceComparison, SessionComparison
-from .calculators import PerformanceCalculator
+from .models.session_frame import SessionFrame
+from .models.fixed_frame import FixedPointFrame
+from .models.comparison import PerformanceComparison, SessionComparisonTable, SessionSummary
+from .models.rolling_metrics import RollingMetrics
+from .models.drawdown_analysis import DrawdownAnalysis
+from .models.bar_metrics import BarMetrics
+from .calculators import BarCalculator, DrawdownCalculator, PerformanceCalculator, RollingCalculator
+from .calculators.metrics import METRICS, MetricRegistry
+from .instrumentation import NO_TIMINGS, StageTimings
+from .session_index import SessionIndex
+from .aggregate import PerformanceAggregate
+from .cache import PerformanceCache
 
 logger = logging.getLogger(__name__)
 
 
+def _evaluate_frame(
+    task: Tuple[Union[SessionFrame, FixedPointFrame, List[SessionStats]], float, bool],
+) -> Union[Performance, PerformanceRecord]:
+    frame, risk_free_rate, as_record = task
+    if isinstance(frame, FixedPointFrame):
+        return PerformanceCalculator.compute_fixed_performance(frame, risk_free_rate, as_record=as_record)
+    if isinstance(frame, SessionFrame):
+        return PerformanceCalculator.compute_frame_performance(frame, risk_free_rate, as_record=as_record)
+    # 金额无法按最小单位精确表示的输入，按 Decimal 路径计算
+    performance = PerformanceCalculator.compute_account_performance(frame, risk_free_rate)
+    return PerformanceRecord.from_performance(performance) if as_record else performance
+
+
 class PerformanceEvaluator(ABC):
-    def __init__(self, risk_free_rate: float = 0.03):
+    ENGINES = ("decimal", "numpy", "fixed")
+
+    def __init__(
+        self,
+        risk_free_rate: float = 0.03,
+        engine: str = "decimal",
+        on_timings: Optional[Callable[[StageTimings], None]] = None,
+        money_decimals: int = 2,
+        metric_registry: Optional[MetricRegistry] = None,
+        cache: Optional[PerformanceCache] = None,
+    ):
+        """
+        engine 为 "decimal"(默认)、"numpy"(float64 数组)或 "fixed"
+        (金额按 money_decimals 位小数转换为 int64 最小单位，结果精确)。
+        metric_registry 为 evaluate(metrics=...)(仅 engine="numpy")使用的指标注册表，默认为内置的 METRICS。
+        传入 cache 时 evaluate 和 compare 的结果按输入内容与参数缓存(生成器输入和 metrics 不缓存)。
+        on_timings 在每次 evaluate 结束时回调一次，传入本次实际执行的各阶段耗时(命中缓存时为 cache_hit)。
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {self.ENGINES}")
+        if money_decimals < 0:
+            raise ValueError(f"money_decimals must be non-negative, got {money_decimals}")
         self._risk_free_rate = risk_free_rate
+        self._engine = engine
+        self._money_decimals = money_decimals
+        self._metric_registry = metric_registry if metric_registry is not None else METRICS
+        self._on_timings = on_timings
+        self.cache = cache
 
     def evaluate(
         self,
-        sessions: List[SessionStats]
+        sessions: Union[Iterable[SessionStats], SessionFrame, FixedPointFrame, SessionIndex],
+        timings: Optional[StageTimings] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        metrics: Optional[Sequence[str]] = None,
+    ) -> Union[Performance, Dict[str, Any]]:
+        """
+        评估交易日序列，start/end 限定交易日区间(含两端)。
+
+        传入 SessionIndex 时不重新扫描区间(回撤持续时间 O(log² n)，其余字段 O(log n)，见 SessionIndex)；列表、SessionFrame 和 FixedPointFrame 按区间截取后评估；
+        其他可迭代对象(如生成器)单次遍历、逐日聚合，不保留 SessionStats，
+        但仍为每个盈利/亏损交易日和每次新高保存 float(O(n)，见 PerformanceAggregate)。
+        生成器不论 engine 都由 PerformanceAggregate 聚合：金额按 Decimal 精确累加，
+        与 decimal/fixed 引擎完全一致，比率由合并的矩计算，与各引擎在浮点精度内一致；
+        engine="fixed" 时逐日校验金额能按 money_decimals 位小数精确表示，与列表输入一样抛出 ValueError。
+
+        指定 metrics 时只计算这些指标及其依赖，返回 {指标名: 值} 而不是 Performance；
+        指标按 float64 列计算，只支持 engine="numpy"。
+        """
+        if timings is None and self._on_timings is not None:
+            timings = StageTimings()
+        if metrics is not None:
+            result = self._evaluate_metrics(sessions, metrics, start, end, timings)
+        else:
+            result = self._evaluate_cached(sessions, timings, start, end)
+        # 每次 evaluate 恰好回调一次，timings 中只有实际执行过的阶段
+        if self._on_timings is not None:
+            self._on_timings(timings)
+        return result
+
+    def _evaluate_cached(
+        self,
+        sessions: Union[Iterable[SessionStats], SessionFrame, FixedPointFrame, SessionIndex],
+        timings: Optional[StageTimings],
+        start: Optional[int],
+        end: Optional[int],
+    ) -> Performance:
+        key = self._cache_key("evaluate", (sessions,), start, end)
+        if key is None:
+            return self._evaluate_sessions(sessions, timings, start, end)
+        clock = timings.start() if timings is not None else NO_TIMINGS
+        performance = self.cache.get(key)
+        if performance is None:
+            performance = self._evaluate_sessions(sessions, timings, start, end)
+            self.cache.put(key, performance)
+        else:
+            # 命中缓存时只记录读取缓存的耗时
+            clock.mark(StageTimings.CACHE_HIT)
+        return performance
+
+    def _evaluate_sessions(
+        self,
+        sessions: Union[Iterable[SessionStats], SessionFrame, FixedPointFrame, SessionIndex],
+        timings: Optional[StageTimings],
+        start: Optional[int],
+        end: Optional[int],
     ) -> Performance:
-        if not sessions:
-            return self._empty_performance()
+        if isinstance(sessions, SessionIndex):
+            return sessions.performance(self._risk_free_rate, start, end, timings)
+        if start is not None or end is not None:
+            sessions = self._select_range(sessions, start, end)
+        if not isinstance(sessions, (SessionFrame, FixedPointFrame, AbcSequence)):
+            if self._engine == "fixed":
+                sessions = self._exact_sessions(sessions)
+            clock = timings.start() if timings is not None else NO_TIMINGS
+            aggregate = PerformanceAggregate.from_sessions(sessions)
+            clock.mark(StageTimings.AGGREGATION)
+            return aggregate.to_performance(self._risk_free_rate, timings)
+
+        if len(sessions) == 0:
+            clock = timings.start() if timings is not None else NO_TIMINGS
+            performance = self._empty_performance()
+            clock.mark(StageTimings.MODEL_CONSTRUCTION)
+            return performance
+        if isinstance(sessions, SessionFrame):
+            return PerformanceCalculator.compute_frame_performance(sessions, self._risk_free_rate, timings)
+        if isinstance(sessions, FixedPointFrame):
+            return PerformanceCalculator.compute_fixed_performance(sessions, self._risk_free_rate, timings)
+        return self._evaluate(sessions, timings)
+
+    def _cache_key(self, kind: str, inputs: Tuple[Any, ...], *params: Any) -> Optional[str]:
+        # 未启用缓存或输入无法计算指纹(如生成器)时返回 None
+        if self.cache is None:
+            return None
+        fingerprints = []
+        for sessions in inputs:
+            fingerprint = PerformanceCache.fingerprint(sessions)
+            if fingerprint is None:
+                return None
+            fingerprints.append(fingerprint)
+        return PerformanceCache.key(
+            kind, tuple(fingerprints), self._risk_free_rate, self._engine, self._money_decimals, params
+        )
+
+    def _evaluate_metrics(
+        self,
+        sessions: Union[Iterable[SessionStats], SessionFrame, SessionIndex],
+        metrics: Sequence[str],
+        start: Optional[int],
+        end: Optional[int],
+        timings: Optional[StageTimings] = None,
+    ) -> Dict[str, Any]:
+        if self._engine != "numpy":
+            # 指标注册表按 float64 列计算，与 decimal/fixed 引擎的精确金额不一致
+            raise ValueError(f"evaluate(metrics=...) requires engine='numpy', got {self._engine!r}")
+        if isinstance(sessions, SessionIndex):
+            sessions = sessions.frame
+        if isinstance(sessions, FixedPointFrame):
+            raise TypeError("evaluate(metrics=...) requires SessionStats or a SessionFrame")
+        if start is not None or end is not None:
+            sessions = self._select_range(sessions, start, end)
+        clock = timings.start() if timings is not None else NO_TIMINGS
+        if not isinstance(sessions, SessionFrame):
+            sessions = SessionFrame.from_sessions(list(sessions), positions=False)
+            clock.mark(StageTimings.FRAME_CONVERSION)
+        values = self._metric_registry.compute(sessions, metrics, self._risk_free_rate)
+        clock.mark(StageTimings.METRICS)
+        return values
+
+    @staticmethod
+    def _select_range(
+        sessions: Union[Iterable[SessionStats], SessionFrame, FixedPointFrame],
+        start: Optional[int],
+        end: Optional[int],
+    ) -> Union[Iterable[SessionStats], SessionFrame, FixedPointFrame]:
+        lower = start if start is not None else -math.inf
+        upper = end if end is not None else math.inf
+        if isinstance(sessions, (SessionFrame, FixedPointFrame)):
+            positions = np.flatnonzero((sessions.session >= lower) & (sessions.session <= upper))
+            if len(positions) == 0:
+                return sessions.slice(0, 0)
+            return sessions.slice(int(positions[0]), int(positions[-1]) + 1)
+        if isinstance(sessions, AbcSequence):
+            return [s for s in sessions if lower <= s.session <= upper]
+        return (s for s in sessions if lower <= s.session <= upper)
+
+    def evaluate_rolling(
+        self,
+        sessions: Union[List[SessionStats], SessionFrame],
+        window: int,
+        min_periods: Optional[int] = None,
+    ) -> RollingMetrics:
+        """以每个交易日结尾、长度为 window 的滚动窗口指标"""
+        frame = sessions if isinstance(sessions, SessionFrame) else SessionFrame.from_sessions(sessions)
+        return RollingCalculator.compute_rolling_metrics(frame, window, self._risk_free_rate, min_periods)
+
+    def evaluate_drawdowns(
+        self,
+        sessions: Union[Iterable[SessionStats], SessionFrame, FixedPointFrame, SessionIndex],
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> DrawdownAnalysis:
+        """账户权益的逐次回撤分析(水下曲线、峰值/最低点/收复交易日、深度与持续时间)"""
+        if isinstance(sessions, SessionIndex):
+            sessions = sessions.frame
+        if start is not None or end is not None:
+            sessions = self._select_range(sessions, start, end)
+        if not isinstance(sessions, (SessionFrame, FixedPointFrame)):
+            sessions = SessionFrame.from_sessions(list(sessions))
+        return DrawdownCalculator.analyze_frame(sessions)
+
+    def evaluate_bars(
+        self,
+        sessions: Union[Sequence[SessionStats], SessionFrame, FixedPointFrame, SessionIndex],
+        bar_equity: np.ndarray,
+        bar_sessions: np.ndarray,
+        chunk_size: int = BarCalculator.CHUNK_SIZE,
+    ) -> BarMetrics:
+        """
+        按日内盯市权益 bar 评估回撤、回撤持续 bar 数和 bar 级夏普比率。
+
+        bar_equity 为每根 bar 的账户权益，bar_sessions 为其所属交易日(不减，且须在 sessions 中)，
+        两者可为 np.memmap，按 chunk_size 根 bar 分段处理，内存与总 bar 数无关。
+        峰值从 sessions 的期初资金开始，与 evaluate 的 max_drawdown 口径一致。
+        """
+        if isinstance(sessions, SessionIndex):
+            sessions = sessions.frame
+        if isinstance(sessions, FixedPointFrame):
+            session_ids = sessions.session
+            initial_cash = float(sessions.to_decimal(sessions.end_cash[0])) if len(sessions) else 0.0
+        else:
+            if not isinstance(sessions, SessionFrame):
+                sessions = SessionFrame.from_sessions(list(sessions))
+            session_ids = sessions.session
+            initial_cash = float(sessions.end_cash[0]) if len(sessions) else 0.0
+        return BarCalculator.compute_bar_metrics(
+            bar_equity, bar_sessions, initial_cash, self._risk_free_rate, chunk_size, session_ids
+        )
+
+    def evaluate_many(
+        self,
+        session_lists: Sequence[Union[List[SessionStats], SessionFrame, FixedPointFrame]],
+        workers: Optional[int] = None,
+        as_record: bool = False,
+    ) -> List[Union[Performance, PerformanceRecord]]:
+        """
+        批量评估多组交易日序列，结果顺序与输入一致，按 engine 计算。
+
+        每组列表在当前进程内只提取账户列，以 NumPy 数组发送到进程池，转换与子进程的计算交替进行；
+        workers 默认为 CPU 核数，workers <= 1 时在当前进程内串行计算(与逐个 evaluate 完全一致)。
+        engine 为 "numpy" 时发送 SessionFrame(positions=False)，为 "fixed" 时发送 FixedPointFrame。
+
+        engine 为 "decimal" 时同样发送按 money_decimals 换算的 FixedPointFrame(Decimal 对象的序列化
+        开销高于计算本身)，金额与 Decimal 路径完全一致，夏普/索提诺在浮点精度内一致；
+        金额无法按最小单位精确表示的列表原样发送，在子进程中按 Decimal 路径计算。
+        as_record 为 True 时返回 PerformanceRecord，省去逐个构建和校验 Performance 模型。
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(session_lists))
+        if self._engine == "decimal" and workers <= 1:
+            results = [self.evaluate(s) for s in session_lists]
+            return [PerformanceRecord.from_performance(r) for r in results] if as_record else results
 
-        return self._evaluate(sessions)
+        tasks = ((self._account_frame(s), self._risk_free_rate, as_record) for s in session_lists)
+
+        if workers <= 1:
+            return [_evaluate_frame(task) for task in tasks]
+
+        chunksize = max(1, len(session_lists) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_evaluate_frame, tasks, chunksize=chunksize))
+
+    def _account_frame(
+        self,
+        sessions: Union[List[SessionStats], SessionFrame, FixedPointFrame],
+    ) -> Union[SessionFrame, FixedPointFrame, List[SessionStats]]:
+        # 批量评估只需要账户列，不构建持仓表
+        if isinstance(sessions, (SessionFrame, FixedPointFrame)):
+            return sessions
+        if self._engine == "fixed":
+            return FixedPointFrame.from_sessions(sessions, self._money_decimals)
+        if self._engine == "decimal":
+            try:
+                return FixedPointFrame.from_sessions(sessions, self._money_decimals)
+            except ValueError:
+                return list(sessions)
+        return SessionFrame.from_sessions(sessions, positions=False)
 
     def compare(
         self,
-        sessions_a: List[SessionStats],
-        sessions_b: List[SessionStats],
+        sessions_a: Iterable[SessionStats],
+        sessions_b: Iterable[SessionStats],
+        keep_sessions: bool = True,
     ) -> PerformanceComparison:
-        sessions_a_ids = set(s.session for s in sessions_a)
-        sessions_b_ids = set(s.session for s in sessions_b)
+        """
+        对比两组交易日序列。
 
-        if sessions_a_ids != sessions_b_ids:
-            only_in_a = sessions_a_ids - sessions_b_ids
-            only_in_b = sessions_b_ids - sessions_a_ids
+        两者都是列表时允许乱序和重复；否则按有序流单次归并遍历，
+        只保留逐日对比所需的摘要，session 须严格递增。
 
-            if only_in_a:
-                logger.warning(
-                    f"Sessions only in first set: {sorted(only_in_a)}. "
-                    f"Comparison will only use common sessions."
-                )
-            if only_in_b:
+        keep_sessions 为 False 时不保留逐日对比表(结果的 sessions 为空)和只在一侧出现的交易日列表，
+        只统计数量；此时有序流对比的内存只剩两侧 PerformanceAggregate 的盈亏值与新高
+        (见 PerformanceAggregate)，不再随匹配的交易日逐日增长。
+        """
+        key = self._cache_key("compare", (sessions_a, sessions_b), keep_sessions)
+        if key is None:
+            return self._compare(sessions_a, sessions_b, keep_sessions)
+        comparison = self.cache.get(key)
+        if comparison is None:
+            comparison = self._compare(sessions_a, sessions_b, keep_sessions)
+            self.cache.put(key, comparison)
+        return comparison
+
+    def _compare(
+        self,
+        sessions_a: Iterable[SessionStats],
+        sessions_b: Iterable[SessionStats],
+        keep_sessions: bool,
+    ) -> PerformanceComparison:
+        if isinstance(sessions_a, AbcSequence) and isinstance(sessions_b, AbcSequence):
+            matched_a, matched_b, only_in_a, only_in_b = self._merge_join(sessions_a, sessions_b)
+            perf_a = self.evaluate(sessions_a)
+            perf_b = self.evaluate(sessions_b)
+            matched = len(matched_a)
+            if keep_sessions:
+                session_comparisons = SessionComparisonTable(matched_a, matched_b)
+            else:
+                session_comparisons = SessionComparisonTable.from_summaries([], [])
+                only_in_a, only_in_b = len(only_in_a), len(only_in_b)
+        else:
+            perf_a, perf_b, session_comparisons, matched, only_in_a, only_in_b = self._compare_streams(
+                sessions_a, sessions_b, keep_sessions
+            )
+
+        for label, only_in in (("first", only_in_a), ("second", only_in_b)):
+            if only_in:
                 logger.warning(
-                    f"Sessions only in second set: {sorted(only_in_b)}. "
+                    f"Sessions only in {label} set: {only_in}. "
                     f"Comparison will only use common sessions."
                 )
 
-        perf_a = self.evaluate(sessions_a)
-        perf_b = self.evaluate(sessions_b)
-
-        session_comparisons = self._compare_sessions(sessions_a, sessions_b)
-
-        all_sessions = sessions_a_ids | sessions_b_ids
-        matched = len(sessions_a_ids & sessions_b_ids)
+        # keep_sessions 为 False 时 only_in_a/only_in_b 为数量
+        unmatched = [only_in if isinstance(only_in, int) else len(only_in) for only_in in (only_in_a, only_in_b)]
+        total_sessions = matched + sum(unmatched)
 
         first_net = perf_a.net_profit
         net_delta = perf_b.net_profit - perf_a.net_profit
@@ -77,61 +391,148 @@ class PerformanceEvaluator(ABC):
             performance_ratio=perf_ratio,
             drift_percentage=drift_pct,
             sessions=session_comparisons,
-            total_sessions=len(all_sessions),
+            total_sessions=total_sessions,
             matched_sessions=matched,
-            session_match_rate=matched / len(all_sessions) if all_sessions else 0.0,
+            session_match_rate=matched / total_sessions if total_sessions else 0.0,
+        )
+
+    def _compare_streams(
+        self,
+        sessions_a: Iterable[SessionStats],
+        sessions_b: Iterable[SessionStats],
+        keep_sessions: bool,
+    ) -> Tuple[Performance, Performance, SessionComparisonTable, int, Union[List[int], int], Union[List[int], int]]:
+        if self._engine == "fixed":
+            sessions_a = self._exact_sessions(sessions_a)
+            sessions_b = self._exact_sessions(sessions_b)
+        aggregate_a = PerformanceAggregate()
+        aggregate_b = PerformanceAggregate()
+        stream_a = self._ordered_stream(sessions_a, aggregate_a)
+        stream_b = self._ordered_stream(sessions_b, aggregate_b)
+
+        matched = 0
+        matched_a = []
+        matched_b = []
+        only_in_a = []
+        only_in_b = []
+        unmatched_a = unmatched_b = 0
+
+        a = next(stream_a, None)
+        b = next(stream_b, None)
+        while a is not None or b is not None:
+            if a is not None and b is not None and a.session == b.session:
+                matched += 1
+                if keep_sessions:
+                    matched_a.append(SessionSummary.of(a))
+                    matched_b.append(SessionSummary.of(b))
+                a = next(stream_a, None)
+                b = next(stream_b, None)
+            elif b is None or (a is not None and a.session < b.session):
+                unmatched_a += 1
+                if keep_sessions:
+                    only_in_a.append(a.session)
+                a = next(stream_a, None)
+            else:
+                unmatched_b += 1
+                if keep_sessions:
+                    only_in_b.append(b.session)
+                b = next(stream_b, None)
+
+        return (
+            aggregate_a.to_performance(self._risk_free_rate),
+            aggregate_b.to_performance(self._risk_free_rate),
+            SessionComparisonTable.from_summaries(matched_a, matched_b),
+            matched,
+            only_in_a if keep_sessions else unmatched_a,
+            only_in_b if keep_sessions else unmatched_b,
         )
 
+    def _exact_sessions(self, sessions: Iterable[SessionStats]) -> Iterator[SessionStats]:
+        # fixed 引擎的流式输入逐日校验最小单位，与 FixedPointFrame.from_sessions 一致
+        for s in sessions:
+            FixedPointFrame.check_exact(s, self._money_decimals)
+            yield s
+
+    @staticmethod
+    def _ordered_stream(
+        sessions: Iterable[SessionStats],
+        aggregate: PerformanceAggregate,
+    ) -> Iterator[SessionStats]:
+        # 逐日加入聚合后交给归并，流式输入无法排序，要求 session 严格递增
+        previous = None
+        for s in sessions:
+            if previous is not None and s.session <= previous:
+                raise ValueError(
+                    f"Streamed sessions must be strictly increasing, got {s.session} after {previous}"
+                )
+            previous = s.session
+            aggregate.add(s)
+            yield s
+
+    @staticmethod
+    def _merge_join(
+        first_sessions: List[SessionStats],
+        second_sessions: List[SessionStats],
+    ) -> Tuple[List[SessionStats], List[SessionStats], List[int], List[int]]:
+        first_sessions = PerformanceEvaluator._ordered_unique(first_sessions)
+        second_sessions = PerformanceEvaluator._ordered_unique(second_sessions)
+
+        matched_first = []
+        matched_second = []
+        only_in_first = []
+        only_in_second = []
+
+        i = j = 0
+        while i < len(first_sessions) and j < len(second_sessions):
+            first_id = first_sessions[i].session
+            second_id = second_sessions[j].session
+            if first_id == second_id:
+                matched_first.append(first_sessions[i])
+                matched_second.append(second_sessions[j])
+                i += 1
+                j += 1
+            elif first_id < second_id:
+                only_in_first.append(first_id)
+                i += 1
+            else:
+                only_in_second.append(second_id)
+                j += 1
+        only_in_first.extend(s.session for s in first_sessions[i:])
+        only_in_second.extend(s.session for s in second_sessions[j:])
+
+        return matched_first, matched_second, only_in_first, only_in_second
+
+    @staticmethod
+    def _ordered_unique(sessions: List[SessionStats]) -> List[SessionStats]:
+        # 输入通常已按 session 严格递增，此时直接用于归并；否则按 session 去重(保留最后一条)并排序
+        previous = None
+        for s in sessions:
+            if previous is not None and s.session <= previous:
+                by_session = {s.session: s for s in sessions}
+                return [by_session[session] for session in sorted(by_session)]
+            previous = s.session
+        return sessions
+
     def _compare_sessions(
         self,
         first_sessions: List[SessionStats],
         second_sessions: List[SessionStats],
-    ) -> List[SessionComparison]:
-        first_by_session = {s.session: s for s in first_sessions}
-        second_by_session = {s.session: s for s in second_sessions}
-
-        common_sessions = set(first_by_session.keys()) & set(second_by_session.keys())
-
-        comparisons = []
-        for session in sorted(common_sessions):
-            first = first_by_session[session]
-            second = second_by_session[session]
-
-            first_pnl = first.profit_loss
-            second_pnl = second.profit_loss
-            pnl_delta = second_pnl - first_pnl
-
-            first_pnl_pct = float(first_pnl / first.start_cash * 100) if first.start_cash != 0 else 0.0
-            second_pnl_pct = float(second_pnl / second.start_cash * 100) if second.start_cash != 0 else 0.0
-
-            first_trade_count = len(first.end_positions)
-            second_trade_count = len(second.end_positions)
-
-            drift_ratio = float(pnl_delta / abs(first_pnl)) if first_pnl != 0 else 0.0
-
-            comparisons.append(SessionComparison(
-                session=session,
-                first_pnl=first_pnl,
-                first_pnl_pct=first_pnl_pct,
-                first_trade_count=first_trade_count,
-                first_end_cash=first.end_cash,
-                second_pnl=second_pnl,
-                second_pnl_pct=second_pnl_pct,
-                second_trade_count=second_trade_count,
-                second_end_cash=second.end_cash,
-                pnl_delta=pnl_delta,
-                pnl_pct_delta=second_pnl_pct - first_pnl_pct,
-                trade_count_delta=second_trade_count - first_trade_count,
-                drift_ratio=drift_ratio,
-            ))
-
-        return comparisons
+    ) -> SessionComparisonTable:
+        matched_first, matched_second, _, _ = self._merge_join(first_sessions, second_sessions)
+        return SessionComparisonTable(matched_first, matched_second)
 
     def _evaluate(
         self,
-        sessions: List[SessionStats]
+        sessions: List[SessionStats],
+        timings: Optional[StageTimings] = None,
     ) -> Performance:
-        return PerformanceCalculator.compute_account_performance(sessions, self._risk_free_rate)
+        if self._engine == "numpy":
+            return PerformanceCalculator.compute_account_performance_vectorized(sessions, self._risk_free_rate, timings)
+        if self._engine == "fixed":
+            return PerformanceCalculator.compute_account_performance_fixed(
+                sessions, self._risk_free_rate, self._money_decimals, timings
+            )
+        return PerformanceCalculator.compute_account_performance(sessions, self._risk_free_rate, timings)
 
     def _empty_performance(self) -> Performance:
         return PerformanceCalculator._empty_performance()
@@ -145,5 +546,12 @@ class PerformanceEvaluator(ABC):
             return self._empty_position_performance(symbol)
         return PerformanceCalculator.compute_position_performance(position_stats, symbol, self._risk_free_rate)
 
+    def evaluate_all_positions(
+        self,
+        sessions: Union[List[SessionStats], SessionFrame],
+    ) -> Dict[str, Performance]:
+        frame = sessions if isinstance(sessions, SessionFrame) else SessionFrame.from_sessions(sessions)
+        return PerformanceCalculator.compute_all_position_performance(frame, self._risk_free_rate)
+
     def _empty_position_performance(self, symbol: str) -> Performance:
         return PerformanceCalculator._empty_position_performance(symbol)
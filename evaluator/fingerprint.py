@@ -0,0 +1,84 @@
+import hashlib
+from typing import Iterable, List, Optional
+
+from .models.session_stats import SessionStats
+
+DIGEST_SIZE = 16
+_SEED = hashlib.blake2b(b"evaluator.SessionFingerprint", digest_size=DIGEST_SIZE).digest()
+
+
+class SessionFingerprint:
+    """
+    交易日序列的链式指纹。
+
+    第 i 个链值为 blake2b(第 i-1 个链值 + 第 i 个交易日的 digest)，
+    因此追加一个交易日只需 O(1) 次哈希；保存全部链值后，任意前缀的指纹可直接读取，
+    两个序列的最长公共前缀用二分查找在 O(log n) 次比较内得到。
+    """
+
+    __slots__ = ("_chain",)
+
+    def __init__(self, sessions: Iterable[SessionStats] = ()):
+        self._chain: List[bytes] = []
+        self.extend(sessions)
+
+    def __len__(self) -> int:
+        return len(self._chain)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SessionFingerprint):
+            return NotImplemented
+        return self.digest() == other.digest() and len(self) == len(other)
+
+    def __hash__(self) -> int:
+        return hash(self.digest())
+
+    def append(self, session: SessionStats):
+        """在序列末尾追加一个交易日"""
+        self._chain.append(_link(self.digest(), session.digest))
+
+    def extend(self, sessions: Iterable[SessionStats]):
+        previous = self.digest()
+        chain = self._chain
+        for s in sessions:
+            previous = _link(previous, s.digest)
+            chain.append(previous)
+
+    def truncate(self, length: int):
+        """只保留前 length 个交易日"""
+        del self._chain[length:]
+
+    def copy(self) -> "SessionFingerprint":
+        copied = SessionFingerprint()
+        copied._chain = list(self._chain)
+        return copied
+
+    def digest(self, length: Optional[int] = None) -> bytes:
+        """前 length 个交易日(默认全部)的指纹"""
+        if length is None:
+            length = len(self._chain)
+        return self._chain[length - 1] if length > 0 else _SEED
+
+    def hexdigest(self, length: Optional[int] = None) -> str:
+        return self.digest(length).hex()
+
+    def common_prefix(self, other: "SessionFingerprint") -> int:
+        """与另一序列的最长公共前缀长度"""
+        a = self._chain
+        b = other._chain
+        lo, hi = 0, min(len(a), len(b))
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if a[mid - 1] == b[mid - 1]:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    def startswith(self, prefix: "SessionFingerprint") -> bool:
+        """prefix 对应的序列是否为本序列的前缀"""
+        return len(prefix) <= len(self) and self.digest(len(prefix)) == prefix.digest()
+
+
+def _link(previous: bytes, digest: bytes) -> bytes:
+    return hashlib.blake2b(previous + digest, digest_size=DIGEST_SIZE).digest()
@@ -0,0 +1,64 @@
+import time
+from typing import Dict
+
+
+class StageTimings:
+    """
+    绩效计算各阶段耗时(秒)。
+
+    计算过程中依次调用 mark(stage)，记录自上一次标记以来的耗时；
+    同一个对象可跨多次计算累计。
+    """
+
+    VALIDATION = "validation"
+    FRAME_CONVERSION = "frame_conversion"
+    EQUITY_DRAWDOWN = "equity_drawdown"
+    PNL_CLASSIFICATION = "pnl_classification"
+    TOP_CONTRIBUTIONS = "top_contributions"
+    RATIOS = "ratios"
+    MODEL_CONSTRUCTION = "model_construction"
+    AGGREGATION = "aggregation"
+    METRICS = "metrics"
+    CACHE_HIT = "cache_hit"
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self._last = 0.0
+
+    def start(self) -> "StageTimings":
+        """开始计时(每次计算开始时调用)"""
+        self._last = time.perf_counter()
+        return self
+
+    def mark(self, stage: str):
+        """结束一个阶段，累计其耗时"""
+        now = time.perf_counter()
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + (now - self._last)
+        self.calls[stage] = self.calls.get(stage, 0) + 1
+        self._last = now
+
+    @property
+    def total(self) -> float:
+        """各阶段耗时之和"""
+        return sum(self.seconds.values())
+
+    def as_dict(self) -> Dict[str, float]:
+        return dict(self.seconds)
+
+    def __repr__(self) -> str:
+        stages = ", ".join(f"{name}={seconds:.6f}" for name, seconds in self.seconds.items())
+        return f"StageTimings({stages})"
+
+
+class _NoTimings:
+    """未启用计时时使用的空实现"""
+
+    def start(self) -> "_NoTimings":
+        return self
+
+    def mark(self, stage: str):
+        pass
+
+
+NO_TIMINGS = _NoTimings()
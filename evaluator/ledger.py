@@ -0,0 +1,176 @@
+import bisect
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .aggregate import PerformanceAggregate
+from .calculators import PerformanceCalculator, RollingCalculator
+from .fingerprint import SessionFingerprint
+from .models.performance import Performance
+from .models.rolling_metrics import RollingMetrics
+from .models.session_frame import SessionFrame
+from .models.session_stats import SessionStats
+
+
+class SessionLedger:
+    """
+    单个账户的交易日历史，支持追加和更正。
+
+    append 追加新交易日(session 须严格递增)，amend 替换已有交易日(如事后更正最近几日)。
+    账户绩效、各标的持仓绩效和滚动指标在读取时按需更新，只重算最早变更之后受影响的部分：
+
+    - 账户绩效按 block_size 个交易日分块保存 PerformanceAggregate，只重建变更所在及之后的块，
+      读取时按顺序合并各块，金额字段与 compute_account_performance 完全一致(比率在浮点精度内)；
+    - 持仓绩效只重算变更交易日涉及的标的，与 compute_position_performance 一致；
+    - 滚动指标只重算以变更位置及之后结尾的窗口，与 compute_rolling_metrics 一致(浮点精度内)。
+    """
+
+    def __init__(
+        self,
+        risk_free_rate: float = 0.03,
+        sessions: Iterable[SessionStats] = (),
+        block_size: int = 256,
+    ):
+        if block_size < 1:
+            raise ValueError(f"block_size must be positive, got {block_size}")
+        self._risk_free_rate = risk_free_rate
+        self._block_size = block_size
+
+        self._sessions: List[SessionStats] = []
+        self._ids: List[int] = []
+        self.fingerprint = SessionFingerprint()
+
+        # 账户绩效：_blocks[j] 为第 j 块(block_size 个交易日)的聚合
+        self._blocks: List[PerformanceAggregate] = []
+        self._account_valid = 0
+        self._performance: Optional[Performance] = None
+
+        # 持仓绩效：symbol -> {session: {"end_positions": [...]}}，与 index_positions 格式一致
+        self._positions: Dict[str, dict] = {}
+        self._position_performance: Dict[str, Performance] = {}
+        self._dirty_symbols: Set[str] = set()
+
+        # 滚动指标：(window, min_periods) -> (结果, 有效长度)
+        self._rolling: Dict[Tuple[int, int], Tuple[RollingMetrics, int]] = {}
+
+        self.extend(sessions)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    @property
+    def sessions(self) -> List[SessionStats]:
+        """当前的交易日历史(副本)"""
+        return list(self._sessions)
+
+    def append(self, session: SessionStats):
+        """追加一个交易日"""
+        if self._ids and session.session <= self._ids[-1]:
+            raise ValueError(f"Appended session {session.session} must be after {self._ids[-1]}")
+        index = len(self._sessions)
+        self._sessions.append(session)
+        self._ids.append(session.session)
+        self.fingerprint.append(session)
+        self._index_positions(session)
+        self._invalidate(index)
+
+    def extend(self, sessions: Iterable[SessionStats]):
+        for session in sessions:
+            self.append(session)
+
+    def amend(self, session: SessionStats):
+        """用同一 session 的新数据替换已有交易日"""
+        index = bisect.bisect_left(self._ids, session.session)
+        if index == len(self._ids) or self._ids[index] != session.session:
+            raise KeyError(f"Session {session.session} is not in the ledger")
+
+        previous = self._sessions[index]
+        if previous.digest == session.digest:
+            return
+        self._unindex_positions(previous)
+        self._sessions[index] = session
+        self._index_positions(session)
+
+        self.fingerprint.truncate(index)
+        self.fingerprint.extend(self._sessions[index:])
+        self._invalidate(index)
+
+    def performance(self) -> Performance:
+        """账户绩效"""
+        if self._performance is None:
+            self._update_blocks()
+            self._performance = PerformanceAggregate.merge_all(self._blocks).to_performance(self._risk_free_rate)
+        return self._performance
+
+    def position_performance(self) -> Dict[str, Performance]:
+        """各标的持仓绩效(按标的排序)"""
+        for symbol in self._dirty_symbols:
+            position_stats = self._positions.get(symbol)
+            if position_stats:
+                self._position_performance[symbol] = PerformanceCalculator.compute_position_performance(
+                    position_stats, symbol, self._risk_free_rate
+                )
+            else:
+                self._position_performance.pop(symbol, None)
+        self._dirty_symbols.clear()
+        return {symbol: self._position_performance[symbol] for symbol in sorted(self._position_performance)}
+
+    def rolling(self, window: int, min_periods: Optional[int] = None) -> RollingMetrics:
+        """以每个交易日结尾的滚动窗口指标"""
+        if min_periods is None:
+            min_periods = window
+        key = (window, min_periods)
+        n = len(self._sessions)
+        cached, valid = self._rolling.get(key, (None, 0))
+        if cached is not None and valid == n:
+            return cached
+
+        # 以 valid 及之后结尾的窗口最早从 valid - window + 1 开始
+        start = max(valid - window + 1, 0)
+        frame = SessionFrame.from_sessions(self._sessions[start:])
+        tail = RollingCalculator.compute_rolling_metrics(frame, window, self._risk_free_rate, min_periods)
+        if cached is None or valid == 0:
+            result = tail
+        else:
+            skip = valid - start
+            result = RollingMetrics(
+                window=window,
+                min_periods=min_periods,
+                **{
+                    name: np.concatenate([getattr(cached, name)[:valid], getattr(tail, name)[skip:]])
+                    for name in ("session", "sharpe_ratio", "sortino_ratio", "win_rate", "net_profit", "max_drawdown")
+                },
+            )
+        self._rolling[key] = (result, n)
+        return result
+
+    def _invalidate(self, index: int):
+        self._account_valid = min(self._account_valid, index)
+        self._performance = None
+        for key, (metrics, valid) in self._rolling.items():
+            if valid > index:
+                self._rolling[key] = (metrics, index)
+
+    def _update_blocks(self):
+        size = self._block_size
+        first = self._account_valid // size
+        del self._blocks[first:]
+        for start in range(first * size, len(self._sessions), size):
+            self._blocks.append(PerformanceAggregate.from_sessions(self._sessions[start:start + size]))
+        self._account_valid = len(self._sessions)
+
+    def _index_positions(self, session: SessionStats):
+        for pos in session.end_positions:
+            by_session = self._positions.setdefault(pos.symbol, {})
+            if session.session not in by_session:
+                by_session[session.session] = {"end_positions": [pos]}
+            self._dirty_symbols.add(pos.symbol)
+
+    def _unindex_positions(self, session: SessionStats):
+        for pos in session.end_positions:
+            by_session = self._positions.get(pos.symbol)
+            if by_session is not None:
+                by_session.pop(session.session, None)
+                if not by_session:
+                    del self._positions[pos.symbol]
+            self._dirty_symbols.add(pos.symbol)
@@ -0,0 +1,210 @@
+import csv
+import json
+import math
+import os
+import random
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, Tuple, Union
+
+import numpy as np
+
+from .models.session_frame import SessionFrame
+from .models.session_stats import SessionStats
+
+
+class SessionLoader:
+    """
+    交易日数据的可信批量加载。
+
+    记录为与 SessionStats 字段同名的字典(持仓为嵌套字典列表)，可来自
+    model_dump、JSON Lines 或 CSV。load_frame 不构建也不校验模型，按 SessionStats
+    派生属性的公式直接把记录计算成 SessionFrame 的列。
+
+    validate_fraction 为抽样校验比例：被抽中的记录用 SessionStats.model_validate 校验，
+    并核对派生列与模型计算结果一致，不一致时抛出 ValueError。
+    """
+
+    # load_frame 抽样核对派生列时允许的相对误差(列按 float 计算)
+    FRAME_RTOL = 1e-9
+
+    @staticmethod
+    def load_frame(
+        records: Iterable[Dict[str, Any]],
+        validate_fraction: float = 0.0,
+        seed: int = 0,
+    ) -> SessionFrame:
+        """不构建模型，直接从记录计算 SessionFrame"""
+        sampler = _Sampler(validate_fraction, seed)
+
+        session = []
+        start_cash = []
+        end_cash = []
+        end_market_value = []
+        commission = []
+        pnl = []
+        position_offsets = [0]
+
+        symbol_codes = {}
+        pos_symbol = []
+        pos_start_value = []
+        pos_end_value = []
+        pos_end_volume = []
+        pos_realized_profit = []
+        pos_commission = []
+        pos_trade_count = []
+
+        for record in records:
+            row = _account_row(record)
+            if sampler.sample():
+                _check_row(record, row)
+            session.append(row[0])
+            start_cash.append(row[1])
+            end_cash.append(row[2])
+            end_market_value.append(row[3])
+            commission.append(row[4])
+            pnl.append(row[5])
+
+            for p in record.get("end_positions") or ():
+                symbol = p["symbol"]
+                code = symbol_codes.get(symbol)
+                if code is None:
+                    code = len(symbol_codes)
+                    symbol_codes[symbol] = code
+                pos_symbol.append(code)
+                pos_start_value.append(_float(p, "start_value"))
+                pos_end_value.append(_float(p, "end_value"))
+                pos_end_volume.append(_int(p, "end_volume"))
+                pos_realized_profit.append(_float(p, "realized_profit"))
+                pos_commission.append(_float(p, "commission"))
+                pos_trade_count.append(_int(p, "trade_count"))
+            position_offsets.append(len(pos_symbol))
+
+        return SessionFrame(
+            session=np.array(session, dtype=np.int64),
+            start_cash=np.array(start_cash, dtype=np.float64),
+            end_cash=np.array(end_cash, dtype=np.float64),
+            end_market_value=np.array(end_market_value, dtype=np.float64),
+            commission=np.array(commission, dtype=np.float64),
+            pnl=np.array(pnl, dtype=np.float64),
+            position_offsets=np.array(position_offsets, dtype=np.int64),
+            position_symbol=np.array(pos_symbol, dtype=np.int32),
+            position_start_value=np.array(pos_start_value, dtype=np.float64),
+            position_end_value=np.array(pos_end_value, dtype=np.float64),
+            position_end_volume=np.array(pos_end_volume, dtype=np.int64),
+            position_realized_profit=np.array(pos_realized_profit, dtype=np.float64),
+            position_commission=np.array(pos_commission, dtype=np.float64),
+            position_trade_count=np.array(pos_trade_count, dtype=np.int64),
+            symbols=list(symbol_codes),
+        )
+
+    @staticmethod
+    def read_jsonl(path: Union[str, os.PathLike]) -> Iterator[Dict[str, Any]]:
+        """逐行读取 JSON Lines 记录"""
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    @staticmethod
+    def read_csv(path: Union[str, os.PathLike]) -> Iterator[Dict[str, Any]]:
+        """
+        读取长格式 CSV：每行一条期末持仓，账户列(session、start_cash、end_cash)
+        在同一交易日的各行重复，symbol 为空的行表示该交易日没有持仓。
+        列名与 SessionStats / PositionSessionStats 字段相同，空单元格取默认值。
+        """
+        account_fields = ("session", "start_cash", "end_cash")
+        with open(path, newline="", encoding="utf-8") as f:
+            record = None
+            for row in csv.DictReader(f):
+                values = {k: v for k, v in row.items() if v not in ("", None)}
+                if record is None or int(values["session"]) != record["session"]:
+                    if record is not None:
+                        yield record
+                    record = {k: values[k] for k in account_fields if k in values}
+                    record["session"] = int(values["session"])
+                    record["end_positions"] = []
+                if "symbol" in values:
+                    position = {k: v for k, v in values.items() if k not in account_fields}
+                    position["session"] = record["session"]
+                    record["end_positions"].append(position)
+            if record is not None:
+                yield record
+
+
+class _Sampler:
+    __slots__ = ("_fraction", "_rng")
+
+    def __init__(self, fraction: float, seed: int):
+        if not 0 <= fraction <= 1:
+            raise ValueError(f"validate_fraction must be in [0, 1], got {fraction}")
+        self._fraction = fraction
+        self._rng = random.Random(seed)
+
+    def sample(self) -> bool:
+        if self._fraction == 0:
+            return False
+        return self._fraction == 1 or self._rng.random() < self._fraction
+
+
+def _float(record: Dict[str, Any], name: str) -> float:
+    value = record.get(name)
+    return 0.0 if value is None else float(value)
+
+
+def _int(record: Dict[str, Any], name: str) -> int:
+    value = record.get(name)
+    return 0 if value is None else int(value)
+
+
+def _account_row(record: Dict[str, Any]) -> Tuple[int, float, float, float, float, float]:
+    """按 SessionStats 的派生属性公式计算账户列"""
+    start_positions = record.get("start_positions") or ()
+    end_positions = record.get("end_positions") or ()
+
+    start_cash = _float(record, "start_cash")
+    end_cash = _float(record, "end_cash")
+    commission = 0.0
+    net_cashflow = 0.0
+    for p in chain(start_positions, end_positions):
+        commission += _float(p, "commission")
+        net_cashflow += _float(p, "net_cashflow")
+    effective_end_cash = end_cash if end_cash != 0 else start_cash + net_cashflow - commission
+
+    start_market_value = start_cash
+    for p in start_positions:
+        if _int(p, "start_volume") != 0:
+            start_market_value += _float(p, "start_value")
+
+    end_market_value = effective_end_cash
+    for p in end_positions:
+        price = p.get("end_market_price")
+        if price is not None:
+            end_market_value += _int(p, "end_volume") * float(price)
+        elif _int(p, "end_volume") != 0:
+            end_market_value += _float(p, "end_value")
+
+    return (
+        int(record["session"]),
+        start_cash,
+        end_cash,
+        end_market_value,
+        commission,
+        end_market_value - start_market_value,
+    )
+
+
+def _check_row(record: Dict[str, Any], row: Tuple[int, float, float, float, float, float]):
+    session = SessionStats.model_validate(record)
+    expected = (
+        session.session,
+        float(session.start_cash),
+        float(session.end_cash),
+        float(session.end_market_value),
+        float(session.total_commission),
+        float(session.profit_loss),
+    )
+    scale = max(abs(expected[1]), abs(expected[3]), 1.0)
+    for name, actual, value in zip(("session", "start_cash", "end_cash", "end_market_value", "commission", "pnl"),
+                                   row, expected):
+        if not math.isclose(actual, value, rel_tol=SessionLoader.FRAME_RTOL, abs_tol=scale * SessionLoader.FRAME_RTOL):
+            raise ValueError(f"Session {session.session}: {name} is {actual}, validated model gives {value}")
@@ -1,4 +1,11 @@
 from .performance import Performance
 from .session_stats import SessionStats
 from .position_session_stats import PositionSessionStats
-from .comparison import PerformanceComparison, SessionComparison
+from .comparison import PerformanceComparison, SessionComparison, SessionComparisonTable
+from .session_frame import SessionFrame
+from .fixed_frame import FixedPointFrame
+from .rolling_metrics import RollingMetrics
+from .drawdown_analysis import DrawdownAnalysis, DrawdownEpisode
+from .bar_metrics import BarMetrics
+from .performance_record import PerformanceRecord
+from .performance_batch import PerformanceBatch
@@ -0,0 +1,43 @@
+from typing import Optional
+
+
+class BarMetrics:
+    """
+    日内逐根(bar)权益曲线的绩效。
+
+    max_drawdown 与 max_drawdown_duration_bars 按每根 bar 的盯市权益计算，
+    max_drawdown_session 为最大回撤最低点所在的交易日(无回撤时为 None)；
+    sharpe_ratio 基于相邻 bar 的权益变化。
+    """
+
+    __slots__ = (
+        "bars",
+        "sessions",
+        "max_drawdown",
+        "max_drawdown_session",
+        "max_drawdown_duration_bars",
+        "sharpe_ratio",
+    )
+
+    def __init__(
+        self,
+        bars: int,
+        sessions: int,
+        max_drawdown: float,
+        max_drawdown_session: Optional[int],
+        max_drawdown_duration_bars: int,
+        sharpe_ratio: float,
+    ):
+        self.bars = bars
+        self.sessions = sessions
+        self.max_drawdown = max_drawdown
+        self.max_drawdown_session = max_drawdown_session
+        self.max_drawdown_duration_bars = max_drawdown_duration_bars
+        self.sharpe_ratio = sharpe_ratio
+
+    def __len__(self) -> int:
+        return self.bars
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"BarMetrics({fields})"
@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import Any, ClassVar, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+class FrozenModel(BaseModel):
+    """
+    冻结模型基类。
+
+    派生属性使用 cached_property，首次访问后缓存在实例上；
+    model_copy(update=...) 会丢弃缓存，避免复制出的实例沿用旧值。
+    """
+
+    model_config = {"frozen": True}
+
+    _cached_names: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._cached_names = tuple(
+            name
+            for klass in cls.__mro__
+            for name, attr in vars(klass).items()
+            if isinstance(attr, cached_property)
+        )
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in self._cached_names:
+                copied.__dict__.pop(name, None)
+        return copied
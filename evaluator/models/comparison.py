@@ -1,8 +1,12 @@
 from pydantic import BaseModel, Field
+from pydantic_core import core_schema
 from decimal import Decimal
-from typing import List
+from typing import Any, List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
 
 from .performance import Performance
+from .session_stats import SessionStats
 
 
 class SessionComparison(BaseModel):
@@ -25,6 +29,144 @@ class SessionComparison(BaseModel):
     drift_ratio: float = Field(description="|pnl_delta| / |first_pnl|")
 
 
+class SessionSummary(NamedTuple):
+    """逐日对比所需的交易日字段"""
+
+    session: int
+    profit_loss: Decimal
+    start_cash: Decimal
+    end_cash: Decimal
+    trade_count: int
+
+    @staticmethod
+    def of(session: SessionStats) -> "SessionSummary":
+        return SessionSummary(
+            session.session,
+            session.profit_loss,
+            session.start_cash,
+            session.end_cash,
+            len(session.end_positions),
+        )
+
+
+class SessionComparisonTable(Sequence):
+    """
+    按交易日对齐后的逐日对比结果(列式)。
+
+    各列为 NumPy 数组(浮点近似值)，便于向量化分析；按下标访问时才根据
+    对应的交易日摘要构建精确(Decimal)的 SessionComparison 并缓存。
+    """
+
+    def __init__(self, first: List[SessionStats], second: List[SessionStats]):
+        self._init_columns(
+            [SessionSummary.of(s) for s in first],
+            [SessionSummary.of(s) for s in second],
+        )
+
+    @classmethod
+    def from_summaries(cls, first: List["SessionSummary"], second: List["SessionSummary"]) -> "SessionComparisonTable":
+        """由已对齐的交易日摘要构建(不持有 SessionStats 及其持仓)"""
+        table = cls.__new__(cls)
+        table._init_columns(first, second)
+        return table
+
+    def _init_columns(self, first: List["SessionSummary"], second: List["SessionSummary"]):
+        self._first = first
+        self._second = second
+        self._items: List[Optional[SessionComparison]] = [None] * len(first)
+
+        n = len(first)
+        self.session = np.fromiter((s.session for s in first), dtype=np.int64, count=n)
+        self.first_pnl = np.fromiter((s.profit_loss for s in first), dtype=np.float64, count=n)
+        self.second_pnl = np.fromiter((s.profit_loss for s in second), dtype=np.float64, count=n)
+        first_start_cash = np.fromiter((s.start_cash for s in first), dtype=np.float64, count=n)
+        second_start_cash = np.fromiter((s.start_cash for s in second), dtype=np.float64, count=n)
+        self.first_trade_count = np.fromiter((s.trade_count for s in first), dtype=np.int64, count=n)
+        self.second_trade_count = np.fromiter((s.trade_count for s in second), dtype=np.int64, count=n)
+
+        self.first_pnl_pct = _safe_ratio(self.first_pnl * 100, first_start_cash)
+        self.second_pnl_pct = _safe_ratio(self.second_pnl * 100, second_start_cash)
+        self.pnl_delta = self.second_pnl - self.first_pnl
+        self.pnl_pct_delta = self.second_pnl_pct - self.first_pnl_pct
+        self.trade_count_delta = self.second_trade_count - self.first_trade_count
+        self.drift_ratio = _safe_ratio(self.pnl_delta, np.abs(self.first_pnl))
+
+    def __len__(self) -> int:
+        return len(self._first)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("session comparison index out of range")
+        item = self._items[index]
+        if item is None:
+            item = SessionComparisonTable._compare_summaries(self._first[index], self._second[index])
+            self._items[index] = item
+        return item
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SessionComparisonTable(sessions={len(self)})"
+
+    @staticmethod
+    def compare_pair(first: SessionStats, second: SessionStats) -> SessionComparison:
+        """对比同一交易日的两条 SessionStats"""
+        return SessionComparisonTable._compare_summaries(SessionSummary.of(first), SessionSummary.of(second))
+
+    @staticmethod
+    def _compare_summaries(first: "SessionSummary", second: "SessionSummary") -> SessionComparison:
+        first_pnl = first.profit_loss
+        second_pnl = second.profit_loss
+        pnl_delta = second_pnl - first_pnl
+
+        first_pnl_pct = float(first_pnl / first.start_cash * 100) if first.start_cash != 0 else 0.0
+        second_pnl_pct = float(second_pnl / second.start_cash * 100) if second.start_cash != 0 else 0.0
+
+        first_trade_count = first.trade_count
+        second_trade_count = second.trade_count
+
+        drift_ratio = float(pnl_delta / abs(first_pnl)) if first_pnl != 0 else 0.0
+
+        return SessionComparison(
+            session=first.session,
+            first_pnl=first_pnl,
+            first_pnl_pct=first_pnl_pct,
+            first_trade_count=first_trade_count,
+            first_end_cash=first.end_cash,
+            second_pnl=second_pnl,
+            second_pnl_pct=second_pnl_pct,
+            second_trade_count=second_trade_count,
+            second_end_cash=second.end_cash,
+            pnl_delta=pnl_delta,
+            pnl_pct_delta=second_pnl_pct - first_pnl_pct,
+            trade_count_delta=second_trade_count - first_trade_count,
+            drift_ratio=drift_ratio,
+        )
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> core_schema.CoreSchema:
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                list,
+                return_schema=core_schema.list_schema(handler.generate_schema(SessionComparison)),
+            ),
+        )
+
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    result = np.zeros_like(numerator, dtype=np.float64)
+    np.divide(numerator, denominator, out=result, where=denominator != 0)
+    return result
+
+
 class PerformanceComparison(BaseModel):
     first: Performance
     second: Performance
@@ -43,7 +185,7 @@ class PerformanceComparison(BaseModel):
         description="Overall drift: |delta| / |first| * 100"
     )
 
-    sessions: List[SessionComparison] = Field(default_factory=list)
+    sessions: Union[SessionComparisonTable, List[SessionComparison]] = Field(default_factory=list)
 
     total_sessions: int
     matched_sessions: int
@@ -0,0 +1,108 @@
+import heapq
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+
+class DrawdownEpisode(NamedTuple):
+    """
+    一次回撤：从峰值跌入水下到收复峰值。
+
+    peak_session 为 None 表示峰值是期初资金(第一个交易日即在水下)，
+    recovery_session 为 None 表示到序列结束仍未收复。
+    duration 为连续处于水下的交易日数。
+    """
+
+    peak_session: Optional[int]
+    trough_session: int
+    recovery_session: Optional[int]
+    peak_value: float
+    trough_value: float
+    depth: float
+    duration: int
+
+
+class DrawdownAnalysis:
+    """
+    权益序列的回撤分析结果。
+
+    underwater 与交易日一一对应，为权益减去此前最高权益(含期初资金)，不大于 0。
+    回撤按列保存：start 为第一个水下交易日的位置，end 为收复交易日的位置
+    (未收复时为交易日数)，trough 为最低点位置。
+    """
+
+    __slots__ = (
+        "session",
+        "underwater",
+        "start",
+        "trough",
+        "end",
+        "peak_value",
+        "depth",
+    )
+
+    def __init__(
+        self,
+        session: np.ndarray,
+        underwater: np.ndarray,
+        start: np.ndarray,
+        trough: np.ndarray,
+        end: np.ndarray,
+        peak_value: np.ndarray,
+        depth: np.ndarray,
+    ):
+        self.session = session
+        self.underwater = underwater
+        self.start = start
+        self.trough = trough
+        self.end = end
+        self.peak_value = peak_value
+        self.depth = depth
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @property
+    def duration(self) -> np.ndarray:
+        """每次回撤连续处于水下的交易日数"""
+        return self.end - self.start
+
+    @property
+    def max_drawdown(self) -> float:
+        return float(self.depth.max()) if len(self.depth) else 0.0
+
+    @property
+    def max_duration(self) -> int:
+        """最长水下持续交易日数(即 Performance.max_drawdown_duration_bars)"""
+        return int(self.duration.max()) if len(self.start) else 0
+
+    @property
+    def episodes(self) -> List[DrawdownEpisode]:
+        """按时间顺序的全部回撤"""
+        return [self.episode(i) for i in range(len(self))]
+
+    def episode(self, i: int) -> DrawdownEpisode:
+        start = int(self.start[i])
+        trough = int(self.trough[i])
+        end = int(self.end[i])
+        n = len(self.session)
+        return DrawdownEpisode(
+            peak_session=int(self.session[start - 1]) if start > 0 else None,
+            trough_session=int(self.session[trough]),
+            recovery_session=int(self.session[end]) if end < n else None,
+            peak_value=float(self.peak_value[i]),
+            trough_value=float(self.peak_value[i] - self.depth[i]),
+            depth=float(self.depth[i]),
+            duration=end - start,
+        )
+
+    def top(self, n: int, by: str = "depth") -> List[DrawdownEpisode]:
+        """按 depth 或 duration 最大的 n 次回撤(堆选择，并列时较早的在前)"""
+        if by == "depth":
+            keys = self.depth.tolist()
+        elif by == "duration":
+            keys = self.duration.tolist()
+        else:
+            raise ValueError(f"Unknown drawdown ranking {by!r}, expected 'depth' or 'duration'")
+        best = heapq.nlargest(n, range(len(keys)), key=lambda i: (keys[i], -i))
+        return [self.episode(i) for i in best]
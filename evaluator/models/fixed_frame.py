@@ -0,0 +1,156 @@
+from decimal import Decimal
+from typing import List
+
+import numpy as np
+
+from .session_stats import SessionStats
+from .session_frame import SessionFrame
+
+
+class FixedPointFrame:
+    """
+    以定点整数存储金额的列式交易日序列。
+
+    金额列为 int64，单位为 10 ** -decimals(decimals=2 即以"分"计)，
+    求和、回撤和盈亏比较都在整数数组上进行，结果是精确的；
+    只在组装最终 Performance 时通过 to_decimal 转换回 Decimal。
+
+    int64 在 decimals=2 时可表示约 9.2e16 的金额，超出范围的数据不应使用定点模式。
+    """
+
+    __slots__ = (
+        "session",
+        "start_cash",
+        "end_cash",
+        "end_market_value",
+        "commission",
+        "pnl",
+        "open_positions",
+        "decimals",
+    )
+
+    def __init__(
+        self,
+        session: np.ndarray,
+        start_cash: np.ndarray,
+        end_cash: np.ndarray,
+        end_market_value: np.ndarray,
+        commission: np.ndarray,
+        pnl: np.ndarray,
+        open_positions: np.ndarray,
+        decimals: int = 2,
+    ):
+        if decimals < 0:
+            raise ValueError(f"decimals must be non-negative, got {decimals}")
+        self.session = session
+        self.start_cash = start_cash
+        self.end_cash = end_cash
+        self.end_market_value = end_market_value
+        self.commission = commission
+        self.pnl = pnl
+        self.open_positions = open_positions
+        self.decimals = decimals
+
+    def __len__(self) -> int:
+        return len(self.session)
+
+    @property
+    def scale(self) -> int:
+        """每个货币单位对应的最小单位数"""
+        return 10 ** self.decimals
+
+    def slice(self, start: int, stop: int) -> "FixedPointFrame":
+        """第 start 到 stop-1 个交易日组成的子序列"""
+        return FixedPointFrame(
+            session=self.session[start:stop],
+            start_cash=self.start_cash[start:stop],
+            end_cash=self.end_cash[start:stop],
+            end_market_value=self.end_market_value[start:stop],
+            commission=self.commission[start:stop],
+            pnl=self.pnl[start:stop],
+            open_positions=self.open_positions[start:stop],
+            decimals=self.decimals,
+        )
+
+    @classmethod
+    def from_sessions(cls, sessions: List[SessionStats], decimals: int = 2) -> "FixedPointFrame":
+        """
+        从 SessionStats 列表构建。
+
+        金额必须能以 decimals 位小数精确表示，否则抛出 ValueError(不做舍入)。
+        """
+        n = len(sessions)
+        session = np.empty(n, dtype=np.int64)
+        start_cash = np.empty(n, dtype=np.int64)
+        end_cash = np.empty(n, dtype=np.int64)
+        end_market_value = np.empty(n, dtype=np.int64)
+        commission = np.empty(n, dtype=np.int64)
+        pnl = np.empty(n, dtype=np.int64)
+        open_positions = np.empty(n, dtype=np.int64)
+
+        for i, s in enumerate(sessions):
+            session[i] = s.session
+            start_cash[i] = _minor_units(s.start_cash, decimals)
+            end_cash[i] = _minor_units(s.end_cash, decimals)
+            end_market_value[i] = _minor_units(s.end_market_value, decimals)
+            commission[i] = _minor_units(s.total_commission, decimals)
+            pnl[i] = _minor_units(s.profit_loss, decimals)
+            open_positions[i] = len(s.end_positions)
+
+        return cls(
+            session=session,
+            start_cash=start_cash,
+            end_cash=end_cash,
+            end_market_value=end_market_value,
+            commission=commission,
+            pnl=pnl,
+            open_positions=open_positions,
+            decimals=decimals,
+        )
+
+    @staticmethod
+    def check_exact(session: SessionStats, decimals: int = 2):
+        """校验单个交易日的金额能以 decimals 位小数精确表示(与 from_sessions 相同)，否则抛出 ValueError"""
+        for value in (
+            session.start_cash,
+            session.end_cash,
+            session.end_market_value,
+            session.total_commission,
+            session.profit_loss,
+        ):
+            _minor_units(value, decimals)
+
+    @classmethod
+    def from_frame(cls, frame: SessionFrame, decimals: int = 2) -> "FixedPointFrame":
+        """
+        由 float64 的 SessionFrame 转换(按最小单位四舍五入)。
+
+        适用于 SessionArchive / SessionLoader 得到的列，金额本身应为 decimals 位小数。
+        """
+        scale = 10 ** decimals
+
+        def to_minor(values: np.ndarray) -> np.ndarray:
+            return np.rint(np.asarray(values, dtype=np.float64) * scale).astype(np.int64)
+
+        return cls(
+            session=np.asarray(frame.session, dtype=np.int64),
+            start_cash=to_minor(frame.start_cash),
+            end_cash=to_minor(frame.end_cash),
+            end_market_value=to_minor(frame.end_market_value),
+            commission=to_minor(frame.commission),
+            pnl=to_minor(frame.pnl),
+            open_positions=frame.position_counts.astype(np.int64),
+            decimals=decimals,
+        )
+
+    def to_decimal(self, value: int) -> Decimal:
+        """把最小单位的整数金额精确转换为 Decimal"""
+        return Decimal(int(value)).scaleb(-self.decimals)
+
+
+def _minor_units(value: Decimal, decimals: int) -> int:
+    scaled = Decimal(value).scaleb(decimals)
+    units = int(scaled)
+    if units != scaled:
+        raise ValueError(f"Amount {value} is not representable with {decimals} decimal places")
+    return units
@@ -0,0 +1,144 @@
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .performance import Performance
+from .performance_record import PerformanceRecord
+from .session_frame import SessionFrame
+
+_DTYPES = {
+    name: np.int64 if info.annotation is int else np.float64
+    for name, info in Performance.model_fields.items()
+}
+_DECIMAL_FIELDS = frozenset(name for name, info in Performance.model_fields.items() if info.annotation is Decimal)
+
+SortKey = Union[str, Tuple[str, bool]]
+
+
+class PerformanceBatch:
+    """
+    多组绩效的列式容器。
+
+    每个 Performance 字段保存为一列 NumPy 数组(Decimal 字段转为 float64)，
+    可选的 labels 标识每一行(如策略名)。过滤、排序、top-k 和排名均为向量化操作，
+    返回新的批次或数组，不修改原批次。
+
+    排序键为字段名或 (字段名, descending) 元组，字段名默认按降序；
+    多个键按先后顺序依次比较，NaN 总是排在最后。
+    """
+
+    __slots__ = ("columns", "labels")
+
+    def __init__(self, columns: Dict[str, np.ndarray], labels: Optional[np.ndarray] = None):
+        self.columns = columns
+        n = len(next(iter(columns.values()))) if columns else 0
+        self.labels = labels if labels is not None else np.arange(n)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Sequence[Union[Performance, PerformanceRecord]],
+        labels: Optional[Sequence[Any]] = None,
+    ) -> "PerformanceBatch":
+        """由 Performance 或 PerformanceRecord 列表构建"""
+        n = len(results)
+        if labels is not None and len(labels) != n:
+            raise ValueError(f"Got {len(labels)} labels for {n} results")
+        columns = {
+            name: np.fromiter((getattr(r, name) for r in results), dtype=dtype, count=n)
+            for name, dtype in _DTYPES.items()
+        }
+        return cls(columns, np.asarray(labels) if labels is not None else None)
+
+    def take(self, indices: np.ndarray) -> "PerformanceBatch":
+        """按下标(或布尔掩码)选取行"""
+        return PerformanceBatch(
+            {name: column[indices] for name, column in self.columns.items()},
+            self.labels[indices],
+        )
+
+    def filter(self, mask: np.ndarray) -> "PerformanceBatch":
+        """保留 mask 为 True 的行，如 batch.filter(batch["sharpe_ratio"] > 1)"""
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (len(self),):
+            raise ValueError(f"Mask of shape {mask.shape} does not match batch of {len(self)} rows")
+        return self.take(mask)
+
+    def order(self, by: Union[SortKey, Sequence[SortKey]]) -> np.ndarray:
+        """按排序键得到的行下标(稳定排序)"""
+        keys = self._sort_keys(by)
+        # np.lexsort 以最后一个键为主键
+        return np.lexsort(keys[::-1]) if keys else np.arange(len(self))
+
+    def sort(self, by: Union[SortKey, Sequence[SortKey]]) -> "PerformanceBatch":
+        """按排序键排序后的新批次"""
+        return self.take(self.order(by))
+
+    def top_k(self, by: Union[SortKey, Sequence[SortKey]], k: int) -> "PerformanceBatch":
+        """
+        排序最靠前的 k 行(已排序)。
+
+        先用 np.partition 按主键找出第 k 名的值，只对不差于它的候选行(含并列)
+        做完整的多键排序，避免对整个批次排序。
+        """
+        n = len(self)
+        if k <= 0:
+            return self.take(np.empty(0, dtype=np.int64))
+        keys = self._sort_keys(by)
+        if k >= n:
+            return self.take(np.lexsort(keys[::-1]))
+
+        primary = keys[0]
+        threshold = np.partition(primary, k - 1)[k - 1]
+        if np.isnan(threshold):
+            candidates = np.arange(n)
+        else:
+            candidates = np.flatnonzero(primary <= threshold)
+        order = np.lexsort([key[candidates] for key in keys[::-1]])
+        return self.take(candidates[order[:k]])
+
+    def rank(self, by: Union[SortKey, Sequence[SortKey]]) -> np.ndarray:
+        """每行在排序键下的名次(从 1 开始，并列按原顺序先后)"""
+        ranks = np.empty(len(self), dtype=np.int64)
+        ranks[self.order(by)] = np.arange(1, len(self) + 1)
+        return ranks
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """导出为字典列表，每行包含 label 和全部字段(Python 标量)"""
+        names = list(self.columns)
+        values = [self.columns[name].tolist() for name in names]
+        labels = self.labels.tolist()
+        return [
+            {"label": label, **dict(zip(names, row))}
+            for label, row in zip(labels, zip(*values))
+        ]
+
+    def to_records(self) -> List[PerformanceRecord]:
+        """导出为 PerformanceRecord 列表(Decimal 字段按最短十进制表示还原)"""
+        records = []
+        for row in self.to_rows():
+            row.pop("label")
+            for name in _DECIMAL_FIELDS:
+                row[name] = SessionFrame.to_decimal(row[name])
+            records.append(PerformanceRecord(**row))
+        return records
+
+    def _sort_keys(self, by: Union[SortKey, Sequence[SortKey]]) -> List[np.ndarray]:
+        """把排序键转换为"越小越靠前"的 float64 数组列表"""
+        if isinstance(by, str) or (isinstance(by, tuple) and len(by) == 2 and isinstance(by[1], bool)):
+            by = [by]
+        keys = []
+        for key in by:
+            name, descending = (key, True) if isinstance(key, str) else key
+            if name not in self.columns:
+                raise KeyError(f"Unknown Performance field {name!r}")
+            column = self.columns[name].astype(np.float64)
+            keys.append(-column if descending else column)
+        return keys
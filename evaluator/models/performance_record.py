@@ -0,0 +1,62 @@
+from dataclasses import asdict, dataclass, fields
+from decimal import Decimal
+from typing import Any, Dict
+
+from .performance import Performance
+
+
+@dataclass(slots=True, kw_only=True)
+class PerformanceRecord:
+    """
+    Performance 的轻量表示。
+
+    字段与 Performance 相同，以 __slots__ 保存且不做校验，适合批量评估时由
+    计算器直接输出；需要完整模型时调用 to_performance 转换。
+    """
+
+    total_trades: int
+    open_positions: int = 0
+    winning_trades: int
+    losing_trades: int
+    win_rate: float
+    net_profit: Decimal
+    net_profit_pct: float
+    max_drawdown: Decimal
+    sharpe_ratio: float
+    final_value: Decimal
+    initial_cash: Decimal
+    total_commission: Decimal = Decimal("0")
+    max_single_win: Decimal = Decimal("0")
+    max_single_loss: Decimal = Decimal("0")
+    max_single_win_pct: float = 0.0
+    max_single_loss_pct: float = 0.0
+    avg_win: Decimal = Decimal("0")
+    avg_loss: Decimal = Decimal("0")
+    avg_win_pct: float = 0.0
+    avg_loss_pct: float = 0.0
+    odds_ratio: float = 0.0
+    total_win: Decimal = Decimal("0")
+    total_loss: Decimal = Decimal("0")
+    max_drawdown_duration_bars: int = 0
+    commission_loss_pct: float = 0.0
+    top_1pct_win_pct: float = 0.0
+    top_5pct_win_pct: float = 0.0
+    top_10pct_win_pct: float = 0.0
+    top_20pct_win_pct: float = 0.0
+    top_1pct_loss_pct: float = 0.0
+    top_5pct_loss_pct: float = 0.0
+    top_10pct_loss_pct: float = 0.0
+    top_20pct_loss_pct: float = 0.0
+    sortino_ratio: float = 0.0
+    calmar_ratio: float = 0.0
+
+    @classmethod
+    def from_performance(cls, performance: Performance) -> "PerformanceRecord":
+        return cls(**{f.name: getattr(performance, f.name) for f in fields(cls)})
+
+    def to_performance(self) -> Performance:
+        """转换为(经校验的) Performance 模型"""
+        return Performance(**self.as_dict())
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
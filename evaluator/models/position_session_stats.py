@@ -1,9 +1,12 @@
-from pydantic import BaseModel, Field, computed_field
+from pydantic import Field, computed_field
 from decimal import Decimal
+from functools import cached_property
 from typing import Optional
 
+from .base import FrozenModel
 
-class PositionSessionStats(BaseModel):
+
+class PositionSessionStats(FrozenModel):
     """
     表示单个持仓标的在单个交易日的绩效数据。
     """
@@ -24,13 +27,13 @@ class PositionSessionStats(BaseModel):
     model_config = {"frozen": True}
 
     @computed_field
-    @property
+    @cached_property
     def profit_loss(self) -> Decimal:
         """盈亏金额 = 已实现盈亏"""
         return self.realized_profit
 
     @computed_field
-    @property
+    @cached_property
     def profit_loss_ratio(self) -> Decimal:
         """盈亏比例 = 盈亏金额 / 期初市值"""
         if self.start_value == 0:
@@ -38,7 +41,7 @@ class PositionSessionStats(BaseModel):
         return self.profit_loss / self.start_value
 
     @computed_field
-    @property
+    @cached_property
     def market_value(self) -> Optional[Decimal]:
         """期末市值 = 期末持仓量 * 期末市价(仅当有市价时可用)"""
         if self.end_market_price is None:
@@ -46,7 +49,7 @@ class PositionSessionStats(BaseModel):
         return self.end_volume * self.end_market_price
 
     @computed_field
-    @property
+    @cached_property
     def average_price(self) -> Optional[Decimal]:
         """持仓均价 = (期初市值 + 净现金流) / 期初持仓量"""
         if self.start_volume == 0:
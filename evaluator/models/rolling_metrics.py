@@ -0,0 +1,44 @@
+import numpy as np
+
+
+class RollingMetrics:
+    """
+    滚动窗口绩效序列。
+
+    每个数组与输入交易日一一对应，第 i 个值为以第 i 个交易日结尾、
+    长度为 window 的窗口的指标；不足 min_periods 个交易日的位置为 NaN。
+    """
+
+    __slots__ = (
+        "window",
+        "min_periods",
+        "session",
+        "sharpe_ratio",
+        "sortino_ratio",
+        "win_rate",
+        "net_profit",
+        "max_drawdown",
+    )
+
+    def __init__(
+        self,
+        window: int,
+        min_periods: int,
+        session: np.ndarray,
+        sharpe_ratio: np.ndarray,
+        sortino_ratio: np.ndarray,
+        win_rate: np.ndarray,
+        net_profit: np.ndarray,
+        max_drawdown: np.ndarray,
+    ):
+        self.window = window
+        self.min_periods = min_periods
+        self.session = session
+        self.sharpe_ratio = sharpe_ratio
+        self.sortino_ratio = sortino_ratio
+        self.win_rate = win_rate
+        self.net_profit = net_profit
+        self.max_drawdown = max_drawdown
+
+    def __len__(self) -> int:
+        return len(self.session)
@@ -0,0 +1,210 @@
+from decimal import Decimal
+from typing import List, Optional
+
+import numpy as np
+
+from .session_stats import SessionStats
+
+
+class SessionFrame:
+    """
+    列式存储的交易日序列。
+
+    账户级字段按列保存为 NumPy 数组，期末持仓展平为一张持仓表，
+    通过 ``position_offsets`` 定位每个交易日对应的持仓区间。
+    """
+
+    __slots__ = (
+        "session",
+        "start_cash",
+        "end_cash",
+        "end_market_value",
+        "commission",
+        "pnl",
+        "position_offsets",
+        "position_symbol",
+        "position_start_value",
+        "position_end_value",
+        "position_end_volume",
+        "position_realized_profit",
+        "position_commission",
+        "position_trade_count",
+        "symbols",
+    )
+
+    def __init__(
+        self,
+        session: np.ndarray,
+        start_cash: np.ndarray,
+        end_cash: np.ndarray,
+        end_market_value: np.ndarray,
+        commission: np.ndarray,
+        pnl: np.ndarray,
+        position_offsets: Optional[np.ndarray] = None,
+        position_symbol: Optional[np.ndarray] = None,
+        position_start_value: Optional[np.ndarray] = None,
+        position_end_value: Optional[np.ndarray] = None,
+        position_end_volume: Optional[np.ndarray] = None,
+        position_realized_profit: Optional[np.ndarray] = None,
+        position_commission: Optional[np.ndarray] = None,
+        position_trade_count: Optional[np.ndarray] = None,
+        symbols: Optional[List[str]] = None,
+    ):
+        n = len(session)
+        self.session = session
+        self.start_cash = start_cash
+        self.end_cash = end_cash
+        self.end_market_value = end_market_value
+        self.commission = commission
+        self.pnl = pnl
+        self.position_offsets = (
+            position_offsets if position_offsets is not None else np.zeros(n + 1, dtype=np.int64)
+        )
+        self.position_symbol = _column(position_symbol, np.int32)
+        self.position_start_value = _column(position_start_value, np.float64)
+        self.position_end_value = _column(position_end_value, np.float64)
+        self.position_end_volume = _column(position_end_volume, np.int64)
+        self.position_realized_profit = _column(position_realized_profit, np.float64)
+        self.position_commission = _column(position_commission, np.float64)
+        self.position_trade_count = _column(position_trade_count, np.int64)
+        self.symbols = symbols if symbols is not None else []
+
+    def __len__(self) -> int:
+        return len(self.session)
+
+    @property
+    def position_counts(self) -> np.ndarray:
+        """每个交易日的期末持仓数"""
+        return np.diff(self.position_offsets)
+
+    def slice(self, start: int, stop: int) -> "SessionFrame":
+        """第 start 到 stop-1 个交易日组成的子序列(持仓表同步截取)"""
+        lo = int(self.position_offsets[start])
+        hi = int(self.position_offsets[stop])
+        return SessionFrame(
+            session=self.session[start:stop],
+            start_cash=self.start_cash[start:stop],
+            end_cash=self.end_cash[start:stop],
+            end_market_value=self.end_market_value[start:stop],
+            commission=self.commission[start:stop],
+            pnl=self.pnl[start:stop],
+            position_offsets=self.position_offsets[start:stop + 1] - lo,
+            position_symbol=self.position_symbol[lo:hi],
+            position_start_value=self.position_start_value[lo:hi],
+            position_end_value=self.position_end_value[lo:hi],
+            position_end_volume=self.position_end_volume[lo:hi],
+            position_realized_profit=self.position_realized_profit[lo:hi],
+            position_commission=self.position_commission[lo:hi],
+            position_trade_count=self.position_trade_count[lo:hi],
+            symbols=self.symbols,
+        )
+
+    @classmethod
+    def from_sessions(cls, sessions: List[SessionStats], positions: bool = True) -> "SessionFrame":
+        """
+        从 SessionStats 列表构建，每个交易日的派生字段只计算一次。
+
+        positions 为 False 时只构建账户列，持仓表为空，position_offsets 仍记录每个交易日的
+        期末持仓数(账户绩效只用到持仓数)。
+        """
+        if not positions:
+            return cls._account_columns(sessions)
+        n = len(sessions)
+        session = np.empty(n, dtype=np.int64)
+        start_cash = np.empty(n, dtype=np.float64)
+        end_cash = np.empty(n, dtype=np.float64)
+        end_market_value = np.empty(n, dtype=np.float64)
+        commission = np.empty(n, dtype=np.float64)
+        pnl = np.empty(n, dtype=np.float64)
+        position_offsets = np.zeros(n + 1, dtype=np.int64)
+
+        symbol_codes = {}
+        pos_symbol = []
+        pos_start_value = []
+        pos_end_value = []
+        pos_end_volume = []
+        pos_realized_profit = []
+        pos_commission = []
+        pos_trade_count = []
+
+        for i, s in enumerate(sessions):
+            session[i] = s.session
+            start_cash[i] = s.start_cash
+            end_cash[i] = s.end_cash
+            end_market_value[i] = s.end_market_value
+            commission[i] = s.total_commission
+            pnl[i] = s.profit_loss
+
+            for p in s.end_positions:
+                code = symbol_codes.get(p.symbol)
+                if code is None:
+                    code = len(symbol_codes)
+                    symbol_codes[p.symbol] = code
+                pos_symbol.append(code)
+                pos_start_value.append(float(p.start_value))
+                pos_end_value.append(float(p.end_value))
+                pos_end_volume.append(p.end_volume)
+                pos_realized_profit.append(float(p.realized_profit))
+                pos_commission.append(float(p.commission))
+                pos_trade_count.append(p.trade_count)
+            position_offsets[i + 1] = len(pos_symbol)
+
+        return cls(
+            session=session,
+            start_cash=start_cash,
+            end_cash=end_cash,
+            end_market_value=end_market_value,
+            commission=commission,
+            pnl=pnl,
+            position_offsets=position_offsets,
+            position_symbol=np.array(pos_symbol, dtype=np.int32),
+            position_start_value=np.array(pos_start_value, dtype=np.float64),
+            position_end_value=np.array(pos_end_value, dtype=np.float64),
+            position_end_volume=np.array(pos_end_volume, dtype=np.int64),
+            position_realized_profit=np.array(pos_realized_profit, dtype=np.float64),
+            position_commission=np.array(pos_commission, dtype=np.float64),
+            position_trade_count=np.array(pos_trade_count, dtype=np.int64),
+            symbols=list(symbol_codes),
+        )
+
+    @classmethod
+    def _account_columns(cls, sessions: List[SessionStats]) -> "SessionFrame":
+        n = len(sessions)
+        session = np.empty(n, dtype=np.int64)
+        start_cash = np.empty(n, dtype=np.float64)
+        end_cash = np.empty(n, dtype=np.float64)
+        end_market_value = np.empty(n, dtype=np.float64)
+        commission = np.empty(n, dtype=np.float64)
+        pnl = np.empty(n, dtype=np.float64)
+        position_offsets = np.zeros(n + 1, dtype=np.int64)
+
+        for i, s in enumerate(sessions):
+            session[i] = s.session
+            start_cash[i] = s.start_cash
+            end_cash[i] = s.end_cash
+            end_market_value[i] = s.end_market_value
+            commission[i] = s.total_commission
+            pnl[i] = s.profit_loss
+            position_offsets[i + 1] = len(s.end_positions)
+        np.cumsum(position_offsets, out=position_offsets)
+
+        return cls(
+            session=session,
+            start_cash=start_cash,
+            end_cash=end_cash,
+            end_market_value=end_market_value,
+            commission=commission,
+            pnl=pnl,
+            position_offsets=position_offsets,
+        )
+
+    @staticmethod
+    def to_decimal(value: float) -> Decimal:
+        """把列中的浮点金额转换回 Decimal(按最短十进制表示)"""
+        return Decimal(repr(float(value)))
+
+
+def _column(values: Optional[np.ndarray], dtype) -> np.ndarray:
+    if values is None:
+        return np.empty(0, dtype=dtype)
+    return values
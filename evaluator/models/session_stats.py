@@ -1,11 +1,16 @@
-from pydantic import BaseModel, Field, computed_field
+import hashlib
+
+from pydantic import Field, computed_field
 from decimal import Decimal
+from functools import cached_property
+from itertools import chain
 from typing import List, Dict, Any
 
+from .base import FrozenModel
 from .position_session_stats import PositionSessionStats
 
 
-class SessionStats(BaseModel):
+class SessionStats(FrozenModel):
     """
     表示账户在单个交易日的绩效数据。
     """
@@ -20,37 +25,37 @@ class SessionStats(BaseModel):
     model_config = {"frozen": True}
 
     @computed_field
-    @property
+    @cached_property
     def total_commission(self) -> Decimal:
         """总手续费 = 所有持仓的手续费总和"""
         return sum(
             p.commission
-            for p in self.start_positions + self.end_positions
+            for p in chain(self.start_positions, self.end_positions)
         )
 
     @computed_field
-    @property
+    @cached_property
     def total_net_cashflow(self) -> Decimal:
         """总净现金流 = 所有持仓的净现金流总和"""
         return sum(
             p.net_cashflow
-            for p in self.start_positions + self.end_positions
+            for p in chain(self.start_positions, self.end_positions)
         )
 
     @computed_field
-    @property
+    @cached_property
     def computed_end_cash(self) -> Decimal:
         """计算的期末现金 = 期初现金 + 总净现金流 - 总手续费"""
         return self.start_cash + self.total_net_cashflow - self.total_commission
 
     @computed_field
-    @property
+    @cached_property
     def effective_end_cash(self) -> Decimal:
         """有效期末现金 = 如果传入的end_cash非0则使用，否则用计算的"""
         return self.end_cash if self.end_cash != Decimal("0") else self.computed_end_cash
 
     @computed_field
-    @property
+    @cached_property
     def start_market_value(self) -> Decimal:
         """期初市值 = 期初现金 + 期初持仓市值"""
         positions_value = Decimal("0")
@@ -60,7 +65,7 @@ class SessionStats(BaseModel):
         return self.start_cash + positions_value
 
     @computed_field
-    @property
+    @cached_property
     def end_market_value(self) -> Decimal:
         """期末市值 = 期末现金 + 期末持仓市值(如果有市价)"""
         positions_value = Decimal("0")
@@ -72,13 +77,13 @@ class SessionStats(BaseModel):
         return self.effective_end_cash + positions_value
 
     @computed_field
-    @property
+    @cached_property
     def profit_loss(self) -> Decimal:
         """盈亏金额 = 期末市值 - 期初市值"""
         return self.end_market_value - self.start_market_value
 
     @computed_field
-    @property
+    @cached_property
     def profit_loss_ratio(self) -> Decimal:
         """盈亏比例 = 盈亏金额 / 期初资金"""
         if self.start_cash == 0:
@@ -86,13 +91,30 @@ class SessionStats(BaseModel):
         return self.profit_loss / self.start_cash
 
     @computed_field
-    @property
+    @cached_property
     def cash_pnl(self) -> Decimal:
         """现金盈亏 = 期末现金 - 期初现金"""
         return self.end_cash - self.start_cash
 
     @computed_field
-    @property
+    @cached_property
     def realized_pnl(self) -> Decimal:
         """已实现盈亏 = 总净现金流"""
         return self.total_net_cashflow
+
+    @cached_property
+    def digest(self) -> bytes:
+        """
+        内容摘要(16 字节 blake2b)，用于缓存键和 SessionFingerprint。
+
+        对参与绩效计算的全部字段(不含 trades)做规范编码：各字段的 str 以 \x1f 分隔，
+        先写期初持仓数量，再依次写期初、期末持仓的全部字段。
+        """
+        parts = [str(self.session), str(self.start_cash), str(self.end_cash), str(len(self.start_positions))]
+        for p in chain(self.start_positions, self.end_positions):
+            values = p.__dict__
+            parts.extend([str(values[name]) for name in _POSITION_FIELDS])
+        return hashlib.blake2b("\x1f".join(parts).encode(), digest_size=16).digest()
+
+
+_POSITION_FIELDS = tuple(PositionSessionStats.model_fields)
@@ -0,0 +1,408 @@
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .instrumentation import NO_TIMINGS, StageTimings
+from .models.performance import Performance
+from .models.session_frame import SessionFrame
+from .models.session_stats import SessionStats
+from .calculators import PerformanceCalculator, RatioCalculator
+from .calculators.calculator import TOP_CONTRIBUTION_CUT_POINTS
+from .calculators.drawdown import DrawdownSegment
+
+# 线段树节点: (count, mean, m2, max_pnl, min_pnl, peak, trough, max_drawdown)
+_IDENTITY = (0, 0.0, 0.0, -math.inf, math.inf, -math.inf, math.inf, 0.0)
+
+
+class SessionIndex:
+    """
+    交易日序列的区间查询索引。
+
+    预先计算手续费、盈亏分类计数与金额的前缀和，以及一棵线段树，
+    节点合并收益矩(Chan 公式)、最大/最小单日盈亏和回撤摘要(峰值、谷值、最大回撤)，
+    并保存节点内(按节点自身峰值)的最长水下天数和末尾水下天数。
+    前 N% 贡献度由按盈亏值建立的小波矩阵得到区间内前 k 大(亏损为前 k 小)盈亏之和。
+
+    任意子区间的全部字段都不需要重新扫描区间：计数、金额、收益矩、比率和最大回撤为 O(log n)，
+    回撤持续时间在覆盖区间的 O(log n) 个节点上按此前峰值向下查找段首水下天数，为 O(log² n)，
+    前 N% 贡献度为 O(log σ)(σ 为不同盈亏值的个数)。结果与对该区间切片调用
+    compute_frame_performance 一致(浮点精度内)。
+    """
+
+    def __init__(self, frame: SessionFrame):
+        if len(frame) > 1 and np.any(np.diff(frame.session) <= 0):
+            raise ValueError("SessionIndex requires strictly increasing session ids")
+
+        self.frame = frame
+        n = len(frame)
+        pnls = frame.pnl.astype(np.float64, copy=False)
+        wins = np.where(pnls > 0, pnls, 0.0)
+        losses = np.where(pnls < 0, pnls, 0.0)
+
+        self._commission = _prefix(frame.commission)
+        self._winning_trades = _prefix(pnls > 0, dtype=np.int64)
+        self._losing_trades = _prefix(pnls < 0, dtype=np.int64)
+        self._total_win = _prefix(wins)
+        self._total_loss = _prefix(losses)
+        self._downside_sumsq = _prefix(losses * losses)
+
+        # 每个位置起(含)第一个有期初现金的交易日，用于区间首日盈亏调整
+        funded = np.where(frame.start_cash > 0, np.arange(n), n)
+        self._next_funded = np.minimum.accumulate(funded[::-1])[::-1] if n else funded
+
+        self._size = 1 << max(n - 1, 0).bit_length()
+        self._tree, self._run, self._tail = _build_tree(pnls, frame.end_market_value, self._size)
+        self._ranked = _WaveletMatrix(pnls)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @classmethod
+    def from_sessions(cls, sessions: List[SessionStats]) -> "SessionIndex":
+        return cls(SessionFrame.from_sessions(sessions))
+
+    def locate(self, start: Optional[int] = None, end: Optional[int] = None) -> Tuple[int, int]:
+        """把交易日区间 [start, end](含两端，None 为不限)转换为位置区间 [lo, hi)"""
+        session = self.frame.session
+        lo = 0 if start is None else int(np.searchsorted(session, start, side="left"))
+        hi = len(session) if end is None else int(np.searchsorted(session, end, side="right"))
+        return lo, max(lo, hi)
+
+    def performance(
+        self,
+        risk_free_rate: float,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        timings: Optional[StageTimings] = None,
+    ) -> Performance:
+        """交易日区间 [start, end] 的账户绩效"""
+        lo, hi = self.locate(start, end)
+        if lo == hi:
+            clock = timings.start() if timings is not None else NO_TIMINGS
+            performance = PerformanceCalculator._empty_account_performance()
+            clock.mark(StageTimings.MODEL_CONSTRUCTION)
+            return performance
+        return self.performance_at(lo, hi, risk_free_rate, timings)
+
+    def performance_at(
+        self,
+        lo: int,
+        hi: int,
+        risk_free_rate: float,
+        timings: Optional[StageTimings] = None,
+    ) -> Performance:
+        """位置区间 [lo, hi) 的账户绩效"""
+        clock = timings.start() if timings is not None else NO_TIMINGS
+        frame = self.frame
+        last = hi - 1
+
+        first_funded = int(self._next_funded[lo])
+        base_amount = float(frame.start_cash[first_funded]) if first_funded <= last else 0.0
+        first_pnl = float(frame.pnl[lo]) - base_amount + float(frame.start_cash[lo])
+        first_equity = float(frame.end_market_value[lo])
+
+        head = (1, first_pnl, 0.0, first_pnl, first_pnl, first_equity, first_equity, 0.0)
+        merged = _combine(head, self._query(lo + 1, hi))
+        count, mean_return, m2, max_pnl, min_pnl = merged[:5]
+        drawdown = DrawdownSegment(*merged[5:])
+        clock.mark(StageTimings.EQUITY_DRAWDOWN)
+
+        rest = lo + 1
+        winning_trades = int(self._winning_trades[hi] - self._winning_trades[rest]) + (first_pnl > 0)
+        losing_trades = int(self._losing_trades[hi] - self._losing_trades[rest]) + (first_pnl < 0)
+        total_win = float(self._total_win[hi] - self._total_win[rest]) + max(first_pnl, 0.0)
+        total_loss = float(self._total_loss[hi] - self._total_loss[rest]) + min(first_pnl, 0.0)
+        downside_sumsq = float(self._downside_sumsq[hi] - self._downside_sumsq[rest])
+        if first_pnl < 0:
+            downside_sumsq += first_pnl * first_pnl
+        clock.mark(StageTimings.PNL_CLASSIFICATION)
+
+        initial_cash = float(frame.end_cash[lo])
+        max_drawdown = drawdown.drawdown_from(initial_cash)
+
+        sharpe_ratio = RatioCalculator.sharpe_from_moments(mean_return, m2 / count, risk_free_rate)
+        sortino_ratio = (
+            RatioCalculator.sortino_from_moments(mean_return, downside_sumsq / losing_trades, risk_free_rate)
+            if losing_trades else 0.0
+        )
+        clock.mark(StageTimings.RATIOS)
+
+        total_win_amount = total_win if total_win > 0 else 0.0
+        total_loss_amount = abs(total_loss) if total_loss < 0 else 0.0
+        top_win_contributions = self._top_contributions(lo, hi, first_pnl, winning_trades, total_win_amount)
+        top_loss_contributions = self._top_contributions(
+            lo, hi, first_pnl, losing_trades, total_loss_amount, is_loss=True
+        )
+        clock.mark(StageTimings.TOP_CONTRIBUTIONS)
+
+        to_decimal = SessionFrame.to_decimal
+        performance = PerformanceCalculator._assemble_account_performance(
+            initial_cash=to_decimal(initial_cash),
+            final_value=to_decimal(frame.end_market_value[last]),
+            total_commission=to_decimal(self._commission[hi] - self._commission[lo]),
+            max_drawdown=to_decimal(max_drawdown),
+            winning_trades=winning_trades,
+            losing_trades=losing_trades,
+            total_win=to_decimal(total_win),
+            total_loss=to_decimal(total_loss),
+            max_single_win=to_decimal(max(max_pnl, 0.0)),
+            max_single_loss=to_decimal(min(min_pnl, 0.0)),
+            sharpe_ratio=sharpe_ratio,
+            sortino_ratio=sortino_ratio,
+            top_win_contributions=top_win_contributions,
+            top_loss_contributions=top_loss_contributions,
+            open_positions=int(frame.position_offsets[hi] - frame.position_offsets[last]),
+            max_drawdown_duration_bars=self._max_underwater_run(lo, hi, initial_cash),
+        )
+        clock.mark(StageTimings.MODEL_CONSTRUCTION)
+        return performance
+
+    def _top_contributions(
+        self,
+        lo: int,
+        hi: int,
+        first_pnl: float,
+        count: int,
+        total: float,
+        is_loss: bool = False,
+    ) -> List[float]:
+        """与 compute_top_contributions 相同的前 N% 贡献度，区间首日使用调整后的盈亏 first_pnl"""
+        if count == 0 or total == 0:
+            return [0.0 for _ in TOP_CONTRIBUTION_CUT_POINTS]
+        first_counts = first_pnl < 0 if is_loss else first_pnl > 0
+        contributions = []
+        for n_pct in TOP_CONTRIBUTION_CUT_POINTS:
+            k = max(1, int(count * n_pct / 100))
+            if not first_counts:
+                top, _ = self._ranked.extreme_sum(lo + 1, hi, k, largest=not is_loss)
+            else:
+                # 前 k 个 = max(其余的前 k 个, 其余的前 k-1 个 + 首日)，亏损取 min
+                rest_k = min(k, count - 1)
+                top, kth = self._ranked.extreme_sum(lo + 1, hi, rest_k, largest=not is_loss)
+                if rest_k < k:
+                    top += first_pnl
+                else:
+                    with_first = top - kth + first_pnl
+                    top = min(top, with_first) if is_loss else max(top, with_first)
+            contributions.append(abs(top) / total * 100)
+        return contributions
+
+    def _max_underwater_run(self, lo: int, hi: int, peak: float) -> int:
+        """位置区间 [lo, hi) 在期初峰值 peak 下的最长连续水下天数(按顺序折叠覆盖区间的节点)"""
+        tree = self._tree
+        best = 0
+        run = 0
+        for node in self._nodes(lo, hi):
+            count = tree[node][0]
+            lead = self._leading_underwater(node, peak)
+            best = max(best, self._run[node], run + lead)
+            run = run + count if lead == count else self._tail[node]
+            peak = max(peak, tree[node][5])
+        return best
+
+    def _leading_underwater(self, node: int, peak: float) -> int:
+        """节点内第一个权益不低于 peak 的位置(即此前峰值为 peak 时段首的水下天数)"""
+        tree = self._tree
+        if tree[node][5] < peak:
+            return tree[node][0]
+        offset = 0
+        width = self._size >> (node.bit_length() - 1)
+        while node < self._size:
+            node *= 2
+            width //= 2
+            if tree[node][5] < peak:
+                offset += width
+                node += 1
+        return offset
+
+    def _nodes(self, lo: int, hi: int) -> List[int]:
+        """按位置顺序覆盖区间 [lo, hi) 的线段树节点"""
+        left = []
+        right = []
+        lo += self._size
+        hi += self._size
+        while lo < hi:
+            if lo & 1:
+                left.append(lo)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right.append(hi)
+            lo >>= 1
+            hi >>= 1
+        return left + right[::-1]
+
+    def _query(self, lo: int, hi: int) -> tuple:
+        """线段树区间 [lo, hi) 的合并结果(保持顺序)"""
+        tree = self._tree
+        left = _IDENTITY
+        right = _IDENTITY
+        lo += self._size
+        hi += self._size
+        while lo < hi:
+            if lo & 1:
+                left = _combine(left, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right = _combine(tree[hi], right)
+            lo >>= 1
+            hi >>= 1
+        return _combine(left, right)
+
+
+def _prefix(values: np.ndarray, dtype=np.float64) -> np.ndarray:
+    prefix = np.zeros(len(values) + 1, dtype=dtype)
+    np.cumsum(values, out=prefix[1:])
+    return prefix
+
+
+def _combine(a: tuple, b: tuple) -> tuple:
+    count_a, mean_a, m2_a, max_a, min_a, peak_a, trough_a, mdd_a = a
+    count_b, mean_b, m2_b, max_b, min_b, peak_b, trough_b, mdd_b = b
+    count = count_a + count_b
+    if count_a == 0 or count_b == 0:
+        mean = mean_a if count_b == 0 else mean_b
+        m2 = m2_a + m2_b
+    else:
+        delta = mean_b - mean_a
+        mean = mean_a + delta * count_b / count
+        m2 = m2_a + m2_b + delta * delta * count_a * count_b / count
+    return (
+        count,
+        mean,
+        m2,
+        max(max_a, max_b),
+        min(min_a, min_b),
+        max(peak_a, peak_b),
+        min(trough_a, trough_b),
+        max(mdd_a, mdd_b, peak_a - trough_b),
+    )
+
+
+def _build_tree(pnls: np.ndarray, equities: np.ndarray, size: int) -> Tuple[List[tuple], List[int], List[int]]:
+    """
+    自底向上按层向量化构建线段树，返回节点元组列表，以及各节点内的最长水下天数和末尾水下天数。
+
+    节点内的水下以节点自身的峰值计(第一天不在水下)；合并时右子节点开头低于左子节点峰值的
+    交易日都在水下，其长度由右子树中第一个不低于该峰值的位置给出，按层同时向下查找。
+    """
+    n = len(pnls)
+    count = np.zeros(2 * size, dtype=np.int64)
+    mean = np.zeros(2 * size)
+    m2 = np.zeros(2 * size)
+    max_pnl = np.full(2 * size, -math.inf)
+    min_pnl = np.full(2 * size, math.inf)
+    peak = np.full(2 * size, -math.inf)
+    trough = np.full(2 * size, math.inf)
+    mdd = np.zeros(2 * size)
+    run = np.zeros(2 * size, dtype=np.int64)
+    tail = np.zeros(2 * size, dtype=np.int64)
+
+    count[size:size + n] = 1
+    mean[size:size + n] = pnls
+    max_pnl[size:size + n] = pnls
+    min_pnl[size:size + n] = pnls
+    peak[size:size + n] = equities
+    trough[size:size + n] = equities
+
+    width = size // 2
+    while width >= 1:
+        nodes = np.arange(width, 2 * width)
+        a = 2 * nodes
+        b = a + 1
+        total = count[a] + count[b]
+        delta = mean[b] - mean[a]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight = np.where(total > 0, count[b] / np.maximum(total, 1), 0.0)
+        mean[nodes] = mean[a] + delta * weight
+        m2[nodes] = m2[a] + m2[b] + delta * delta * count[a] * weight
+        count[nodes] = total
+        max_pnl[nodes] = np.maximum(max_pnl[a], max_pnl[b])
+        min_pnl[nodes] = np.minimum(min_pnl[a], min_pnl[b])
+        mdd[nodes] = np.maximum(np.maximum(mdd[a], mdd[b]), peak[a] - trough[b])
+
+        # 右子树中第一个不低于左子节点峰值的位置
+        target = peak[a]
+        node = b
+        offset = np.zeros(width, dtype=np.int64)
+        span = size // (2 * width)
+        while span > 1:
+            span //= 2
+            node = 2 * node
+            above = peak[node] >= target
+            offset += np.where(above, 0, span)
+            node = np.where(above, node, node + 1)
+        lead = np.where(peak[b] >= target, offset, count[b])
+        run[nodes] = np.maximum(np.maximum(run[a], run[b]), tail[a] + lead)
+        tail[nodes] = np.where(lead == count[b], tail[a] + count[b], tail[b])
+
+        peak[nodes] = np.maximum(peak[a], peak[b])
+        trough[nodes] = np.minimum(trough[a], trough[b])
+        width //= 2
+
+    tree = list(zip(count.tolist(), mean.tolist(), m2.tolist(), max_pnl.tolist(), min_pnl.tolist(),
+                    peak.tolist(), trough.tolist(), mdd.tolist()))
+    return tree, run.tolist(), tail.tolist()
+
+
+class _WaveletMatrix:
+    """
+    按值排名建立的小波矩阵，查询位置区间内前 k 大(或前 k 小)值之和。
+
+    每层按排名的一位把当前顺序稳定划分为 0/1 两部分，保存每层的 0 位前缀计数和划分后顺序的
+    值前缀和；查询从高位到低位逐层进入需要的一侧，另一侧整体计入，为 O(log σ)。
+    """
+
+    __slots__ = ("_levels", "_zeros", "_nzeros", "_sums", "_values")
+
+    def __init__(self, values: np.ndarray):
+        values = np.asarray(values, dtype=np.float64)
+        n = len(values)
+        distinct = np.unique(values)
+        ranks = np.searchsorted(distinct, values)
+        self._levels = max(len(distinct) - 1, 1).bit_length()
+        self._zeros: List[np.ndarray] = []
+        self._nzeros: List[int] = []
+        self._sums: List[np.ndarray] = []
+        for level in range(self._levels):
+            bits = (ranks >> (self._levels - 1 - level)) & 1
+            self._zeros.append(_prefix(bits == 0, dtype=np.int64))
+            self._nzeros.append(n - int(bits.sum()))
+            order = np.argsort(bits, kind="stable")
+            ranks = ranks[order]
+            values = values[order]
+            self._sums.append(_prefix(values))
+        self._values = values
+
+    def extreme_sum(self, lo: int, hi: int, k: int, largest: bool = True) -> Tuple[float, float]:
+        """位置区间 [lo, hi) 内前 k 大(largest=False 时为前 k 小)值之和，以及第 k 个值"""
+        if k <= 0:
+            return 0.0, 0.0
+        total = 0.0
+        for level in range(self._levels):
+            zeros = self._zeros[level]
+            lo0 = int(zeros[lo])
+            hi0 = int(zeros[hi])
+            lo1 = self._nzeros[level] + lo - lo0
+            hi1 = self._nzeros[level] + hi - hi0
+            sums = self._sums[level]
+            if largest:
+                ones = hi1 - lo1
+                if k <= ones:
+                    lo, hi = lo1, hi1
+                else:
+                    total += float(sums[hi1] - sums[lo1])
+                    k -= ones
+                    lo, hi = lo0, hi0
+            else:
+                if k <= hi0 - lo0:
+                    lo, hi = lo0, hi0
+                else:
+                    total += float(sums[hi0] - sums[lo0])
+                    k -= hi0 - lo0
+                    lo, hi = lo1, hi1
+        # 最后一层区间内的值都相同
+        kth = float(self._values[lo])
+        return total + k * kth, kth
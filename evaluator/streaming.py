@@ -0,0 +1,151 @@
+import copy
+from decimal import Decimal
+from typing import Optional, Tuple
+
+from .models.performance import Performance
+from .models.session_stats import SessionStats
+from .calculators import PerformanceCalculator, RatioCalculator
+from .calculators.accumulators import RunningMoments, TopContributionTracker
+
+
+class StreamingEvaluator:
+    """
+    增量账户绩效评估器。
+
+    每次 push 一个新收盘的交易日，以 O(1)(贡献度分位为 O(log n))更新峰值、回撤、
+    盈亏统计和夏普/索提诺所需的矩，结果与对同一前缀调用
+    compute_account_performance 一致(比率在浮点精度内)。
+    """
+
+    def __init__(self, risk_free_rate: float = 0.03):
+        self._risk_free_rate = risk_free_rate
+
+        self._count = 0
+        self._base_amount: Optional[Decimal] = None
+        self._pending_first: Optional[Tuple[Decimal, Decimal]] = None
+
+        self._initial_cash = Decimal("0")
+        self._final_value = Decimal("0")
+        self._peak = Decimal("0")
+        self._max_drawdown = Decimal("0")
+        self._underwater_bars = 0
+        self._max_drawdown_duration_bars = 0
+        self._total_commission = Decimal("0")
+        self._open_positions = 0
+
+        self._winning_trades = 0
+        self._losing_trades = 0
+        self._total_win = Decimal("0")
+        self._total_loss = Decimal("0")
+        self._max_single_win = Decimal("0")
+        self._max_single_loss = Decimal("0")
+
+        self._moments = RunningMoments()
+        self._top_wins = TopContributionTracker()
+        self._top_losses = TopContributionTracker()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def push(self, session: SessionStats) -> Performance:
+        """加入一个交易日并返回截至该交易日的绩效"""
+        self.add(session)
+        return self.performance()
+
+    def add(self, session: SessionStats):
+        """加入一个交易日(不生成 Performance)"""
+        equity = session.end_market_value
+        pnl = session.profit_loss
+
+        if self._count == 0:
+            self._initial_cash = session.end_cash
+            self._peak = session.end_cash
+        self._count += 1
+
+        self._final_value = equity
+        self._open_positions = len(session.end_positions)
+        self._total_commission += session.total_commission
+
+        if equity > self._peak:
+            self._peak = equity
+        drawdown = self._peak - equity
+        if drawdown > self._max_drawdown:
+            self._max_drawdown = drawdown
+        if drawdown > 0:
+            self._underwater_bars += 1
+            if self._underwater_bars > self._max_drawdown_duration_bars:
+                self._max_drawdown_duration_bars = self._underwater_bars
+        else:
+            self._underwater_bars = 0
+
+        if self._base_amount is None and session.start_cash > 0:
+            self._base_amount = session.start_cash
+            if self._pending_first is not None:
+                first_pnl, first_start_cash = self._pending_first
+                self._pending_first = None
+                self._fold(first_pnl - self._base_amount + first_start_cash)
+
+        if self._count == 1 and self._base_amount is None:
+            # 首个交易日的盈亏需按之后第一个有期初现金的交易日调整，先挂起
+            self._pending_first = (pnl, session.start_cash)
+            return
+
+        self._fold(pnl)
+
+    def performance(self) -> Performance:
+        """当前前缀的账户绩效"""
+        if self._count == 0:
+            return PerformanceCalculator._empty_account_performance()
+
+        if self._pending_first is not None:
+            # 尚未出现有期初现金的交易日，按基数 0 调整首日盈亏(仅在该退化情形下复制状态)
+            snapshot = copy.deepcopy(self)
+            first_pnl, first_start_cash = snapshot._pending_first
+            snapshot._pending_first = None
+            snapshot._fold(first_pnl + first_start_cash)
+            return snapshot.performance()
+
+        moments = self._moments
+        sharpe_ratio = RatioCalculator.sharpe_from_moments(moments.mean, moments.variance, self._risk_free_rate)
+        sortino_ratio = (
+            RatioCalculator.sortino_from_moments(moments.mean, moments.downside_variance, self._risk_free_rate)
+            if moments.downside_count else 0.0
+        )
+
+        total_win_amount = float(self._total_win) if self._total_win > 0 else 0.0
+        total_loss_amount = float(abs(self._total_loss)) if self._total_loss < 0 else 0.0
+
+        return PerformanceCalculator._assemble_account_performance(
+            initial_cash=self._initial_cash,
+            final_value=self._final_value,
+            total_commission=self._total_commission,
+            max_drawdown=self._max_drawdown,
+            winning_trades=self._winning_trades,
+            losing_trades=self._losing_trades,
+            total_win=self._total_win,
+            total_loss=self._total_loss,
+            max_single_win=self._max_single_win,
+            max_single_loss=self._max_single_loss,
+            sharpe_ratio=sharpe_ratio,
+            sortino_ratio=sortino_ratio,
+            top_win_contributions=self._top_wins.contributions(total_win_amount),
+            top_loss_contributions=self._top_losses.contributions(total_loss_amount),
+            open_positions=self._open_positions,
+            max_drawdown_duration_bars=self._max_drawdown_duration_bars,
+        )
+
+    def _fold(self, pnl: Decimal):
+        self._moments.add(float(pnl))
+
+        if pnl > 0:
+            self._winning_trades += 1
+            self._total_win += pnl
+            self._top_wins.add(float(pnl))
+            if pnl > self._max_single_win:
+                self._max_single_win = pnl
+        elif pnl < 0:
+            self._losing_trades += 1
+            self._total_loss += pnl
+            self._top_losses.add(float(-pnl))
+            if pnl < self._max_single_loss:
+                self._max_single_loss = pnl
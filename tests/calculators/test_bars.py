@@ -0,0 +1,126 @@
+"""Tests for bar-level (intraday) equity evaluation."""
+import numpy as np
+import pytest
+from evaluator import PerformanceEvaluator, SessionFrame
+from evaluator.calculators import BarAccumulator, BarCalculator, RatioCalculator
+from tests.helpers import brute_episodes, random_sessions
+
+
+def _intraday_bars(sessions, bars_per_session=30, seed=5):
+    """Random intraday marks whose last bar in each session is its end market value."""
+    rng = np.random.default_rng(seed)
+    equity = []
+    for s in sessions:
+        close = float(s.end_market_value)
+        walk = close + np.cumsum(rng.normal(0, close * 0.002, bars_per_session))
+        walk[-1] = close
+        equity.append(walk)
+    bar_sessions = np.repeat([s.session for s in sessions], bars_per_session)
+    return np.concatenate(equity), bar_sessions
+
+
+class TestBarCalculator:
+    """Tests for BarCalculator and BarAccumulator."""
+
+    def test_matches_brute_force(self):
+        """Test drawdown, duration and Sharpe against a direct computation."""
+        sessions = random_sessions(50)
+        equity, bar_sessions = _intraday_bars(sessions)
+        initial = float(sessions[0].end_cash)
+        result = BarCalculator.compute_bar_metrics(equity, bar_sessions, initial, 0.03)
+
+        episodes = brute_episodes(equity.tolist(), initial)
+        deepest = max(episodes, key=lambda e: e[3])
+        assert result.bars == len(equity)
+        assert result.sessions == 50
+        assert result.max_drawdown == pytest.approx(deepest[3])
+        assert result.max_drawdown_session == bar_sessions[deepest[1]]
+        assert result.max_drawdown_duration_bars == max(end - start for start, _, end, _ in episodes)
+
+        returns = np.diff(equity).tolist()
+        expected_sharpe = RatioCalculator.compute_sharpe_ratio(returns, 0.03 / 30, len(returns))
+        assert result.sharpe_ratio == pytest.approx(expected_sharpe, rel=1e-9)
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 30, 128])
+    def test_chunking_does_not_change_results(self, chunk_size):
+        """Test any chunk size gives the same metrics as a single pass."""
+        sessions = random_sessions(40)
+        equity, bar_sessions = _intraday_bars(sessions)
+        initial = float(sessions[0].end_cash)
+        whole = BarCalculator.compute_bar_metrics(equity, bar_sessions, initial, 0.03, chunk_size=len(equity))
+        chunked = BarCalculator.compute_bar_metrics(equity, bar_sessions, initial, 0.03, chunk_size=chunk_size)
+
+        assert chunked.max_drawdown == whole.max_drawdown
+        assert chunked.max_drawdown_session == whole.max_drawdown_session
+        assert chunked.max_drawdown_duration_bars == whole.max_drawdown_duration_bars
+        assert chunked.sessions == whole.sessions
+        assert chunked.sharpe_ratio == pytest.approx(whole.sharpe_ratio, rel=1e-9)
+
+    def test_underwater_run_spans_chunks(self):
+        """Test a drawdown continuing across chunk boundaries is counted once."""
+        accumulator = BarAccumulator(100.0)
+        accumulator.add(np.array([101.0, 99.0, 98.0]), np.array([1, 1, 1]))
+        accumulator.add(np.array([97.0, 97.0]), np.array([2, 2]))
+        accumulator.add(np.array([100.0, 102.0, 100.0]), np.array([3, 3, 3]))
+        result = accumulator.result(0.03)
+        assert result.max_drawdown_duration_bars == 5
+        assert result.max_drawdown == 4.0
+        assert result.max_drawdown_session == 2
+
+    def test_memmap_input(self, tmp_path):
+        """Test bars can be read chunk by chunk from memory-mapped files."""
+        sessions = random_sessions(20)
+        equity, bar_sessions = _intraday_bars(sessions)
+        path = tmp_path / "equity.npy"
+        np.save(path, equity)
+        mapped = np.load(path, mmap_mode="r")
+
+        initial = float(sessions[0].end_cash)
+        expected = BarCalculator.compute_bar_metrics(equity, bar_sessions, initial, 0.03)
+        result = BarCalculator.compute_bar_metrics(mapped, bar_sessions, initial, 0.03, chunk_size=64)
+        assert result.max_drawdown == expected.max_drawdown
+        assert result.max_drawdown_duration_bars == expected.max_drawdown_duration_bars
+
+    def test_invalid_bars(self):
+        """Test mismatched lengths, decreasing sessions and bad chunk sizes are rejected."""
+        with pytest.raises(ValueError):
+            BarCalculator.compute_bar_metrics(np.zeros(3), np.zeros(2), 0.0, 0.03)
+        with pytest.raises(ValueError):
+            BarCalculator.compute_bar_metrics(np.zeros(3), np.array([2, 1, 1]), 0.0, 0.03)
+        with pytest.raises(ValueError):
+            BarCalculator.compute_bar_metrics(np.zeros(4), np.array([1, 2, 1, 1]), 0.0, 0.03, chunk_size=2)
+        with pytest.raises(ValueError):
+            BarCalculator.compute_bar_metrics(np.zeros(3), np.zeros(3), 0.0, 0.03, chunk_size=0)
+
+    def test_no_bars(self):
+        """Test an empty bar series gives zero metrics."""
+        result = BarCalculator.compute_bar_metrics(np.zeros(0), np.zeros(0), 100.0, 0.03)
+        assert result.bars == 0
+        assert result.max_drawdown == 0.0
+        assert result.max_drawdown_session is None
+        assert result.sharpe_ratio == 0.0
+
+
+class TestEvaluateBars:
+    """Tests for PerformanceEvaluator.evaluate_bars."""
+
+    def test_intraday_drawdown_at_least_session_drawdown(self):
+        """Test bars that include each session close see at least the session drawdown."""
+        sessions = random_sessions(60)
+        equity, bar_sessions = _intraday_bars(sessions)
+        evaluator = PerformanceEvaluator()
+        result = evaluator.evaluate_bars(sessions, equity, bar_sessions, chunk_size=100)
+        performance = evaluator.evaluate(sessions)
+
+        assert result.max_drawdown >= float(performance.max_drawdown)
+        assert result.max_drawdown_duration_bars >= performance.max_drawdown_duration_bars
+        frame_result = evaluator.evaluate_bars(SessionFrame.from_sessions(sessions), equity, bar_sessions)
+        assert frame_result.max_drawdown == result.max_drawdown
+
+    def test_unknown_session_rejected(self):
+        """Test bars must belong to the evaluated sessions."""
+        sessions = random_sessions(5)
+        equity = np.full(3, 100.0)
+        bar_sessions = np.array([sessions[0].session, sessions[-1].session, sessions[-1].session + 1])
+        with pytest.raises(ValueError, match="unknown session"):
+            PerformanceEvaluator().evaluate_bars(sessions, equity, bar_sessions)
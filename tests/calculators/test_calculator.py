@@ -4,6 +4,8 @@ import pytest
 from evaluator.calculators.calculator import PerformanceCalculator
 from evaluator.models.session_stats import SessionStats
 from evaluator.models.position_session_stats import PositionSessionStats
+from evaluator.models.session_frame import SessionFrame
+from tests.helpers import assert_performance_close, random_sessions
 
 
 class TestPerformanceCalculator:
@@ -327,6 +329,38 @@ class TestPerformanceCalculator:
         result = PerformanceCalculator._calculate_top_contributions([100.0], 0)
         assert result == [0.0, 0.0, 0.0, 0.0]
 
+    def test_compute_top_contributions_matches_full_sort(self):
+        """Test partial selection matches full sorting for wins and losses."""
+        import random
+        rng = random.Random(1)
+        values = [rng.uniform(-500, 500) for _ in range(5003)]
+        wins = sorted((v for v in values if v > 0), reverse=True)
+        losses = sorted(v for v in values if v < 0)
+        for series, is_loss in ((wins, False), (losses, True)):
+            total = abs(sum(series))
+            expected = []
+            for n_pct in (1, 5, 10, 20):
+                n = max(1, int(len(series) * n_pct / 100))
+                expected.append(abs(sum(series[:n])) / total * 100)
+            shuffled = series[:]
+            rng.shuffle(shuffled)
+            result = PerformanceCalculator.compute_top_contributions(shuffled, total, is_loss=is_loss)
+            assert result == pytest.approx(expected)
+
+    def test_compute_top_contributions_custom_cut_points(self):
+        """Test caller-supplied cut points."""
+        values = [float(v) for v in range(1, 101)]
+        total = sum(values)
+        result = PerformanceCalculator.compute_top_contributions(values, total, cut_points=(2, 50, 100))
+        assert result == pytest.approx([199 / total * 100, sum(range(51, 101)) / total * 100, 100.0])
+
+    def test_compute_top_contributions_invalid_cut_point(self):
+        """Test cut points outside (0, 100] are rejected."""
+        with pytest.raises(ValueError):
+            PerformanceCalculator.compute_top_contributions([1.0], 1.0, cut_points=(0,))
+        with pytest.raises(ValueError):
+            PerformanceCalculator.compute_top_contributions([1.0], 1.0, cut_points=(150,))
+
     def test_compute_account_performance_with_trades(self):
         """Test compute_account_performance with trade data."""
         positions = [
@@ -381,3 +415,138 @@ class TestPerformanceCalculator:
         )
         result = PerformanceCalculator.compute_account_performance([session], 0.02)
         assert result.open_positions == 2
+
+
+class TestVectorizedAccountPerformance:
+    """Tests for the NumPy account performance kernel."""
+
+    def test_vectorized_empty_sessions(self):
+        """Test vectorized path with empty session list."""
+        result = PerformanceCalculator.compute_account_performance_vectorized([], 0.02)
+        assert result.total_trades == 0
+
+    def test_vectorized_matches_decimal_path(self):
+        """Test vectorized path matches the Decimal path within tolerance."""
+        sessions = random_sessions(300)
+        expected = PerformanceCalculator.compute_account_performance(sessions, 0.03)
+        result = PerformanceCalculator.compute_account_performance_vectorized(sessions, 0.03)
+        assert_performance_close(result, expected, PerformanceCalculator.VECTORIZED_RTOL)
+
+    def test_vectorized_unfunded_first_session(self):
+        """Test first-session base amount adjustment when the first session has no cash."""
+        sessions = [
+            SessionStats(session=20251115, start_cash=Decimal("0"), end_cash=Decimal("50000")),
+            SessionStats(session=20251118, start_cash=Decimal("50000"), end_cash=Decimal("52000")),
+            SessionStats(session=20251119, start_cash=Decimal("52000"), end_cash=Decimal("51000")),
+        ]
+        expected = PerformanceCalculator.compute_account_performance(sessions, 0.03)
+        result = PerformanceCalculator.compute_account_performance_vectorized(sessions, 0.03)
+        assert_performance_close(result, expected, PerformanceCalculator.VECTORIZED_RTOL)
+
+    def test_vectorized_max_drawdown(self):
+        """Test drawdown uses the running peak including initial cash."""
+        sessions = [
+            SessionStats(session=20251115, start_cash=Decimal("100000"), end_cash=Decimal("110000")),
+            SessionStats(session=20251118, start_cash=Decimal("110000"), end_cash=Decimal("95000")),
+            SessionStats(session=20251119, start_cash=Decimal("95000"), end_cash=Decimal("120000")),
+        ]
+        result = PerformanceCalculator.compute_account_performance_vectorized(sessions, 0.03)
+        assert result.max_drawdown == Decimal("15000")
+        assert result.winning_trades == 2
+        assert result.losing_trades == 1
+
+
+class TestFixedPointAccountPerformance:
+    """Tests for the fixed-point integer account performance kernel."""
+
+    def test_fixed_empty_sessions(self):
+        """Test fixed-point path with empty session list."""
+        result = PerformanceCalculator.compute_account_performance_fixed([], 0.02)
+        assert result.total_trades == 0
+
+    def test_fixed_amounts_match_decimal_path_exactly(self):
+        """Test money fields are exact and ratios match within tolerance."""
+        sessions = random_sessions(300)
+        expected = PerformanceCalculator.compute_account_performance(sessions, 0.03)
+        result = PerformanceCalculator.compute_account_performance_fixed(sessions, 0.03)
+        for name, value in expected.model_dump().items():
+            if isinstance(value, Decimal):
+                assert getattr(result, name) == value, name
+        assert_performance_close(result, expected, PerformanceCalculator.VECTORIZED_RTOL)
+
+    def test_fixed_unfunded_first_session(self):
+        """Test first-session base amount adjustment when the first session has no cash."""
+        sessions = [
+            SessionStats(session=20251115, start_cash=Decimal("0"), end_cash=Decimal("50000")),
+            SessionStats(session=20251118, start_cash=Decimal("50000"), end_cash=Decimal("52000.25")),
+            SessionStats(session=20251119, start_cash=Decimal("52000.25"), end_cash=Decimal("51000.1")),
+        ]
+        expected = PerformanceCalculator.compute_account_performance(sessions, 0.03)
+        result = PerformanceCalculator.compute_account_performance_fixed(sessions, 0.03)
+        assert result.total_win == expected.total_win
+        assert result.max_single_loss == expected.max_single_loss
+        assert_performance_close(result, expected, PerformanceCalculator.VECTORIZED_RTOL)
+
+    def test_fixed_sub_cent_amounts_are_exact(self):
+        """Test sums that drift in float64 stay exact in minor units."""
+        sessions = []
+        cash = Decimal("0.1")
+        for i in range(10):
+            sessions.append(SessionStats(session=20250101 + i, start_cash=cash, end_cash=cash + Decimal("0.1")))
+            cash += Decimal("0.1")
+        result = PerformanceCalculator.compute_account_performance_fixed(sessions, 0.03, decimals=1)
+        assert result.total_win == Decimal("1.0")
+        assert result.final_value == Decimal("1.1")
+
+    def test_fixed_rejects_unrepresentable_amount(self):
+        """Test amounts finer than the configured scale are rejected rather than rounded."""
+        sessions = [SessionStats(session=20251115, start_cash=Decimal("100"), end_cash=Decimal("100.005"))]
+        with pytest.raises(ValueError):
+            PerformanceCalculator.compute_account_performance_fixed(sessions, 0.03, decimals=2)
+        result = PerformanceCalculator.compute_account_performance_fixed(sessions, 0.03, decimals=3)
+        assert result.final_value == Decimal("100.005")
+
+
+class TestAllPositionPerformance:
+    """Tests for grouped per-symbol performance."""
+
+    def test_index_positions(self):
+        """Test index_positions builds the evaluate_position input shape."""
+        sessions = random_sessions(20)
+        index = PerformanceCalculator.index_positions(sessions)
+        for symbol, by_session in index.items():
+            for session, data in by_session.items():
+                assert data["end_positions"][0].symbol == symbol
+                assert data["end_positions"][0].session == session
+
+    def test_grouped_matches_per_symbol(self):
+        """Test grouped computation matches compute_position_performance per symbol."""
+        sessions = random_sessions(200, seed=5)
+        index = PerformanceCalculator.index_positions(sessions)
+        frame = SessionFrame.from_sessions(sessions)
+        results = PerformanceCalculator.compute_all_position_performance(frame, 0.03)
+        assert sorted(results) == sorted(index)
+        assert list(results) == sorted(results)
+        for symbol, by_session in index.items():
+            expected = PerformanceCalculator.compute_position_performance(by_session, symbol, 0.03)
+            assert_performance_close(results[symbol], expected, PerformanceCalculator.VECTORIZED_RTOL)
+
+    def test_grouped_no_positions(self):
+        """Test grouped computation with no positions."""
+        sessions = [SessionStats(session=20251115, start_cash=Decimal("100000"))]
+        frame = SessionFrame.from_sessions(sessions)
+        assert PerformanceCalculator.compute_all_position_performance(frame, 0.03) == {}
+
+    def test_grouped_symbol_without_trades(self):
+        """Test a symbol with no realized PnL yields an empty performance."""
+        sessions = [
+            SessionStats(
+                session=20251115,
+                start_cash=Decimal("100000"),
+                end_positions=[
+                    PositionSessionStats(session=20251115, symbol="600000", end_volume=100, end_value=Decimal("1000")),
+                ],
+            ),
+        ]
+        results = PerformanceCalculator.compute_all_position_performance(SessionFrame.from_sessions(sessions), 0.03)
+        assert results["600000"].total_trades == 0
@@ -0,0 +1,131 @@
+"""Tests for DrawdownCalculator and DrawdownAnalysis."""
+import random
+import numpy as np
+import pytest
+from evaluator import (
+    FixedPointFrame,
+    PerformanceAggregate,
+    PerformanceEvaluator,
+    SessionFrame,
+    SessionIndex,
+    StreamingEvaluator,
+)
+from evaluator.calculators import DrawdownCalculator, PerformanceCalculator
+from evaluator.models.drawdown_analysis import DrawdownEpisode
+from tests.helpers import brute_episodes, random_sessions
+
+
+class TestDrawdownCalculator:
+    """Tests for DrawdownCalculator."""
+
+    def test_episodes(self):
+        """Test peak, trough, recovery, depth and duration of each episode."""
+        equities = np.array([100, 105, 103, 101, 106, 104, 104, 108, 90, 95.0])
+        analysis = DrawdownCalculator.analyze(np.arange(1, 11), equities, 100.0)
+
+        assert analysis.underwater.tolist() == [0, 0, -2, -4, 0, -2, -2, 0, -18, -13]
+        assert analysis.episodes == [
+            DrawdownEpisode(2, 4, 5, 105.0, 101.0, 4.0, 2),
+            DrawdownEpisode(5, 6, 8, 106.0, 104.0, 2.0, 2),
+            DrawdownEpisode(8, 9, None, 108.0, 90.0, 18.0, 2),
+        ]
+        assert analysis.max_drawdown == 18.0
+        assert analysis.max_duration == 2
+
+    def test_peak_is_initial_cash(self):
+        """Test an episode starting on the first bar has no peak session."""
+        analysis = DrawdownCalculator.analyze(np.arange(1, 4), np.array([99.0, 98.0, 100.0]), 100.0)
+        assert analysis.episodes == [DrawdownEpisode(None, 2, 3, 100.0, 98.0, 2.0, 2)]
+
+    def test_no_drawdown(self):
+        """Test a non-decreasing curve has no episodes."""
+        analysis = DrawdownCalculator.analyze(np.arange(1, 4), np.array([100.0, 100.0, 101.0]), 100.0)
+        assert len(analysis) == 0
+        assert analysis.episodes == []
+        assert analysis.top(3) == []
+        assert analysis.max_drawdown == 0.0
+        assert analysis.max_duration == 0
+
+    def test_matches_brute_force(self):
+        """Test episode boundaries and troughs match a per-bar scan."""
+        rng = random.Random(11)
+        equities = np.array([rng.choice([100.0, 101.0, 102.0, 103.0]) for _ in range(500)])
+        analysis = DrawdownCalculator.analyze(np.arange(500), equities, 102.0)
+
+        expected = brute_episodes(equities.tolist(), 102.0)
+        actual = list(zip(analysis.start.tolist(), analysis.trough.tolist(),
+                          analysis.end.tolist(), analysis.depth.tolist()))
+        assert actual == expected
+
+    def test_top_uses_depth_then_time(self):
+        """Test top returns the deepest episodes with earlier ones winning ties."""
+        equities = np.array([100, 95, 100, 90, 100, 95, 100, 98.0])
+        analysis = DrawdownCalculator.analyze(np.arange(8), equities, 100.0)
+        assert [e.depth for e in analysis.top(3)] == [10.0, 5.0, 5.0]
+        assert [e.trough_session for e in analysis.top(3)] == [3, 1, 5]
+        assert len(analysis.top(10)) == 4
+
+    def test_top_by_duration(self):
+        """Test ranking episodes by how long they stayed underwater."""
+        equities = np.array([100, 90, 100, 99, 99, 99, 100.0])
+        analysis = DrawdownCalculator.analyze(np.arange(7), equities, 100.0)
+        assert analysis.top(1, by="duration")[0].duration == 3
+        with pytest.raises(ValueError):
+            analysis.top(1, by="profit")
+
+    def test_fixed_frame_matches_session_frame(self):
+        """Test the integer analysis agrees with the float one."""
+        sessions = random_sessions(200)
+        expected = DrawdownCalculator.analyze_frame(SessionFrame.from_sessions(sessions))
+        result = DrawdownCalculator.analyze_frame(FixedPointFrame.from_sessions(sessions))
+        assert [e[:3] + (e.duration,) for e in result.episodes] == [e[:3] + (e.duration,) for e in expected.episodes]
+        assert result.depth == pytest.approx(expected.depth)
+        assert result.underwater == pytest.approx(expected.underwater)
+
+    def test_empty_frame(self):
+        """Test an empty frame has no episodes."""
+        analysis = DrawdownCalculator.analyze_frame(SessionFrame.from_sessions([]))
+        assert len(analysis) == 0
+        assert analysis.max_duration == 0
+
+
+class TestMaxDrawdownDuration:
+    """Tests for Performance.max_drawdown_duration_bars across engines."""
+
+    def test_all_engines_agree(self):
+        """Test every evaluation path reports the same longest underwater run."""
+        sessions = random_sessions(300)
+        expected = max(
+            (end - start for start, _, end, _ in
+             brute_episodes([float(s.end_market_value) for s in sessions], float(sessions[0].end_cash))),
+            default=0,
+        )
+        assert expected > 0
+
+        frame = SessionFrame.from_sessions(sessions)
+        streaming = StreamingEvaluator()
+        for s in sessions:
+            streaming.add(s)
+        results = [
+            PerformanceCalculator.compute_account_performance(sessions, 0.03),
+            PerformanceCalculator.compute_frame_performance(frame, 0.03),
+            PerformanceCalculator.compute_account_performance_fixed(sessions, 0.03),
+            PerformanceAggregate.from_sessions(sessions[:120]).merge(
+                PerformanceAggregate.from_sessions(sessions[120:])).to_performance(0.03),
+            SessionIndex(frame).performance(0.03),
+            streaming.performance(),
+        ]
+        assert [r.max_drawdown_duration_bars for r in results] == [expected] * len(results)
+        metrics = PerformanceEvaluator(engine="numpy").evaluate(sessions, metrics=["max_drawdown_duration_bars"])
+        assert metrics["max_drawdown_duration_bars"] == expected
+
+    def test_evaluate_drawdowns(self):
+        """Test the evaluator's drawdown analysis honours the session range."""
+        sessions = random_sessions(100)
+        evaluator = PerformanceEvaluator()
+        analysis = evaluator.evaluate_drawdowns(sessions, start=sessions[10].session)
+        assert len(analysis.session) == 90
+        assert analysis.max_duration == evaluator.evaluate(
+            sessions, start=sessions[10].session).max_drawdown_duration_bars
+        assert analysis.max_drawdown == pytest.approx(
+            float(evaluator.evaluate(sessions, start=sessions[10].session).max_drawdown))
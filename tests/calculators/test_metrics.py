@@ -0,0 +1,133 @@
+"""Tests for the metric registry."""
+import pytest
+from evaluator import PerformanceEvaluator, SessionFrame, SessionIndex
+from evaluator.calculators import METRICS, MetricRegistry, PerformanceCalculator
+from evaluator.models.performance import Performance
+from tests.helpers import random_sessions
+
+
+PERFORMANCE_METRICS = [name for name in Performance.model_fields if name in METRICS]
+
+
+class TestMetricRegistry:
+    """Tests for MetricRegistry."""
+
+    def test_builtin_metrics_match_frame_performance(self):
+        """Test every built-in Performance field matches compute_frame_performance exactly."""
+        frame = SessionFrame.from_sessions(random_sessions(300))
+        expected = PerformanceCalculator.compute_frame_performance(frame, 0.03)
+        result = METRICS.compute(frame, PERFORMANCE_METRICS, 0.03)
+        assert len(PERFORMANCE_METRICS) >= 34
+        for name in PERFORMANCE_METRICS:
+            assert result[name] == getattr(expected, name), name
+
+    def test_resolve_only_needed_dependencies(self):
+        """Test resolving skips metrics that were not requested."""
+        order = METRICS.resolve(["sharpe_ratio", "max_drawdown"])
+        assert "top_win_contributions" not in order
+        assert "sortino_ratio" not in order
+        assert order.index("pnls") < order.index("mean_return") < order.index("sharpe_ratio")
+
+    def test_shared_intermediates_computed_once(self):
+        """Test a dependency shared by several metrics is evaluated once."""
+        registry = METRICS.copy()
+        calls = []
+
+        @registry.register("pnls", ("frame", "base_amount"), replace=True)
+        def counting_pnls(frame, base_amount):
+            calls.append(1)
+            return METRICS._metrics["pnls"].compute(frame, base_amount)
+
+        frame = SessionFrame.from_sessions(random_sessions(20))
+        registry.compute(frame, ["sharpe_ratio", "sortino_ratio", "win_rate"], 0.03)
+        assert len(calls) == 1
+
+    def test_register_third_party_metric(self):
+        """Test a registered metric plugs into the same computation."""
+        registry = METRICS.copy()
+
+        @registry.register("profit_factor", ("total_win", "total_loss"))
+        def profit_factor(total_win, total_loss):
+            return float(total_win / -total_loss) if total_loss else 0.0
+
+        frame = SessionFrame.from_sessions(random_sessions(50))
+        result = registry.compute(frame, ["profit_factor", "win_rate"], 0.03)
+        expected = PerformanceCalculator.compute_frame_performance(frame, 0.03)
+        assert result["profit_factor"] == pytest.approx(float(expected.total_win / -expected.total_loss))
+        assert "profit_factor" not in METRICS
+
+    def test_duplicate_registration_rejected(self):
+        """Test registering an existing name or a source name fails without replace."""
+        registry = METRICS.copy()
+        with pytest.raises(ValueError):
+            registry.register("sharpe_ratio")(lambda: 0.0)
+        with pytest.raises(ValueError):
+            registry.register("frame")(lambda: 0.0)
+
+    def test_unknown_metric(self):
+        """Test unknown metrics raise KeyError."""
+        with pytest.raises(KeyError):
+            METRICS.resolve(["no_such_metric"])
+
+    def test_dependency_cycle(self):
+        """Test dependency cycles are reported."""
+        registry = MetricRegistry()
+        registry.register("a", ("b",))(lambda b: b)
+        registry.register("b", ("a",))(lambda a: a)
+        with pytest.raises(ValueError):
+            registry.resolve(["a"])
+
+    def test_empty_frame(self):
+        """Test an empty frame returns empty-performance defaults."""
+        result = METRICS.compute(SessionFrame.from_sessions([]), ["sharpe_ratio", "total_trades"], 0.03)
+        assert result == {"sharpe_ratio": 0.0, "total_trades": 0}
+
+
+class TestEvaluateMetrics:
+    """Tests for PerformanceEvaluator.evaluate(metrics=...)."""
+
+    def test_evaluate_selected_metrics(self):
+        """Test only the requested metrics are returned."""
+        sessions = random_sessions(100)
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03, engine="numpy")
+        result = evaluator.evaluate(sessions, metrics=["sharpe_ratio", "max_drawdown"])
+        expected = PerformanceEvaluator(risk_free_rate=0.03).evaluate(sessions)
+        assert list(result) == ["sharpe_ratio", "max_drawdown"]
+        assert float(result["max_drawdown"]) == pytest.approx(float(expected.max_drawdown))
+        assert result["sharpe_ratio"] == pytest.approx(expected.sharpe_ratio)
+
+    def test_evaluate_metrics_with_range_and_index(self):
+        """Test metrics honour start/end for lists, generators and indexes."""
+        sessions = random_sessions(60)
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03, engine="numpy")
+        start, end = sessions[10].session, sessions[40].session
+        expected = evaluator.evaluate(sessions, start=start, end=end).net_profit
+        for source in (sessions, iter(sessions), SessionIndex.from_sessions(sessions)):
+            result = evaluator.evaluate(source, metrics=["net_profit"], start=start, end=end)
+            assert float(result["net_profit"]) == pytest.approx(float(expected))
+
+    def test_evaluator_custom_registry(self):
+        """Test the evaluator uses the registry it was given."""
+        registry = METRICS.copy()
+        registry.register("session_count", ("frame",))(len)
+        evaluator = PerformanceEvaluator(engine="numpy", metric_registry=registry)
+        assert evaluator.evaluate(random_sessions(7), metrics=["session_count"]) == {"session_count": 7}
+
+    def test_fixed_point_frame_rejected(self):
+        """Test metrics are not computed on fixed-point frames."""
+        from evaluator import FixedPointFrame
+        with pytest.raises(TypeError):
+            PerformanceEvaluator(engine="numpy").evaluate(FixedPointFrame.from_sessions([]), metrics=["net_profit"])
+
+    @pytest.mark.parametrize("engine", ["decimal", "fixed"])
+    def test_exact_engines_rejected(self, engine):
+        """Test metrics are only computed under the numpy engine."""
+        with pytest.raises(ValueError, match="engine='numpy'"):
+            PerformanceEvaluator(engine=engine).evaluate(random_sessions(5), metrics=["net_profit"])
+
+    def test_list_input_matches_frame(self):
+        """Test list input, converted without the positions table, matches a full frame."""
+        sessions = random_sessions(80)
+        evaluator = PerformanceEvaluator(engine="numpy")
+        expected = evaluator.evaluate(SessionFrame.from_sessions(sessions), metrics=PERFORMANCE_METRICS)
+        assert evaluator.evaluate(sessions, metrics=PERFORMANCE_METRICS) == expected
@@ -0,0 +1,114 @@
+"""Tests for RollingCalculator and the sliding drawdown window."""
+import math
+import random
+from decimal import Decimal
+import pytest
+from evaluator import PerformanceEvaluator
+from evaluator.calculators.calculator import PerformanceCalculator
+from evaluator.calculators.drawdown import DrawdownSegment, SlidingDrawdown
+from evaluator.calculators.rolling import RollingCalculator
+from evaluator.models.session_frame import SessionFrame
+from evaluator.models.session_stats import SessionStats
+from tests.helpers import random_sessions
+
+
+def _brute_drawdown(values):
+    peak = -math.inf
+    max_drawdown = 0.0
+    for value in values:
+        peak = max(peak, value)
+        max_drawdown = max(max_drawdown, peak - value)
+    return max_drawdown
+
+
+class TestSlidingDrawdown:
+    """Tests for DrawdownSegment and SlidingDrawdown."""
+
+    def test_combine_is_associative(self):
+        """Test combining segments in any grouping gives the same result."""
+        a, b, c = DrawdownSegment.of(5.0), DrawdownSegment.of(9.0), DrawdownSegment.of(2.0)
+        assert a.combine(b).combine(c) == a.combine(b.combine(c))
+        assert a.combine(b).combine(c).max_drawdown == 7.0
+
+    def test_drawdown_from_initial_peak(self):
+        """Test an initial peak above the segment counts as drawdown."""
+        segment = DrawdownSegment.of(90.0).combine(DrawdownSegment.of(95.0))
+        assert segment.drawdown_from(100.0) == 10.0
+        assert segment.drawdown_from(50.0) == 0.0
+
+    def test_sliding_matches_brute_force(self):
+        """Test the two-stack window matches recomputing each window."""
+        rng = random.Random(3)
+        values = [rng.uniform(0, 100) for _ in range(300)]
+        window = 23
+        sliding = SlidingDrawdown()
+        for i, value in enumerate(values):
+            sliding.push(value)
+            if len(sliding) > window:
+                sliding.pop()
+            expected = _brute_drawdown(values[max(0, i - window + 1):i + 1])
+            assert sliding.query().max_drawdown == pytest.approx(expected)
+
+
+class TestRollingCalculator:
+    """Tests for RollingCalculator."""
+
+    @pytest.mark.parametrize("window", [1, 5, 20])
+    def test_matches_account_performance_per_window(self, window):
+        """Test each window matches compute_account_performance on its slice."""
+        sessions = random_sessions(60)
+        sessions[0] = sessions[0].model_copy(update={"start_cash": Decimal("0")})
+        result = RollingCalculator.compute_rolling_metrics(
+            SessionFrame.from_sessions(sessions), window, 0.03
+        )
+        assert len(result) == len(sessions)
+        for i in range(window - 1, len(sessions)):
+            expected = PerformanceCalculator.compute_account_performance(sessions[i - window + 1:i + 1], 0.03)
+            assert result.sharpe_ratio[i] == pytest.approx(expected.sharpe_ratio, rel=1e-7, abs=1e-9)
+            assert result.sortino_ratio[i] == pytest.approx(expected.sortino_ratio, rel=1e-7, abs=1e-9)
+            assert result.win_rate[i] == pytest.approx(expected.win_rate)
+            assert result.net_profit[i] == pytest.approx(float(expected.net_profit))
+            assert result.max_drawdown[i] == pytest.approx(float(expected.max_drawdown))
+
+    def test_warmup_is_nan(self):
+        """Test windows shorter than min_periods are NaN."""
+        sessions = random_sessions(10)
+        result = RollingCalculator.compute_rolling_metrics(SessionFrame.from_sessions(sessions), 5, 0.03, min_periods=3)
+        assert all(math.isnan(v) for v in result.sharpe_ratio[:2])
+        assert not math.isnan(result.sharpe_ratio[2])
+        expected = PerformanceCalculator.compute_account_performance(sessions[:3], 0.03)
+        assert result.net_profit[2] == pytest.approx(float(expected.net_profit))
+
+    def test_constant_window_has_zero_ratios(self):
+        """Test a window of identical pnls yields zero Sharpe."""
+        sessions = []
+        cash = Decimal("100000")
+        for i in range(10):
+            sessions.append(SessionStats(session=20250101 + i, start_cash=cash, end_cash=cash + 100))
+            cash += 100
+        result = RollingCalculator.compute_rolling_metrics(SessionFrame.from_sessions(sessions), 4, 0.03)
+        assert result.sharpe_ratio[3:].tolist() == [0.0] * 7
+        assert result.sortino_ratio[3:].tolist() == [0.0] * 7
+        assert result.win_rate[3:].tolist() == [100.0] * 7
+
+    def test_invalid_window(self):
+        """Test invalid window arguments raise ValueError."""
+        frame = SessionFrame.from_sessions(random_sessions(3))
+        with pytest.raises(ValueError):
+            RollingCalculator.compute_rolling_metrics(frame, 0, 0.03)
+        with pytest.raises(ValueError):
+            RollingCalculator.compute_rolling_metrics(frame, 3, 0.03, min_periods=4)
+
+    def test_empty(self):
+        """Test rolling metrics of no sessions are empty."""
+        result = RollingCalculator.compute_rolling_metrics(SessionFrame.from_sessions([]), 5, 0.03)
+        assert len(result) == 0
+
+    def test_evaluator_evaluate_rolling(self):
+        """Test PerformanceEvaluator.evaluate_rolling accepts session lists."""
+        sessions = random_sessions(30)
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03)
+        result = evaluator.evaluate_rolling(sessions, 10)
+        assert result.session.tolist() == [s.session for s in sessions]
+        expected = evaluator.evaluate(sessions[-10:])
+        assert result.sharpe_ratio[-1] == pytest.approx(expected.sharpe_ratio, rel=1e-7)
@@ -0,0 +1,73 @@
+"""Shared session generators and assertions for the test suite."""
+from decimal import Decimal
+import random
+import pytest
+from evaluator.models.session_stats import SessionStats
+from evaluator.models.position_session_stats import PositionSessionStats
+
+
+def random_sessions(count, seed=7, first_start_cash=Decimal("100000")):
+    """Random consecutive sessions with zero to three positions each.
+
+    With first_start_cash=0 the first session is unfunded and ends with 100000 cash.
+    """
+    rng = random.Random(seed)
+    sessions = []
+    cash = first_start_cash
+    for i in range(count):
+        end_cash = cash + Decimal(rng.randint(-300000, 300000)) / 100
+        if i == 0 and first_start_cash == 0:
+            end_cash = Decimal("100000")
+        positions = [
+            PositionSessionStats(
+                session=20250101 + i,
+                symbol=f"{rng.randint(0, 5):06d}",
+                end_volume=rng.randint(0, 3) * 100,
+                end_value=Decimal(rng.randint(0, 500000)) / 100,
+                realized_profit=Decimal(rng.randint(-5000, 5000)) / 100,
+                commission=Decimal(rng.randint(0, 500)) / 100,
+                trade_count=rng.randint(0, 3),
+            )
+            for _ in range(rng.randint(0, 3))
+        ]
+        sessions.append(SessionStats(
+            session=20250101 + i,
+            start_cash=cash,
+            end_cash=end_cash,
+            end_positions=positions,
+        ))
+        cash = end_cash
+    return sessions
+
+
+def assert_performance_close(result, expected, rtol):
+    """Integer and None fields must match exactly, the rest within rtol."""
+    for name, value in expected.model_dump().items():
+        actual = getattr(result, name)
+        if isinstance(value, int) or value is None:
+            assert actual == value, name
+        else:
+            assert float(actual) == pytest.approx(float(value), rel=rtol, abs=1e-9), name
+
+
+def brute_episodes(equities, initial_peak):
+    """(start, trough, end, depth) of each run of bars below the running peak."""
+    episodes = []
+    peak = initial_peak
+    current = None
+    for i, equity in enumerate(equities):
+        peak = max(peak, equity)
+        if equity < peak:
+            if current is None:
+                current = [i, i, None, peak - equity]
+            elif peak - equity > current[3]:
+                current[1] = i
+                current[3] = peak - equity
+        elif current is not None:
+            current[2] = i
+            episodes.append(tuple(current))
+            current = None
+    if current is not None:
+        current[2] = len(equities)
+        episodes.append(tuple(current))
+    return episodes
@@ -1,7 +1,8 @@
 """Tests for PerformanceComparison and SessionComparison models."""
 from decimal import Decimal
 import pytest
-from evaluator.models.comparison import PerformanceComparison, SessionComparison
+from evaluator.models.comparison import PerformanceComparison, SessionComparison, SessionComparisonTable
+from evaluator.models.session_stats import SessionStats
 from evaluator.models.performance import Performance
 
 
@@ -478,3 +479,72 @@ class TestPerformanceComparison:
             session_match_rate=0.0,
         )
         assert comp.session_match_rate == 0.0
+
+
+class TestSessionComparisonTable:
+    """Tests for SessionComparisonTable."""
+
+    def _pairs(self):
+        first = [
+            SessionStats(session=20251115, start_cash=Decimal("100000"), end_cash=Decimal("101000")),
+            SessionStats(session=20251118, start_cash=Decimal("101000"), end_cash=Decimal("100500")),
+            SessionStats(session=20251119, start_cash=Decimal("0"), end_cash=Decimal("0")),
+        ]
+        second = [
+            SessionStats(session=20251115, start_cash=Decimal("100000"), end_cash=Decimal("100800")),
+            SessionStats(session=20251118, start_cash=Decimal("100800"), end_cash=Decimal("100900")),
+            SessionStats(session=20251119, start_cash=Decimal("0"), end_cash=Decimal("0")),
+        ]
+        return first, second
+
+    def test_columns(self):
+        """Test per-session delta columns are computed as arrays."""
+        table = SessionComparisonTable(*self._pairs())
+        assert len(table) == 3
+        assert table.session.tolist() == [20251115, 20251118, 20251119]
+        assert table.pnl_delta.tolist() == [-200.0, 600.0, 0.0]
+        assert table.first_pnl_pct.tolist() == pytest.approx([1.0, -500 / 101000 * 100, 0.0])
+        assert table.drift_ratio.tolist() == pytest.approx([-0.2, 1.2, 0.0])
+
+    def test_lazy_items_match_columns(self):
+        """Test items are materialized on access with exact values."""
+        table = SessionComparisonTable(*self._pairs())
+        assert table._items == [None, None, None]
+        item = table[1]
+        assert isinstance(item, SessionComparison)
+        assert item.pnl_delta == Decimal("600")
+        assert table[1] is item
+        assert table[-1].session == 20251119
+        assert [c.session for c in table[0:2]] == [20251115, 20251118]
+        with pytest.raises(IndexError):
+            table[3]
+
+    def test_in_performance_comparison(self):
+        """Test a table can back PerformanceComparison.sessions and serializes as a list."""
+        perf = Performance(
+            total_trades=0, winning_trades=0, losing_trades=0, win_rate=0.0,
+            net_profit=Decimal("0"), net_profit_pct=0.0, max_drawdown=Decimal("0"),
+            sharpe_ratio=0.0, final_value=Decimal("0"), initial_cash=Decimal("0"),
+        )
+        table = SessionComparisonTable(*self._pairs())
+        comp = PerformanceComparison(
+            first=perf,
+            second=perf,
+            net_profit_delta=Decimal("0"),
+            net_profit_pct_delta=0.0,
+            win_rate_delta=0.0,
+            sharpe_ratio_delta=0.0,
+            max_drawdown_delta=Decimal("0"),
+            total_trades_delta=0,
+            performance_ratio=0.0,
+            drift_percentage=0.0,
+            sessions=table,
+            total_sessions=3,
+            matched_sessions=3,
+            session_match_rate=1.0,
+        )
+        assert comp.sessions is table
+        assert table._items == [None, None, None]
+        dumped = comp.model_dump()
+        assert [s["session"] for s in dumped["sessions"]] == [20251115, 20251118, 20251119]
+        assert comp.sessions == list(table)
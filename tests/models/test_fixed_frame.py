@@ -0,0 +1,82 @@
+"""Tests for FixedPointFrame model."""
+from decimal import Decimal
+import numpy as np
+import pytest
+from evaluator import FixedPointFrame, PerformanceEvaluator, SessionFrame
+from evaluator.models.session_stats import SessionStats
+from tests.helpers import random_sessions
+
+
+class TestFixedPointFrame:
+    """Tests for FixedPointFrame model."""
+
+    def test_from_sessions_minor_units(self):
+        """Test amounts are stored as int64 minor units."""
+        sessions = [
+            SessionStats(session=20251115, start_cash=Decimal("100000"), end_cash=Decimal("99950.25")),
+            SessionStats(session=20251118, start_cash=Decimal("99950.25"), end_cash=Decimal("100010.5")),
+        ]
+        frame = FixedPointFrame.from_sessions(sessions)
+        assert frame.scale == 100
+        assert frame.start_cash.dtype == np.int64
+        assert frame.start_cash.tolist() == [10000000, 9995025]
+        assert frame.end_cash.tolist() == [9995025, 10001050]
+        assert frame.pnl.tolist() == [-4975, 6025]
+        assert frame.open_positions.tolist() == [0, 0]
+
+    def test_to_decimal_is_exact(self):
+        """Test minor units convert back to exact Decimals."""
+        frame = FixedPointFrame.from_sessions([], decimals=4)
+        assert frame.to_decimal(np.int64(12345)) == Decimal("1.2345")
+        assert frame.to_decimal(-1) == Decimal("-0.0001")
+
+    def test_check_exact(self):
+        """Test a single session is checked like from_sessions."""
+        session = SessionStats(session=20251115, start_cash=Decimal("100.5"), end_cash=Decimal("100.25"))
+        FixedPointFrame.check_exact(session, 2)
+        with pytest.raises(ValueError):
+            FixedPointFrame.check_exact(session, 1)
+
+    def test_negative_decimals_rejected(self):
+        """Test a negative scale is rejected."""
+        with pytest.raises(ValueError):
+            FixedPointFrame.from_sessions([], decimals=-1)
+
+    def test_from_frame_matches_from_sessions(self):
+        """Test converting a float frame gives the same integer columns."""
+        sessions = random_sessions(100)
+        expected = FixedPointFrame.from_sessions(sessions)
+        frame = FixedPointFrame.from_frame(SessionFrame.from_sessions(sessions))
+        for name in ("session", "start_cash", "end_cash", "end_market_value", "commission", "pnl", "open_positions"):
+            assert getattr(frame, name).tolist() == getattr(expected, name).tolist(), name
+
+    def test_slice(self):
+        """Test slicing keeps the scale."""
+        frame = FixedPointFrame.from_sessions(random_sessions(10), decimals=3).slice(2, 5)
+        assert len(frame) == 3
+        assert frame.decimals == 3
+
+    def test_fixed_engine(self):
+        """Test the fixed engine gives exact money fields."""
+        sessions = random_sessions(200)
+        expected = PerformanceEvaluator(risk_free_rate=0.03).evaluate(sessions)
+        result = PerformanceEvaluator(risk_free_rate=0.03, engine="fixed").evaluate(sessions)
+        assert result.net_profit == expected.net_profit
+        assert result.max_drawdown == expected.max_drawdown
+        assert result.total_commission == expected.total_commission
+        assert result.sharpe_ratio == pytest.approx(expected.sharpe_ratio)
+
+    def test_evaluator_accepts_fixed_frame_with_range(self):
+        """Test evaluate accepts a FixedPointFrame and slices it by session range."""
+        sessions = random_sessions(50)
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03)
+        frame = FixedPointFrame.from_sessions(sessions)
+        start, end = sessions[10].session, sessions[30].session
+        result = evaluator.evaluate(frame, start=start, end=end)
+        assert result.net_profit == evaluator.evaluate(sessions, start=start, end=end).net_profit
+        assert evaluator.evaluate(frame, start=0, end=1).total_trades == 0
+
+    def test_invalid_money_decimals(self):
+        """Test the evaluator rejects a negative money scale."""
+        with pytest.raises(ValueError):
+            PerformanceEvaluator(engine="fixed", money_decimals=-2)
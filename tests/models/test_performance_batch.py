@@ -0,0 +1,94 @@
+"""Tests for PerformanceBatch."""
+import math
+import numpy as np
+import pytest
+from evaluator import PerformanceEvaluator
+from evaluator.models.performance_batch import PerformanceBatch
+from tests.helpers import random_sessions
+
+
+@pytest.fixture(scope="module")
+def results():
+    evaluator = PerformanceEvaluator(risk_free_rate=0.03)
+    return evaluator.evaluate_many([random_sessions(15, seed=i) for i in range(40)], workers=1, as_record=True)
+
+
+def _batch(results):
+    return PerformanceBatch.from_results(results, labels=[f"s{i}" for i in range(len(results))])
+
+
+class TestPerformanceBatch:
+    """Tests for PerformanceBatch."""
+
+    def test_columns(self, results):
+        """Test every field becomes a column of the right dtype."""
+        batch = _batch(results)
+        assert len(batch) == 40
+        assert batch["sharpe_ratio"].tolist() == [r.sharpe_ratio for r in results]
+        assert batch["total_trades"].dtype == np.int64
+        assert batch["net_profit"].tolist() == [float(r.net_profit) for r in results]
+
+    def test_filter(self, results):
+        """Test filtering with a boolean mask keeps labels aligned."""
+        batch = _batch(results)
+        filtered = batch.filter(batch["sharpe_ratio"] > 0)
+        expected = [f"s{i}" for i, r in enumerate(results) if r.sharpe_ratio > 0]
+        assert filtered.labels.tolist() == expected
+        with pytest.raises(ValueError):
+            batch.filter(np.ones(3, dtype=bool))
+
+    def test_sort_multi_key(self, results):
+        """Test multi-key sorting matches Python's sorted."""
+        batch = _batch(results)
+        result = batch.sort([("winning_trades", True), ("net_profit", False)])
+        expected = sorted(range(40), key=lambda i: (-results[i].winning_trades, results[i].net_profit))
+        assert result.labels.tolist() == [f"s{i}" for i in expected]
+
+    @pytest.mark.parametrize("k", [0, 1, 5, 39, 40, 100])
+    def test_top_k_matches_sort(self, results, k):
+        """Test top_k equals the head of a full sort, ties included."""
+        batch = _batch(results)
+        keys = ["winning_trades", ("calmar_ratio", False)]
+        assert batch.top_k(keys, k).labels.tolist() == batch.sort(keys).labels.tolist()[:k]
+
+    def test_top_k_with_nan(self):
+        """Test NaN values rank last."""
+        batch = PerformanceBatch({"sharpe_ratio": np.array([1.0, math.nan, 3.0, 2.0])})
+        assert batch.top_k("sharpe_ratio", 2).labels.tolist() == [2, 3]
+        assert batch.top_k("sharpe_ratio", 4).labels.tolist() == [2, 3, 0, 1]
+        assert batch.top_k(("sharpe_ratio", False), 4).labels.tolist() == [0, 3, 2, 1]
+
+    def test_rank(self, results):
+        """Test ranks are 1-based positions in the sort order."""
+        batch = _batch(results)
+        ranks = batch.rank("sharpe_ratio")
+        order = batch.order("sharpe_ratio")
+        assert sorted(ranks.tolist()) == list(range(1, 41))
+        assert ranks[order[0]] == 1
+        assert ranks[order[-1]] == 40
+
+    def test_unknown_field(self, results):
+        """Test sorting by an unknown field raises KeyError."""
+        with pytest.raises(KeyError):
+            _batch(results).sort("symbol")
+
+    def test_to_rows_and_records(self, results):
+        """Test exporting rows and records."""
+        batch = _batch(results)
+        rows = batch.to_rows()
+        assert rows[3]["label"] == "s3"
+        assert rows[3]["sharpe_ratio"] == results[3].sharpe_ratio
+        records = batch.to_records()
+        assert records[3].net_profit == results[3].net_profit
+        assert records[3].to_performance().total_trades == results[3].total_trades
+
+    def test_label_count_mismatch(self, results):
+        """Test labels must match the number of results."""
+        with pytest.raises(ValueError):
+            PerformanceBatch.from_results(results, labels=["a"])
+
+    def test_empty(self):
+        """Test an empty batch."""
+        batch = PerformanceBatch.from_results([])
+        assert len(batch) == 0
+        assert batch.top_k("sharpe_ratio", 3).to_rows() == []
@@ -0,0 +1,70 @@
+"""Tests for PerformanceRecord."""
+from decimal import Decimal
+import pickle
+import pytest
+from evaluator import PerformanceEvaluator
+from evaluator.calculators.calculator import PerformanceCalculator
+from evaluator.models.performance import Performance
+from evaluator.models.performance_record import PerformanceRecord
+from evaluator.models.session_frame import SessionFrame
+from tests.helpers import random_sessions
+
+
+class TestPerformanceRecord:
+    """Tests for PerformanceRecord."""
+
+    def test_frame_kernel_emits_record(self):
+        """Test the frame kernel can emit a record equal to the model result."""
+        frame = SessionFrame.from_sessions(random_sessions(30))
+        record = PerformanceCalculator.compute_frame_performance(frame, 0.03, as_record=True)
+        expected = PerformanceCalculator.compute_frame_performance(frame, 0.03)
+        assert isinstance(record, PerformanceRecord)
+        assert record.sharpe_ratio == expected.sharpe_ratio
+        assert record.to_performance() == expected
+
+    def test_empty_frame_record(self):
+        """Test an empty frame yields an empty record."""
+        record = PerformanceCalculator.compute_frame_performance(SessionFrame.from_sessions([]), 0.03, as_record=True)
+        assert record.total_trades == 0
+        assert record.to_performance() == PerformanceCalculator._empty_account_performance()
+
+    def test_round_trip(self):
+        """Test converting a Performance to a record and back."""
+        performance = PerformanceEvaluator().evaluate(random_sessions(10))
+        record = PerformanceRecord.from_performance(performance)
+        assert record.as_dict() == performance.model_dump()
+        assert record.to_performance() == performance
+        assert pickle.loads(pickle.dumps(record)) == record
+
+    def test_defaults_and_unknown_fields(self):
+        """Test defaults are filled and unknown or missing fields raise TypeError."""
+        record = PerformanceRecord(
+            total_trades=0, winning_trades=0, losing_trades=0, win_rate=0.0, net_profit=Decimal("0"),
+            net_profit_pct=0.0, max_drawdown=Decimal("0"), sharpe_ratio=0.0,
+            final_value=Decimal("0"), initial_cash=Decimal("0"),
+        )
+        assert record.calmar_ratio == 0.0
+        assert record.total_commission == Decimal("0")
+        with pytest.raises(TypeError):
+            PerformanceRecord(symbol="600000")
+        with pytest.raises(TypeError):
+            PerformanceRecord(total_trades=0)
+
+    def test_fields_match_performance(self):
+        """Test the record declares exactly the Performance fields."""
+        from dataclasses import fields
+        assert [f.name for f in fields(PerformanceRecord)] == list(Performance.model_fields)
+
+    def test_has_no_instance_dict(self):
+        """Test records are slotted."""
+        record = PerformanceRecord.from_performance(PerformanceCalculator._empty_account_performance())
+        assert not hasattr(record, "__dict__")
+
+    def test_evaluate_many_records(self):
+        """Test evaluate_many can return records."""
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03)
+        session_lists = [random_sessions(10, seed=i) for i in range(3)] + [[]]
+        records = evaluator.evaluate_many(session_lists, workers=1, as_record=True)
+        expected = evaluator.evaluate_many(session_lists, workers=1)
+        assert all(isinstance(r, PerformanceRecord) for r in records)
+        assert [r.to_performance() for r in records] == expected
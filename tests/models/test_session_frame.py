@@ -0,0 +1,139 @@
+"""Tests for SessionFrame model."""
+from decimal import Decimal
+import numpy as np
+import pytest
+from evaluator import PerformanceEvaluator
+from evaluator.calculators.calculator import PerformanceCalculator
+from evaluator.models.session_frame import SessionFrame
+from evaluator.models.session_stats import SessionStats
+from evaluator.models.position_session_stats import PositionSessionStats
+
+
+def _make_sessions():
+    return [
+        SessionStats(
+            session=20251115,
+            start_cash=Decimal("100000"),
+            end_cash=Decimal("95000"),
+            end_positions=[
+                PositionSessionStats(
+                    session=20251115,
+                    symbol="600000",
+                    start_value=Decimal("0"),
+                    end_volume=500,
+                    end_value=Decimal("5500"),
+                    realized_profit=Decimal("0"),
+                    commission=Decimal("5"),
+                    trade_count=1,
+                ),
+            ],
+        ),
+        SessionStats(
+            session=20251118,
+            start_cash=Decimal("95000"),
+            end_cash=Decimal("101000"),
+            end_positions=[
+                PositionSessionStats(
+                    session=20251118,
+                    symbol="600000",
+                    start_value=Decimal("5500"),
+                    end_volume=0,
+                    end_value=Decimal("0"),
+                    realized_profit=Decimal("500"),
+                    commission=Decimal("6"),
+                    trade_count=1,
+                ),
+                PositionSessionStats(
+                    session=20251118,
+                    symbol="000001",
+                    end_volume=100,
+                    end_value=Decimal("1000"),
+                    commission=Decimal("2"),
+                    trade_count=1,
+                ),
+            ],
+        ),
+        SessionStats(
+            session=20251119,
+            start_cash=Decimal("101000"),
+            end_cash=Decimal("99000"),
+        ),
+    ]
+
+
+class TestSessionFrame:
+    """Tests for SessionFrame model."""
+
+    def test_from_sessions_columns(self):
+        """Test account-level columns are built from session stats."""
+        sessions = _make_sessions()
+        frame = SessionFrame.from_sessions(sessions)
+        assert len(frame) == 3
+        assert frame.session.tolist() == [20251115, 20251118, 20251119]
+        assert frame.start_cash.tolist() == [100000.0, 95000.0, 101000.0]
+        assert frame.end_market_value.tolist() == [float(s.end_market_value) for s in sessions]
+        assert frame.commission.tolist() == [float(s.total_commission) for s in sessions]
+        assert frame.pnl.tolist() == [float(s.profit_loss) for s in sessions]
+
+    def test_from_sessions_positions_table(self):
+        """Test end positions are flattened with per-session offsets."""
+        frame = SessionFrame.from_sessions(_make_sessions())
+        assert frame.position_offsets.tolist() == [0, 1, 3, 3]
+        assert frame.position_counts.tolist() == [1, 2, 0]
+        assert frame.symbols == ["600000", "000001"]
+        assert frame.position_symbol.tolist() == [0, 0, 1]
+        assert frame.position_realized_profit.tolist() == [0.0, 500.0, 0.0]
+        assert frame.position_trade_count.tolist() == [1, 1, 1]
+
+    def test_from_sessions_account_columns_only(self):
+        """Test positions=False skips the positions table but keeps per-session counts."""
+        sessions = _make_sessions()
+        frame = SessionFrame.from_sessions(sessions, positions=False)
+        full = SessionFrame.from_sessions(sessions)
+        assert frame.pnl.tolist() == full.pnl.tolist()
+        assert frame.end_market_value.tolist() == full.end_market_value.tolist()
+        assert frame.position_offsets.tolist() == [0, 1, 3, 3]
+        assert len(frame.position_symbol) == 0
+        assert frame.symbols == []
+
+    def test_from_sessions_empty(self):
+        """Test building a frame from no sessions."""
+        frame = SessionFrame.from_sessions([])
+        assert len(frame) == 0
+        assert frame.position_offsets.tolist() == [0]
+        assert frame.symbols == []
+
+    def test_to_decimal(self):
+        """Test float to Decimal conversion uses the shortest representation."""
+        assert SessionFrame.to_decimal(0.1) == Decimal("0.1")
+        assert SessionFrame.to_decimal(np.float64(1500.0)) == Decimal("1500")
+
+    def test_frame_performance_matches_account_performance(self):
+        """Test evaluating a frame matches the Decimal path."""
+        sessions = _make_sessions()
+        expected = PerformanceCalculator.compute_account_performance(sessions, 0.03)
+        result = PerformanceCalculator.compute_frame_performance(SessionFrame.from_sessions(sessions), 0.03)
+        assert result.total_trades == expected.total_trades
+        assert result.open_positions == expected.open_positions
+        assert result.net_profit == expected.net_profit
+        assert result.max_drawdown == expected.max_drawdown
+        assert result.total_commission == expected.total_commission
+        assert result.total_win == expected.total_win
+        assert result.total_loss == expected.total_loss
+        assert result.sharpe_ratio == pytest.approx(expected.sharpe_ratio)
+        assert result.sortino_ratio == pytest.approx(expected.sortino_ratio)
+        assert result.calmar_ratio == pytest.approx(expected.calmar_ratio)
+        assert result.top_1pct_win_pct == pytest.approx(expected.top_1pct_win_pct)
+
+    def test_evaluator_accepts_frame(self):
+        """Test PerformanceEvaluator.evaluate accepts a SessionFrame."""
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03)
+        sessions = _make_sessions()
+        result = evaluator.evaluate(SessionFrame.from_sessions(sessions))
+        assert result.net_profit == evaluator.evaluate(sessions).net_profit
+
+    def test_evaluator_empty_frame(self):
+        """Test evaluating an empty frame returns empty performance."""
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03)
+        result = evaluator.evaluate(SessionFrame.from_sessions([]))
+        assert result.total_trades == 0
@@ -423,3 +423,32 @@ class TestSessionStats:
         assert session.total_commission == Decimal("20")
         assert session.total_net_cashflow == Decimal("10500")
         assert session.profit_loss == Decimal("480")
+
+    def test_session_stats_derived_values_are_cached(self):
+        """Test derived values are computed once per instance."""
+        session = SessionStats(
+            session=20251115,
+            start_cash=Decimal("100000"),
+            end_cash=Decimal("95000"),
+        )
+        assert session.profit_loss is session.profit_loss
+        assert "end_market_value" in session.__dict__
+
+    def test_session_stats_cached_values_dropped_on_copy(self):
+        """Test model_copy with updates does not reuse cached values."""
+        session = SessionStats(
+            session=20251115,
+            start_cash=Decimal("100000"),
+            end_cash=Decimal("95000"),
+        )
+        assert session.profit_loss == Decimal("-5000")
+        copied = session.model_copy(update={"end_cash": Decimal("101000")})
+        assert copied.profit_loss == Decimal("1000")
+        assert session.profit_loss == Decimal("-5000")
+
+    def test_session_stats_equality_ignores_cache(self):
+        """Test cached values do not affect equality."""
+        first = SessionStats(session=20251115, start_cash=Decimal("100000"))
+        second = SessionStats(session=20251115, start_cash=Decimal("100000"))
+        _ = first.end_market_value
+        assert first == second
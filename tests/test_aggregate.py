@@ -0,0 +1,147 @@
+"""Tests for PerformanceAggregate."""
+from decimal import Decimal
+import pickle
+import random
+import numpy as np
+import pytest
+from evaluator import PerformanceAggregate
+from evaluator.calculators import DrawdownCalculator
+from evaluator.calculators.calculator import PerformanceCalculator
+from evaluator.models.session_stats import SessionStats
+from tests.helpers import random_sessions
+
+EXACT_FIELDS = (
+    "total_trades", "open_positions", "winning_trades", "losing_trades", "net_profit",
+    "max_drawdown", "final_value", "initial_cash", "total_commission", "max_single_win",
+    "max_single_loss", "avg_win", "avg_loss", "total_win", "total_loss",
+)
+
+
+def _assert_same(result, expected):
+    for name, value in expected.model_dump().items():
+        if name in EXACT_FIELDS:
+            assert getattr(result, name) == value, name
+        else:
+            assert getattr(result, name) == pytest.approx(value, rel=1e-9, abs=1e-12), name
+
+
+def _chunks(sessions, sizes):
+    chunks = []
+    start = 0
+    for size in sizes:
+        chunks.append(sessions[start:start + size])
+        start += size
+    chunks.append(sessions[start:])
+    return chunks
+
+
+class TestPerformanceAggregate:
+    """Tests for PerformanceAggregate."""
+
+    @pytest.mark.parametrize("sizes", [(), (1,), (10, 10), (1, 1, 1, 30), (59,)])
+    def test_merged_chunks_match_serial(self, sizes):
+        """Test merging chunk aggregates matches the serial evaluation."""
+        sessions = random_sessions(60)
+        expected = PerformanceCalculator.compute_account_performance(sessions, 0.03)
+        aggregates = [PerformanceAggregate.from_sessions(chunk) for chunk in _chunks(sessions, sizes)]
+        merged = aggregates[0]
+        for aggregate in aggregates[1:]:
+            merged = merged.merge(aggregate)
+        assert len(merged) == 60
+        _assert_same(merged.to_performance(0.03), expected)
+
+    def test_merge_is_associative(self):
+        """Test (a + b) + c and a + (b + c) give the same performance."""
+        sessions = random_sessions(30, first_start_cash=Decimal("0"))
+        a, b, c = (PerformanceAggregate.from_sessions(chunk) for chunk in _chunks(sessions, (7, 11)))
+        left = a.merge(b).merge(c).to_performance(0.03)
+        right = a.merge(b.merge(c)).to_performance(0.03)
+        _assert_same(left, right)
+        _assert_same(left, PerformanceCalculator.compute_account_performance(sessions, 0.03))
+
+    def test_unfunded_head_uses_later_base_amount(self):
+        """Test the first session is adjusted by the first funded session in a later chunk."""
+        sessions = random_sessions(5, first_start_cash=Decimal("0"))
+        merged = PerformanceAggregate.from_sessions(sessions[:1]).merge(
+            PerformanceAggregate.from_sessions(sessions[1:])
+        )
+        expected = PerformanceCalculator.compute_account_performance(sessions, 0.03)
+        _assert_same(merged.to_performance(0.03), expected)
+
+    def test_merge_with_empty(self):
+        """Test empty aggregates are identities for merge."""
+        sessions = random_sessions(8)
+        aggregate = PerformanceAggregate.from_sessions(sessions)
+        empty = PerformanceAggregate()
+        expected = aggregate.to_performance(0.03)
+        _assert_same(empty.merge(aggregate).to_performance(0.03), expected)
+        _assert_same(aggregate.merge(empty).to_performance(0.03), expected)
+        assert empty.to_performance(0.03).total_trades == 0
+
+    def test_merge_does_not_mutate_inputs(self):
+        """Test merge returns a new aggregate."""
+        sessions = random_sessions(10)
+        a = PerformanceAggregate.from_sessions(sessions[:5])
+        b = PerformanceAggregate.from_sessions(sessions[5:])
+        before = a.to_performance(0.03)
+        a.merge(b)
+        assert a.to_performance(0.03) == before
+        assert len(a) == 5
+
+    def test_merge_all_matches_pairwise(self):
+        """Test folding many chunks at once matches merging them pairwise."""
+        sessions = random_sessions(60)
+        aggregates = [PerformanceAggregate.from_sessions(chunk) for chunk in _chunks(sessions, (0, 9, 1, 20))]
+        before = [a.to_performance(0.03) for a in aggregates]
+        merged = PerformanceAggregate.merge_all(aggregates)
+        assert len(merged) == 60
+        _assert_same(merged.to_performance(0.03), PerformanceCalculator.compute_account_performance(sessions, 0.03))
+        assert [a.to_performance(0.03) for a in aggregates] == before
+        assert len(PerformanceAggregate.merge_all([])) == 0
+
+    def test_drawdown_duration_across_chunks(self):
+        """Test underwater runs spanning chunk boundaries, plateaus and nested merges."""
+        rng = random.Random(3)
+        values = [Decimal(rng.choice([98, 99, 100, 101, 102])) for _ in range(300)]
+        sessions = [
+            SessionStats(session=20250101 + i, start_cash=Decimal("100"), end_cash=value)
+            for i, value in enumerate(values)
+        ]
+        expected = DrawdownCalculator.max_duration(np.array(values, dtype=float), float(values[0]))
+        assert expected > 0
+        for _ in range(20):
+            cuts = sorted(rng.sample(range(1, 300), 6))
+            chunks = [PerformanceAggregate.from_sessions(sessions[lo:hi])
+                      for lo, hi in zip([0] + cuts, cuts + [300])]
+            right = chunks[-1]
+            for chunk in reversed(chunks[1:-1]):
+                right = chunk.merge(right)
+            assert PerformanceAggregate.merge_all(chunks).to_performance(0.03).max_drawdown_duration_bars == expected
+            assert chunks[0].merge(right).to_performance(0.03).max_drawdown_duration_bars == expected
+
+    def test_keeps_only_new_highs(self):
+        """Test the aggregate keeps new equity highs rather than every session's equity."""
+        sessions = [
+            SessionStats(session=20250101 + i, start_cash=Decimal("100"), end_cash=Decimal(100 if i == 0 else 99 - i % 50))
+            for i in range(200)
+        ]
+        aggregate = PerformanceAggregate.from_sessions(sessions)
+        assert aggregate.high_positions == [0]
+        assert aggregate.to_performance(0.03).max_drawdown_duration_bars == 199
+
+    def test_copy_is_independent(self):
+        """Test adding to a copy leaves the original unchanged."""
+        sessions = random_sessions(10)
+        original = PerformanceAggregate.from_sessions(sessions[:6])
+        before = original.to_performance(0.03)
+        copied = original.copy()
+        for s in sessions[6:]:
+            copied.add(s)
+        assert original.to_performance(0.03) == before
+        _assert_same(copied.to_performance(0.03), PerformanceAggregate.from_sessions(sessions).to_performance(0.03))
+
+    def test_pickle_round_trip(self):
+        """Test aggregates can be shipped between processes."""
+        aggregate = PerformanceAggregate.from_sessions(random_sessions(10))
+        restored = pickle.loads(pickle.dumps(aggregate))
+        assert restored.to_performance(0.03) == aggregate.to_performance(0.03)
@@ -0,0 +1,60 @@
+"""Tests for SessionArchive."""
+import numpy as np
+import pytest
+from evaluator import PerformanceEvaluator, SessionArchive
+from evaluator.models.session_frame import SessionFrame
+from tests.helpers import random_sessions
+
+
+class TestSessionArchive:
+    """Tests for SessionArchive."""
+
+    def test_round_trip_columns(self, tmp_path):
+        """Test every column and the symbol dictionary survive a round trip."""
+        sessions = random_sessions(50)
+        expected = SessionFrame.from_sessions(sessions)
+        path = tmp_path / "sessions.evsf"
+        SessionArchive.write(path, sessions)
+
+        frame = SessionArchive.open(path)
+        assert len(frame) == 50
+        assert frame.symbols == expected.symbols
+        for name, _ in SessionArchive.COLUMNS:
+            assert getattr(frame, name).tolist() == getattr(expected, name).tolist(), name
+
+    def test_columns_are_memory_mapped(self, tmp_path):
+        """Test opened columns are read-only views of the file."""
+        path = tmp_path / "sessions.evsf"
+        SessionArchive.write(path, random_sessions(5))
+        frame = SessionArchive.open(path)
+        assert isinstance(frame.pnl, np.memmap)
+        assert not frame.pnl.flags.writeable
+        assert frame.pnl.ctypes.data % SessionArchive.ALIGNMENT == 0
+
+    def test_evaluate_archive(self, tmp_path):
+        """Test an opened archive evaluates like the original sessions."""
+        sessions = random_sessions(30)
+        path = tmp_path / "sessions.evsf"
+        SessionArchive.write(path, SessionFrame.from_sessions(sessions))
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03)
+        result = evaluator.evaluate(SessionArchive.open(path))
+        expected = evaluator.evaluate(sessions)
+        assert result.net_profit == expected.net_profit
+        assert result.sharpe_ratio == pytest.approx(expected.sharpe_ratio)
+        positions = evaluator.evaluate_all_positions(SessionArchive.open(path))
+        assert sorted(positions) == sorted(evaluator.evaluate_all_positions(sessions))
+
+    def test_empty_archive(self, tmp_path):
+        """Test an archive of no sessions."""
+        path = tmp_path / "empty.evsf"
+        SessionArchive.write(path, [])
+        frame = SessionArchive.open(path)
+        assert len(frame) == 0
+        assert frame.position_offsets.tolist() == [0]
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test opening a file without the archive magic raises ValueError."""
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not an archive at all")
+        with pytest.raises(ValueError):
+            SessionArchive.open(path)
@@ -0,0 +1,179 @@
+"""Tests for PerformanceCache."""
+from decimal import Decimal
+import pytest
+from evaluator import FixedPointFrame, PerformanceCache, PerformanceEvaluator, SessionFrame, SessionIndex, StageTimings
+from evaluator.models.session_stats import SessionStats
+from tests.helpers import random_sessions
+
+
+class TestPerformanceCache:
+    """Tests for the cache container."""
+
+    def test_get_put_counters(self):
+        """Test hits and misses are counted."""
+        cache = PerformanceCache()
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        info = cache.info()
+        assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+        assert info.nbytes > 0
+
+    def test_lru_eviction_by_entries(self):
+        """Test the least recently used entry is evicted first."""
+        cache = PerformanceCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert "a" in cache and "c" in cache and "b" not in cache
+        assert cache.evictions == 1
+
+    def test_eviction_by_memory_budget(self):
+        """Test entries are evicted to stay within max_bytes."""
+        cache = PerformanceCache(max_bytes=250)
+        cache.put("a", b"x" * 100)
+        cache.put("b", b"x" * 100)
+        cache.put("c", b"x" * 100)
+        assert cache.nbytes <= 250
+        assert "a" not in cache and "c" in cache
+        cache.put("big", b"x" * 1000)
+        assert "big" not in cache
+
+    def test_invalid_limits(self):
+        """Test non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            PerformanceCache(max_entries=0)
+        with pytest.raises(ValueError):
+            PerformanceCache(max_bytes=0)
+
+    def test_disk_tier_survives_new_instance(self, tmp_path):
+        """Test values written to disk are found by a fresh cache."""
+        PerformanceCache(directory=tmp_path).put("k", {"value": Decimal("1.5")})
+        cache = PerformanceCache(directory=tmp_path)
+        assert cache.get("k") == {"value": Decimal("1.5")}
+        assert cache.disk_hits == 1
+        assert "k" in cache
+        cache.clear(disk=True)
+        assert cache.get("k") is None
+
+    def test_hits_return_copies(self):
+        """Test mutating a returned value does not change later hits."""
+        cache = PerformanceCache()
+        value = {"values": [1, 2]}
+        cache.put("k", value)
+        value["values"].append(3)
+        first = cache.get("k")
+        first["values"].append(4)
+        assert cache.get("k") == {"values": [1, 2]}
+
+    def test_corrupt_disk_entry_is_a_miss(self, tmp_path):
+        """Test an unreadable disk entry is treated as a miss and removed."""
+        PerformanceCache(directory=tmp_path).put("k", {"value": 1})
+        path = tmp_path / "k.pkl"
+        path.write_bytes(path.read_bytes()[:5])
+        cache = PerformanceCache(directory=tmp_path)
+        assert cache.get("k", "default") == "default"
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert not path.exists()
+
+    def test_key_includes_version(self, monkeypatch):
+        """Test bumping the format version invalidates existing keys."""
+        key = PerformanceCache.key("evaluate", 1)
+        monkeypatch.setattr(PerformanceCache, "VERSION", PerformanceCache.VERSION + 1)
+        assert PerformanceCache.key("evaluate", 1) != key
+
+    def test_fingerprint_sequences(self):
+        """Test sequence fingerprints depend on content and order only."""
+        sessions = random_sessions(20)
+        copies = [
+            SessionStats(session=s.session, start_cash=s.start_cash, end_cash=s.end_cash, end_positions=s.end_positions)
+            for s in sessions
+        ]
+        assert PerformanceCache.fingerprint(sessions) == PerformanceCache.fingerprint(copies)
+        assert PerformanceCache.fingerprint(sessions) != PerformanceCache.fingerprint(sessions[::-1])
+        changed = sessions[:-1] + [sessions[-1].model_copy(update={"end_cash": sessions[-1].end_cash + 1})]
+        assert PerformanceCache.fingerprint(sessions) != PerformanceCache.fingerprint(changed)
+        assert PerformanceCache.fingerprint(iter(sessions)) is None
+
+    def test_fingerprint_frames(self):
+        """Test frame, fixed-point frame and index fingerprints."""
+        sessions = random_sessions(20)
+        frame = SessionFrame.from_sessions(sessions)
+        assert PerformanceCache.fingerprint(frame) == PerformanceCache.fingerprint(SessionFrame.from_sessions(sessions))
+        assert PerformanceCache.fingerprint(SessionIndex(frame)) == PerformanceCache.fingerprint(frame)
+        assert PerformanceCache.fingerprint(frame) != PerformanceCache.fingerprint(frame.slice(0, 19))
+        fixed = FixedPointFrame.from_sessions(sessions)
+        assert PerformanceCache.fingerprint(fixed) != PerformanceCache.fingerprint(
+            FixedPointFrame.from_sessions(sessions, decimals=3)
+        )
+
+
+class TestEvaluatorCache:
+    """Tests for caching in PerformanceEvaluator."""
+
+    def test_evaluate_hits_cache(self):
+        """Test repeated evaluation of equal inputs is served from the cache."""
+        cache = PerformanceCache()
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03, cache=cache)
+        sessions = random_sessions(50)
+        first = evaluator.evaluate(sessions)
+        second = evaluator.evaluate(list(sessions))
+        assert second == first
+        assert second is not first
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert first == PerformanceEvaluator(risk_free_rate=0.03).evaluate(sessions)
+
+    def test_key_includes_parameters(self):
+        """Test risk-free rate, engine and range are part of the key."""
+        cache = PerformanceCache()
+        sessions = random_sessions(50)
+        PerformanceEvaluator(risk_free_rate=0.03, cache=cache).evaluate(sessions)
+        PerformanceEvaluator(risk_free_rate=0.04, cache=cache).evaluate(sessions)
+        PerformanceEvaluator(risk_free_rate=0.03, engine="numpy", cache=cache).evaluate(sessions)
+        PerformanceEvaluator(risk_free_rate=0.03, cache=cache).evaluate(sessions, start=sessions[5].session)
+        assert cache.hits == 0
+        assert len(cache) == 4
+
+    def test_generators_bypass_cache(self):
+        """Test single-pass iterables are evaluated without caching."""
+        cache = PerformanceCache()
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03, cache=cache)
+        sessions = random_sessions(30)
+        result = evaluator.evaluate(iter(sessions))
+        assert result.net_profit == evaluator.evaluate(sessions).net_profit
+        assert len(cache) == 1
+
+    def test_compare_hits_cache(self):
+        """Test compare results are cached."""
+        cache = PerformanceCache()
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03, cache=cache)
+        a = random_sessions(30, seed=1)
+        b = random_sessions(30, seed=2)
+        first = evaluator.compare(a, b)
+        second = evaluator.compare(a, b)
+        assert second == first
+        assert second is not first
+        assert cache.hits == 1
+
+    def test_cache_hit_timings(self):
+        """Test a cache hit records its own stage and reports timings."""
+        reported = []
+        evaluator = PerformanceEvaluator(cache=PerformanceCache(), on_timings=reported.append)
+        sessions = random_sessions(30)
+        evaluator.evaluate(sessions)
+        timings = StageTimings()
+        evaluator.evaluate(sessions, timings=timings)
+        assert list(timings.calls) == [StageTimings.CACHE_HIT]
+        assert len(reported) == 2
+        assert reported[1] is timings
+        assert StageTimings.CACHE_HIT not in reported[0].calls
+
+    def test_disk_tier_across_evaluators(self, tmp_path):
+        """Test results persist on disk for a new evaluator and cache."""
+        sessions = random_sessions(40)
+        expected = PerformanceEvaluator(cache=PerformanceCache(directory=tmp_path)).evaluate(sessions)
+        cache = PerformanceCache(directory=tmp_path)
+        result = PerformanceEvaluator(cache=cache).evaluate(sessions)
+        assert result == expected
+        assert cache.disk_hits == 1
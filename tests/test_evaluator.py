@@ -5,6 +5,8 @@ from evaluator import PerformanceEvaluator
 from evaluator.models.session_stats import SessionStats
 from evaluator.models.position_session_stats import PositionSessionStats
 from evaluator.models.performance import Performance
+from evaluator.calculators.calculator import PerformanceCalculator
+from tests.helpers import assert_performance_close, random_sessions
 
 
 class ConcretePerformanceEvaluator(PerformanceEvaluator):
@@ -389,3 +391,261 @@ class TestPerformanceEvaluator:
         )
         result = evaluator.evaluate([session])
         assert result.total_commission > 0
+
+    def test_numpy_engine_matches_decimal_engine(self):
+        """Test numpy engine produces the same metrics as the decimal engine."""
+        sessions = [
+            SessionStats(session=20251115, start_cash=Decimal("100000"), end_cash=Decimal("105000")),
+            SessionStats(session=20251118, start_cash=Decimal("105000"), end_cash=Decimal("103000")),
+            SessionStats(session=20251119, start_cash=Decimal("103000"), end_cash=Decimal("108000")),
+        ]
+        expected = ConcretePerformanceEvaluator(risk_free_rate=0.02).evaluate(sessions)
+        result = ConcretePerformanceEvaluator(risk_free_rate=0.02, engine="numpy").evaluate(sessions)
+        assert result.net_profit == expected.net_profit
+        assert result.max_drawdown == expected.max_drawdown
+        assert result.win_rate == expected.win_rate
+        assert result.sharpe_ratio == pytest.approx(expected.sharpe_ratio)
+
+    def test_unknown_engine(self):
+        """Test unknown engine is rejected."""
+        with pytest.raises(ValueError):
+            ConcretePerformanceEvaluator(engine="gpu")
+
+    def test_evaluate_all_positions(self):
+        """Test evaluate_all_positions returns one performance per symbol."""
+        evaluator = ConcretePerformanceEvaluator(risk_free_rate=0.02)
+        sessions = [
+            SessionStats(
+                session=20251115,
+                start_cash=Decimal("100000"),
+                end_positions=[
+                    PositionSessionStats(session=20251115, symbol="600000", start_value=Decimal("1000"),
+                                         end_value=Decimal("1100"), realized_profit=Decimal("100")),
+                    PositionSessionStats(session=20251115, symbol="000001", start_value=Decimal("2000"),
+                                         end_value=Decimal("1900"), realized_profit=Decimal("-100")),
+                ],
+            ),
+            SessionStats(
+                session=20251118,
+                start_cash=Decimal("100000"),
+                end_positions=[
+                    PositionSessionStats(session=20251118, symbol="600000", start_value=Decimal("1100"),
+                                         end_value=Decimal("1000"), realized_profit=Decimal("-50")),
+                ],
+            ),
+        ]
+        results = evaluator.evaluate_all_positions(sessions)
+        assert list(results) == ["000001", "600000"]
+        assert results["600000"].winning_trades == 1
+        assert results["600000"].losing_trades == 1
+        assert results["600000"].max_drawdown == Decimal("100")
+        assert results["000001"].net_profit == Decimal("-100")
+
+    def _session_lists(self):
+        return [
+            [
+                SessionStats(
+                    session=20251115 + i,
+                    start_cash=Decimal("100000"),
+                    end_cash=Decimal("100000") + Decimal(k * 100 * (i % 3 - 1)),
+                )
+                for i in range(5)
+            ]
+            for k in range(6)
+        ]
+
+    def test_evaluate_many_serial(self):
+        """Test evaluate_many preserves input order in-process."""
+        evaluator = ConcretePerformanceEvaluator(risk_free_rate=0.02)
+        session_lists = self._session_lists()
+        results = evaluator.evaluate_many(session_lists, workers=1)
+        assert [r.net_profit for r in results] == [evaluator.evaluate(s).net_profit for s in session_lists]
+
+    def test_evaluate_many_process_pool(self):
+        """Test evaluate_many across worker processes matches serial evaluation."""
+        evaluator = ConcretePerformanceEvaluator(risk_free_rate=0.02, engine="numpy")
+        session_lists = self._session_lists() + [[]]
+        results = evaluator.evaluate_many(session_lists, workers=2)
+        assert len(results) == len(session_lists)
+        for result, sessions in zip(results, session_lists):
+            expected = evaluator.evaluate(sessions)
+            assert result.net_profit == expected.net_profit
+            assert result.max_drawdown == expected.max_drawdown
+            assert result.sharpe_ratio == pytest.approx(expected.sharpe_ratio)
+
+    @pytest.mark.parametrize("engine", ["decimal", "numpy", "fixed"])
+    def test_evaluate_many_honours_engine(self, engine):
+        """Test evaluate_many gives exactly what evaluate gives under each engine."""
+        evaluator = ConcretePerformanceEvaluator(risk_free_rate=0.02, engine=engine)
+        session_lists = self._session_lists()
+        results = evaluator.evaluate_many(session_lists, workers=1)
+        assert results == [evaluator.evaluate(s) for s in session_lists]
+
+    def test_evaluate_many_fixed_process_pool(self):
+        """Test fixed-point frames are evaluated with the fixed kernel in workers."""
+        evaluator = ConcretePerformanceEvaluator(risk_free_rate=0.02, engine="fixed")
+        session_lists = self._session_lists()
+        results = evaluator.evaluate_many(session_lists, workers=2)
+        assert results == [evaluator.evaluate(s) for s in session_lists]
+
+    def test_evaluate_many_decimal_process_pool(self):
+        """Test the default decimal engine fans out with exact amounts."""
+        evaluator = ConcretePerformanceEvaluator(risk_free_rate=0.02)
+        session_lists = self._session_lists() + [[]]
+        results = evaluator.evaluate_many(session_lists, workers=2)
+        for result, sessions in zip(results, session_lists):
+            expected = evaluator.evaluate(sessions)
+            assert (result.net_profit, result.max_drawdown) == (expected.net_profit, expected.max_drawdown)
+            assert_performance_close(result, expected, 1e-12)
+
+    def test_evaluate_many_decimal_inexact_falls_back(self):
+        """Test amounts finer than money_decimals are evaluated on the Decimal path."""
+        evaluator = ConcretePerformanceEvaluator(risk_free_rate=0.02)
+        sessions = self._session_lists()[0]
+        sessions[1] = sessions[1].model_copy(update={"end_cash": sessions[1].end_cash + Decimal("0.001")})
+        task = evaluator._account_frame(sessions)
+        assert isinstance(task, list)
+        results = evaluator.evaluate_many([sessions, self._session_lists()[1]], workers=2, as_record=True)
+        assert results[0].net_profit == evaluator.evaluate(sessions).net_profit
+
+    def test_evaluate_many_empty(self):
+        """Test evaluate_many with no inputs."""
+        evaluator = ConcretePerformanceEvaluator(risk_free_rate=0.02, engine="numpy")
+        assert evaluator.evaluate_many([], workers=4) == []
+        assert ConcretePerformanceEvaluator(risk_free_rate=0.02).evaluate_many([]) == []
+
+    def test_compare_unordered_and_duplicate_sessions(self):
+        """Test compare aligns unordered inputs and keeps the last duplicate."""
+        evaluator = ConcretePerformanceEvaluator()
+        sessions_a = [
+            SessionStats(session=20251118, start_cash=Decimal("101000"), end_cash=Decimal("102000")),
+            SessionStats(session=20251115, start_cash=Decimal("100000"), end_cash=Decimal("100500")),
+            SessionStats(session=20251115, start_cash=Decimal("100000"), end_cash=Decimal("101000")),
+        ]
+        sessions_b = [
+            SessionStats(session=20251115, start_cash=Decimal("100000"), end_cash=Decimal("101000")),
+            SessionStats(session=20251119, start_cash=Decimal("101000"), end_cash=Decimal("101500")),
+        ]
+        result = evaluator.compare(sessions_a, sessions_b)
+        assert result.matched_sessions == 1
+        assert result.total_sessions == 3
+        assert len(result.sessions) == 1
+        assert result.sessions[0].session == 20251115
+        assert result.sessions[0].pnl_delta == Decimal("0")
+
+    def test_compare_session_columns(self):
+        """Test compare exposes per-session deltas as arrays."""
+        evaluator = ConcretePerformanceEvaluator()
+        sessions_a = [
+            SessionStats(session=20251115 + i, start_cash=Decimal("100000"), end_cash=Decimal(100000 + i * 100))
+            for i in range(5)
+        ]
+        sessions_b = [
+            SessionStats(session=20251115 + i, start_cash=Decimal("100000"), end_cash=Decimal(100000 + i * 150))
+            for i in range(1, 6)
+        ]
+        result = evaluator.compare(sessions_a, sessions_b)
+        assert result.sessions.session.tolist() == [20251116, 20251117, 20251118, 20251119]
+        assert result.sessions.pnl_delta.tolist() == [50.0, 100.0, 150.0, 200.0]
+        assert [c.pnl_delta for c in result.sessions] == [Decimal(v) for v in (50, 100, 150, 200)]
+
+    def test_evaluate_generator_matches_list(self):
+        """Test a generator is evaluated in one pass with the same result as a list."""
+        evaluator = ConcretePerformanceEvaluator()
+        sessions = random_sessions(40, first_start_cash=Decimal("0"))
+        expected = evaluator.evaluate(sessions)
+        result = evaluator.evaluate(s for s in sessions)
+        assert result.net_profit == expected.net_profit
+        assert result.max_drawdown == expected.max_drawdown
+        assert result.total_win == expected.total_win
+        assert result.winning_trades == expected.winning_trades
+        assert result.sharpe_ratio == pytest.approx(expected.sharpe_ratio, rel=1e-9)
+        assert result.top_5pct_loss_pct == pytest.approx(expected.top_5pct_loss_pct)
+
+    @pytest.mark.parametrize("engine", ["decimal", "numpy", "fixed"])
+    def test_evaluate_generator_under_each_engine(self, engine):
+        """Test generators give exact amounts and ratios within float precision under every engine."""
+        evaluator = ConcretePerformanceEvaluator(engine=engine)
+        sessions = random_sessions(60)
+        expected = evaluator.evaluate(sessions)
+        result = evaluator.evaluate(iter(sessions))
+        exact = PerformanceCalculator.compute_account_performance(sessions, evaluator._risk_free_rate)
+        assert (result.net_profit, result.max_drawdown, result.total_win) == (
+            exact.net_profit, exact.max_drawdown, exact.total_win)
+        assert_performance_close(result, expected, 1e-9)
+
+    def test_evaluate_generator_fixed_checks_minor_units(self):
+        """Test the fixed engine rejects inexact amounts in a stream as it does for a list."""
+        evaluator = ConcretePerformanceEvaluator(engine="fixed")
+        sessions = random_sessions(5)
+        sessions[2] = sessions[2].model_copy(update={"end_cash": sessions[2].end_cash + Decimal("0.001")})
+        with pytest.raises(ValueError, match="decimal places"):
+            evaluator.evaluate(sessions)
+        with pytest.raises(ValueError, match="decimal places"):
+            evaluator.evaluate(iter(sessions))
+        with pytest.raises(ValueError, match="decimal places"):
+            evaluator.compare(iter(sessions), iter(sessions))
+
+    def test_evaluate_generator_with_range(self):
+        """Test start/end filter a generator lazily."""
+        evaluator = ConcretePerformanceEvaluator()
+        sessions = random_sessions(20)
+        expected = evaluator.evaluate(sessions[3:9])
+        result = evaluator.evaluate(iter(sessions), start=20250104, end=20250109)
+        assert result.net_profit == expected.net_profit
+        assert result.total_trades == expected.total_trades
+
+    def test_evaluate_empty_generator(self):
+        """Test an empty generator evaluates to empty performance."""
+        evaluator = ConcretePerformanceEvaluator()
+        assert evaluator.evaluate(iter([])).total_trades == 0
+
+    def test_compare_streams_match_lists(self):
+        """Test comparing two ordered generators matches comparing lists."""
+        evaluator = ConcretePerformanceEvaluator()
+        sessions_a = [
+            SessionStats(session=20251115 + i, start_cash=Decimal("100000"), end_cash=Decimal(100000 + i * 100))
+            for i in range(6)
+        ]
+        sessions_b = [
+            SessionStats(session=20251115 + i, start_cash=Decimal("100000"), end_cash=Decimal(100000 - i * 70))
+            for i in range(2, 9)
+        ]
+        expected = evaluator.compare(sessions_a, sessions_b)
+        result = evaluator.compare(iter(sessions_a), (s for s in sessions_b))
+        assert result.matched_sessions == expected.matched_sessions == 4
+        assert result.total_sessions == expected.total_sessions
+        assert result.net_profit_delta == expected.net_profit_delta
+        assert result.sharpe_ratio_delta == pytest.approx(expected.sharpe_ratio_delta, rel=1e-9, abs=1e-12)
+        assert list(result.sessions) == list(expected.sessions)
+        assert result.sessions.pnl_delta.tolist() == expected.sessions.pnl_delta.tolist()
+
+    @pytest.mark.parametrize("as_stream", [False, True])
+    def test_compare_without_sessions(self, as_stream, caplog):
+        """Test keep_sessions=False keeps the counts and totals but no per-session table."""
+        evaluator = ConcretePerformanceEvaluator()
+        sessions_a = [
+            SessionStats(session=20251115 + i, start_cash=Decimal("100000"), end_cash=Decimal(100000 + i * 100))
+            for i in range(6)
+        ]
+        sessions_b = [
+            SessionStats(session=20251115 + i, start_cash=Decimal("100000"), end_cash=Decimal(100000 - i * 70))
+            for i in range(2, 9)
+        ]
+        expected = evaluator.compare(sessions_a, sessions_b)
+        inputs = (iter(sessions_a), iter(sessions_b)) if as_stream else (sessions_a, sessions_b)
+        result = evaluator.compare(*inputs, keep_sessions=False)
+        assert len(result.sessions) == 0
+        assert (result.matched_sessions, result.total_sessions) == (4, expected.total_sessions)
+        assert result.net_profit_delta == expected.net_profit_delta
+        assert "only in first set: 2" in caplog.text
+
+    def test_compare_streams_require_order(self):
+        """Test out-of-order streamed sessions raise ValueError."""
+        evaluator = ConcretePerformanceEvaluator()
+        sessions = [
+            SessionStats(session=20251116, start_cash=Decimal("100000"), end_cash=Decimal("100100")),
+            SessionStats(session=20251115, start_cash=Decimal("100100"), end_cash=Decimal("100200")),
+        ]
+        with pytest.raises(ValueError):
+            evaluator.compare(iter(sessions), iter(sessions))
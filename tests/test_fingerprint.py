@@ -0,0 +1,70 @@
+"""Tests for SessionFingerprint."""
+from evaluator import SessionFingerprint
+from evaluator.models.session_stats import SessionStats
+from tests.helpers import random_sessions
+
+
+class TestSessionFingerprint:
+    """Tests for the chained session fingerprint."""
+
+    def test_append_matches_bulk(self):
+        """Test appending one session at a time gives the bulk fingerprint."""
+        sessions = random_sessions(30)
+        incremental = SessionFingerprint()
+        for s in sessions:
+            incremental.append(s)
+        assert incremental == SessionFingerprint(sessions)
+        assert len(incremental) == 30
+
+    def test_prefix_digests(self):
+        """Test any prefix digest equals the fingerprint of that prefix."""
+        sessions = random_sessions(20)
+        fingerprint = SessionFingerprint(sessions)
+        for n in (0, 1, 7, 20):
+            assert fingerprint.digest(n) == SessionFingerprint(sessions[:n]).digest()
+
+    def test_order_and_content_sensitive(self):
+        """Test reordering or changing a session changes the fingerprint."""
+        sessions = random_sessions(10)
+        assert SessionFingerprint(sessions) != SessionFingerprint(sessions[::-1])
+        changed = list(sessions)
+        changed[3] = changed[3].model_copy(update={"start_cash": changed[3].start_cash + 1})
+        assert SessionFingerprint(sessions) != SessionFingerprint(changed)
+
+    def test_equal_content_equal_fingerprint(self):
+        """Test separately built but equal sessions fingerprint the same."""
+        sessions = random_sessions(10)
+        copies = [
+            SessionStats(session=s.session, start_cash=s.start_cash, end_cash=s.end_cash, end_positions=s.end_positions)
+            for s in sessions
+        ]
+        assert SessionFingerprint(sessions).hexdigest() == SessionFingerprint(copies).hexdigest()
+
+    def test_common_prefix(self):
+        """Test the longest common prefix of two series is found."""
+        sessions = random_sessions(50)
+        other = list(sessions)
+        other[31] = other[31].model_copy(update={"end_cash": other[31].end_cash + 1})
+        a = SessionFingerprint(sessions)
+        b = SessionFingerprint(other)
+        assert a.common_prefix(b) == 31
+        assert b.common_prefix(a) == 31
+        assert a.common_prefix(SessionFingerprint(sessions[:12])) == 12
+        assert a.common_prefix(SessionFingerprint()) == 0
+
+    def test_startswith(self):
+        """Test prefix detection."""
+        sessions = random_sessions(20)
+        full = SessionFingerprint(sessions)
+        assert full.startswith(SessionFingerprint(sessions[:10]))
+        assert not SessionFingerprint(sessions[:10]).startswith(full)
+        assert not full.startswith(SessionFingerprint(sessions[1:5]))
+
+    def test_truncate_and_copy(self):
+        """Test truncating a copy leaves the original unchanged."""
+        sessions = random_sessions(10)
+        original = SessionFingerprint(sessions)
+        copied = original.copy()
+        copied.truncate(4)
+        assert copied == SessionFingerprint(sessions[:4])
+        assert len(original) == 10
@@ -0,0 +1,98 @@
+"""Tests for stage timing instrumentation."""
+from decimal import Decimal
+import pytest
+from evaluator import PerformanceEvaluator, SessionFrame, SessionIndex, StageTimings
+from evaluator.calculators.calculator import PerformanceCalculator
+from evaluator.models.session_stats import SessionStats
+
+ACCOUNT_STAGES = [
+    StageTimings.VALIDATION,
+    StageTimings.EQUITY_DRAWDOWN,
+    StageTimings.PNL_CLASSIFICATION,
+    StageTimings.TOP_CONTRIBUTIONS,
+    StageTimings.RATIOS,
+    StageTimings.MODEL_CONSTRUCTION,
+]
+
+
+def _sessions():
+    return [
+        SessionStats(session=20251115, start_cash=Decimal("100000"), end_cash=Decimal("101000")),
+        SessionStats(session=20251118, start_cash=Decimal("101000"), end_cash=Decimal("100000")),
+    ]
+
+
+class TestStageTimings:
+    """Tests for StageTimings."""
+
+    def test_mark_accumulates(self):
+        """Test marks accumulate per stage across runs."""
+        timings = StageTimings().start()
+        timings.mark("a")
+        timings.mark("b")
+        timings.start()
+        timings.mark("a")
+        assert timings.calls == {"a": 2, "b": 1}
+        assert timings.total == pytest.approx(sum(timings.as_dict().values()))
+        assert all(seconds >= 0 for seconds in timings.seconds.values())
+
+    def test_decimal_path_records_all_stages(self):
+        """Test compute_account_performance records each stage in order."""
+        timings = StageTimings()
+        PerformanceCalculator.compute_account_performance(_sessions(), 0.03, timings)
+        assert list(timings.seconds) == ACCOUNT_STAGES
+
+    def test_frame_path_records_all_stages(self):
+        """Test the vectorized path records frame conversion and each stage."""
+        timings = StageTimings()
+        PerformanceCalculator.compute_account_performance_vectorized(_sessions(), 0.03, timings)
+        assert list(timings.seconds) == [StageTimings.FRAME_CONVERSION] + ACCOUNT_STAGES
+
+    def test_evaluator_callback(self):
+        """Test the evaluator reports timings through the callback."""
+        reported = []
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03, on_timings=reported.append)
+        evaluator.evaluate(_sessions())
+        evaluator.evaluate(SessionFrame.from_sessions(_sessions()))
+        assert len(reported) == 2
+        assert list(reported[0].seconds) == ACCOUNT_STAGES
+
+    def test_evaluator_returned_stats_object(self):
+        """Test a caller-supplied StageTimings is filled in."""
+        timings = StageTimings()
+        PerformanceEvaluator(engine="numpy").evaluate(_sessions(), timings=timings)
+        assert StageTimings.FRAME_CONVERSION in timings.seconds
+        assert timings.calls[StageTimings.RATIOS] == 1
+
+    @pytest.mark.parametrize("make_input, stages", [
+        (lambda s: s, ACCOUNT_STAGES),
+        (lambda s: iter(s), [StageTimings.AGGREGATION, StageTimings.RATIOS,
+                             StageTimings.TOP_CONTRIBUTIONS, StageTimings.MODEL_CONSTRUCTION]),
+        (lambda s: SessionIndex(SessionFrame.from_sessions(s)), [
+            StageTimings.EQUITY_DRAWDOWN, StageTimings.PNL_CLASSIFICATION, StageTimings.RATIOS,
+            StageTimings.TOP_CONTRIBUTIONS, StageTimings.MODEL_CONSTRUCTION]),
+        (lambda s: [], [StageTimings.MODEL_CONSTRUCTION]),
+        (lambda s: iter([]), [StageTimings.AGGREGATION, StageTimings.MODEL_CONSTRUCTION]),
+        (lambda s: SessionFrame.from_sessions([]), [StageTimings.MODEL_CONSTRUCTION]),
+    ])
+    def test_callback_once_per_evaluate(self, make_input, stages):
+        """Test every input kind reports exactly once with the stages that ran."""
+        reported = []
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03, on_timings=reported.append)
+        evaluator.evaluate(make_input(_sessions()))
+        assert len(reported) == 1
+        assert list(reported[0].calls) == stages
+        assert set(reported[0].calls.values()) == {1}
+
+    def test_callback_for_metrics(self):
+        """Test evaluate(metrics=...) reports frame conversion and metric computation."""
+        reported = []
+        evaluator = PerformanceEvaluator(engine="numpy", on_timings=reported.append)
+        evaluator.evaluate(_sessions(), metrics=["net_profit"])
+        assert len(reported) == 1
+        assert list(reported[0].calls) == [StageTimings.FRAME_CONVERSION, StageTimings.METRICS]
+
+    def test_disabled_by_default(self):
+        """Test evaluation works without instrumentation."""
+        result = PerformanceEvaluator().evaluate(_sessions())
+        assert result.total_trades == 2
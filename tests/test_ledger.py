@@ -0,0 +1,130 @@
+"""Tests for SessionLedger."""
+from decimal import Decimal
+import numpy as np
+import pytest
+from evaluator import SessionFingerprint, SessionFrame, SessionLedger
+from evaluator.calculators import PerformanceCalculator, RollingCalculator
+from evaluator.models.position_session_stats import PositionSessionStats
+from tests.helpers import assert_performance_close, random_sessions
+
+ROLLING_FIELDS = ("sharpe_ratio", "sortino_ratio", "win_rate", "net_profit", "max_drawdown")
+
+
+def _restate(session, delta="12.34", symbol="999999"):
+    """A corrected copy of ``session`` with different cash and an extra position."""
+    position = PositionSessionStats(
+        session=session.session,
+        symbol=symbol,
+        end_volume=100,
+        end_value=Decimal("1000"),
+        realized_profit=Decimal("-25.5"),
+        commission=Decimal("1.5"),
+        trade_count=1,
+    )
+    return session.model_copy(update={
+        "end_cash": session.end_cash + Decimal(delta),
+        "end_positions": list(session.end_positions) + [position],
+    })
+
+
+def _assert_matches_full_recompute(ledger, sessions, window=10):
+    expected_performance = PerformanceCalculator.compute_account_performance(sessions, 0.03)
+    assert_performance_close(ledger.performance(), expected_performance, 1e-9)
+    assert ledger.performance().net_profit == expected_performance.net_profit
+
+    expected_positions = {
+        symbol: PerformanceCalculator.compute_position_performance(stats, symbol, 0.03)
+        for symbol, stats in sorted(PerformanceCalculator.index_positions(sessions).items())
+    }
+    assert ledger.position_performance() == expected_positions
+
+    expected = RollingCalculator.compute_rolling_metrics(SessionFrame.from_sessions(sessions), window, 0.03, 3)
+    result = ledger.rolling(window, 3)
+    assert result.session.tolist() == expected.session.tolist()
+    for name in ROLLING_FIELDS:
+        np.testing.assert_allclose(getattr(result, name), getattr(expected, name), rtol=1e-9, atol=1e-6)
+
+
+class TestSessionLedger:
+    """Tests for incremental recomputation in SessionLedger."""
+
+    def test_empty_ledger(self):
+        """Test an empty ledger returns empty results."""
+        ledger = SessionLedger()
+        assert ledger.performance().total_trades == 0
+        assert ledger.position_performance() == {}
+        assert len(ledger.rolling(5)) == 0
+
+    def test_append_matches_full_recompute(self):
+        """Test results stay equal to a full recompute while appending."""
+        sessions = random_sessions(120)
+        ledger = SessionLedger(risk_free_rate=0.03, sessions=sessions[:50], block_size=16)
+        _assert_matches_full_recompute(ledger, sessions[:50])
+        for n in range(51, 121, 7):
+            ledger.extend(sessions[len(ledger):n])
+            _assert_matches_full_recompute(ledger, sessions[:n])
+
+    def test_blocks_hold_their_own_sessions(self):
+        """Test each stored block aggregates only its own sessions."""
+        ledger = SessionLedger(sessions=random_sessions(100), block_size=16)
+        ledger.performance()
+        assert [len(block) for block in ledger._blocks] == [16] * 6 + [4]
+        assert sum(len(block.wins) + len(block.losses) for block in ledger._blocks) <= 100
+
+    def test_amend_matches_full_recompute(self):
+        """Test amending recent and old sessions matches a full recompute."""
+        sessions = random_sessions(100)
+        ledger = SessionLedger(risk_free_rate=0.03, sessions=sessions, block_size=16)
+        _assert_matches_full_recompute(ledger, sessions)
+
+        for index in (99, 97, 40, 0):
+            sessions[index] = _restate(sessions[index])
+            ledger.amend(sessions[index])
+            _assert_matches_full_recompute(ledger, sessions)
+
+    def test_amend_removes_symbol(self):
+        """Test a restatement that drops a symbol's only position removes it."""
+        sessions = random_sessions(20)
+        sessions[-1] = _restate(sessions[-1], symbol="ONLY")
+        ledger = SessionLedger(risk_free_rate=0.03, sessions=sessions)
+        assert "ONLY" in ledger.position_performance()
+        corrected = sessions[-1].model_copy(update={"end_positions": sessions[-1].end_positions[:-1]})
+        ledger.amend(corrected)
+        assert "ONLY" not in ledger.position_performance()
+
+    def test_results_are_reused_until_changed(self):
+        """Test unchanged ledgers return the cached results."""
+        ledger = SessionLedger(risk_free_rate=0.03, sessions=random_sessions(30))
+        assert ledger.performance() is ledger.performance()
+        assert ledger.rolling(5) is ledger.rolling(5)
+        first = ledger.performance()
+        ledger.amend(ledger.sessions[-1])
+        assert ledger.performance() is first
+
+    def test_fingerprint_tracks_changes(self):
+        """Test the ledger fingerprint follows appends and amendments."""
+        sessions = random_sessions(30)
+        ledger = SessionLedger(sessions=sessions)
+        assert ledger.fingerprint == SessionFingerprint(sessions)
+        sessions[10] = _restate(sessions[10])
+        ledger.amend(sessions[10])
+        assert ledger.fingerprint == SessionFingerprint(sessions)
+
+    def test_append_out_of_order_rejected(self):
+        """Test appending a session that is not after the last one fails."""
+        sessions = random_sessions(5)
+        ledger = SessionLedger(sessions=sessions)
+        with pytest.raises(ValueError):
+            ledger.append(sessions[2])
+
+    def test_amend_unknown_session_rejected(self):
+        """Test amending a session that is not in the ledger fails."""
+        sessions = random_sessions(5)
+        ledger = SessionLedger(sessions=sessions[:3])
+        with pytest.raises(KeyError):
+            ledger.amend(sessions[4])
+
+    def test_invalid_block_size(self):
+        """Test a non-positive block size is rejected."""
+        with pytest.raises(ValueError):
+            SessionLedger(block_size=0)
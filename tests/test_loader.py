@@ -0,0 +1,115 @@
+"""Tests for SessionLoader."""
+import csv
+import json
+from decimal import Decimal
+import pytest
+from pydantic import ValidationError
+from evaluator import PerformanceEvaluator, SessionLoader
+from evaluator.models.session_frame import SessionFrame
+from evaluator.models.session_stats import SessionStats
+from evaluator.models.position_session_stats import PositionSessionStats
+from tests.helpers import random_sessions
+
+
+def _sessions_with_prices():
+    return [
+        SessionStats(
+            session=20251115,
+            start_cash=Decimal("100000"),
+            end_cash=Decimal("0"),
+            start_positions=[
+                PositionSessionStats(session=20251115, symbol="600000", start_volume=100,
+                                     start_value=Decimal("1000.5"), net_cashflow=Decimal("-200"),
+                                     commission=Decimal("1.25")),
+            ],
+            end_positions=[
+                PositionSessionStats(session=20251115, symbol="600000", end_volume=200,
+                                     end_value=Decimal("2000"), end_market_price=Decimal("10.3"),
+                                     commission=Decimal("2.5"), trade_count=2),
+                PositionSessionStats(session=20251115, symbol="000001", end_volume=0,
+                                     end_value=Decimal("300"), realized_profit=Decimal("12.5")),
+            ],
+            trades=[{"symbol": "600000", "volume": 100}],
+        ),
+        SessionStats(session=20251118, start_cash=Decimal("99000"), end_cash=Decimal("99500")),
+    ]
+
+
+def _dump(sessions):
+    return [s.model_dump(mode="json") for s in sessions]
+
+
+class TestSessionLoader:
+    """Tests for SessionLoader."""
+
+    def test_load_frame_matches_from_sessions(self):
+        """Test the direct-to-frame path matches SessionFrame.from_sessions."""
+        sessions = _sessions_with_prices() + random_sessions(20)
+        frame = SessionLoader.load_frame(_dump(sessions), validate_fraction=1.0)
+        expected = SessionFrame.from_sessions(sessions)
+        assert frame.symbols == expected.symbols
+        assert frame.position_offsets.tolist() == expected.position_offsets.tolist()
+        for name in ("session", "start_cash", "end_cash", "end_market_value", "commission", "pnl"):
+            assert getattr(frame, name).tolist() == pytest.approx(getattr(expected, name).tolist()), name
+
+    def test_load_frame_evaluates_like_sessions(self):
+        """Test evaluating a loaded frame matches evaluating the models."""
+        sessions = random_sessions(30)
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03)
+        result = evaluator.evaluate(SessionLoader.load_frame(_dump(sessions)))
+        expected = evaluator.evaluate(sessions)
+        assert result.net_profit == expected.net_profit
+        assert result.sharpe_ratio == pytest.approx(expected.sharpe_ratio)
+
+    def test_sampled_validation_rejects_invalid_records(self):
+        """Test sampled records go through pydantic validation."""
+        records = _dump(random_sessions(3))
+        records[1]["start_positions"] = [{"session": 20250102}]
+        with pytest.raises(ValidationError):
+            SessionLoader.load_frame(records, validate_fraction=1.0)
+        assert len(SessionLoader.load_frame([records[0], records[2]], validate_fraction=1.0)) == 2
+
+    def test_sampled_validation_checks_derived_columns(self, monkeypatch):
+        """Test a disagreement with the validated model raises ValueError."""
+        from evaluator import loader
+        records = _dump(random_sessions(3))
+        original = loader._account_row
+        monkeypatch.setattr(loader, "_account_row", lambda record: original(record)[:5] + (1e12,))
+        with pytest.raises(ValueError):
+            SessionLoader.load_frame(records, validate_fraction=1.0)
+        assert len(SessionLoader.load_frame(records)) == 3
+
+    def test_invalid_fraction(self):
+        """Test validate_fraction outside [0, 1] raises ValueError."""
+        with pytest.raises(ValueError):
+            SessionLoader.load_frame([], validate_fraction=1.5)
+
+    def test_read_jsonl(self, tmp_path):
+        """Test JSON lines are read as records."""
+        sessions = _sessions_with_prices()
+        path = tmp_path / "sessions.jsonl"
+        path.write_text("\n".join(s.model_dump_json() for s in sessions) + "\n", encoding="utf-8")
+        records = list(SessionLoader.read_jsonl(path))
+        assert [SessionStats.model_validate(r) for r in records] == sessions
+        frame = SessionLoader.load_frame(records, validate_fraction=1.0)
+        assert frame.pnl.tolist() == pytest.approx([float(s.profit_loss) for s in sessions])
+
+    def test_read_csv(self, tmp_path):
+        """Test long-format CSV rows are grouped into sessions."""
+        path = tmp_path / "sessions.csv"
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["session", "start_cash", "end_cash", "symbol", "end_volume", "end_value",
+                             "end_market_price", "commission", "trade_count"])
+            writer.writerow([20251115, "100000", "95000", "600000", 500, "5500", "", "5", 1])
+            writer.writerow([20251115, "100000", "95000", "000001", 100, "1000", "10.5", "2", 1])
+            writer.writerow([20251118, "95000", "101000", "", "", "", "", "", ""])
+        records = list(SessionLoader.read_csv(path))
+        assert [r["session"] for r in records] == [20251115, 20251118]
+        assert len(records[0]["end_positions"]) == 2
+        assert records[1]["end_positions"] == []
+
+        validated = [SessionStats.model_validate(r) for r in records]
+        assert validated[0].end_market_value == Decimal("101550")
+        frame = SessionLoader.load_frame(SessionLoader.read_csv(path), validate_fraction=1.0)
+        assert frame.end_market_value.tolist() == [101550.0, 101000.0]
@@ -0,0 +1,112 @@
+"""Tests for SessionIndex range queries."""
+from decimal import Decimal
+import random
+import pytest
+from evaluator import PerformanceEvaluator, SessionIndex
+from evaluator.calculators.calculator import PerformanceCalculator
+from evaluator.models.session_frame import SessionFrame
+from evaluator.models.session_stats import SessionStats
+from tests.helpers import assert_performance_close, random_sessions
+
+
+class TestSessionIndex:
+    """Tests for SessionIndex."""
+
+    def test_random_ranges_match_slices(self):
+        """Test every queried range matches evaluating the slice."""
+        sessions = random_sessions(80)
+        sessions[0] = sessions[0].model_copy(update={"start_cash": Decimal("0")})
+        index = SessionIndex.from_sessions(sessions)
+        rng = random.Random(5)
+        ranges = [(0, 80), (0, 1), (79, 80), (1, 2)] + [
+            tuple(sorted(rng.sample(range(81), 2))) for _ in range(40)
+        ]
+        for lo, hi in ranges:
+            expected = PerformanceCalculator.compute_account_performance(sessions[lo:hi], 0.03)
+            result = index.performance_at(lo, hi, 0.03)
+            assert_performance_close(result, expected, PerformanceCalculator.VECTORIZED_RTOL)
+
+    def test_long_ranges_match_frame_slices(self):
+        """Test contributions with several cut points and durations over long ranges."""
+        frame = SessionFrame.from_sessions(random_sessions(600, seed=11))
+        index = SessionIndex(frame)
+        rng = random.Random(6)
+        ranges = [(0, 600), (1, 600), (0, 599)] + [tuple(sorted(rng.sample(range(601), 2))) for _ in range(30)]
+        for lo, hi in ranges:
+            expected = PerformanceCalculator.compute_frame_performance(frame.slice(lo, hi), 0.03)
+            assert_performance_close(index.performance_at(lo, hi, 0.03), expected, PerformanceCalculator.VECTORIZED_RTOL)
+
+    def test_ties_and_plateaus(self):
+        """Test repeated pnls and equities equal to the running peak."""
+        rng = random.Random(9)
+        sessions = []
+        cash = Decimal("1000")
+        for i in range(300):
+            end_cash = Decimal(rng.choice([990, 1000, 1000, 1010, 1020]))
+            sessions.append(SessionStats(session=20250101 + i, start_cash=cash, end_cash=end_cash))
+            cash = end_cash
+        frame = SessionFrame.from_sessions(sessions)
+        index = SessionIndex(frame)
+        for _ in range(60):
+            lo, hi = sorted(rng.sample(range(301), 2))
+            expected = PerformanceCalculator.compute_frame_performance(frame.slice(lo, hi), 0.03)
+            assert_performance_close(index.performance_at(lo, hi, 0.03), expected, PerformanceCalculator.VECTORIZED_RTOL)
+
+    def test_locate_by_session_id(self):
+        """Test session id bounds are inclusive and may fall between sessions."""
+        index = SessionIndex.from_sessions(random_sessions(10))
+        assert index.locate() == (0, 10)
+        assert index.locate(20250103, 20250105) == (2, 5)
+        assert index.locate(20240101, 20250101) == (0, 1)
+        assert index.locate(20260101, None) == (10, 10)
+        assert index.locate(20250105, 20250103) == (4, 4)
+
+    def test_empty_range(self):
+        """Test a range without sessions yields empty performance."""
+        index = SessionIndex.from_sessions(random_sessions(5))
+        assert index.performance(0.03, start=20300101).total_trades == 0
+
+    def test_unsorted_sessions_rejected(self):
+        """Test session ids must be strictly increasing."""
+        sessions = random_sessions(3)
+        with pytest.raises(ValueError):
+            SessionIndex.from_sessions([sessions[1], sessions[0]])
+
+    def test_empty_index(self):
+        """Test an index over no sessions."""
+        index = SessionIndex.from_sessions([])
+        assert len(index) == 0
+        assert index.performance(0.03).total_trades == 0
+
+
+class TestEvaluateRange:
+    """Tests for PerformanceEvaluator.evaluate with start/end."""
+
+    def test_index_list_and_frame_agree(self):
+        """Test range evaluation over an index, a list and a frame."""
+        sessions = random_sessions(40)
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03)
+        expected = evaluator.evaluate(sessions[5:21])
+        from_list = evaluator.evaluate(sessions, start=20250106, end=20250121)
+        from_frame = evaluator.evaluate(SessionFrame.from_sessions(sessions), start=20250106, end=20250121)
+        from_index = evaluator.evaluate(SessionIndex.from_sessions(sessions), start=20250106, end=20250121)
+        assert from_list == expected
+        assert_performance_close(from_frame, expected, PerformanceCalculator.VECTORIZED_RTOL)
+        assert_performance_close(from_index, expected, PerformanceCalculator.VECTORIZED_RTOL)
+
+    def test_range_without_sessions(self):
+        """Test an empty range evaluates to empty performance for every input."""
+        sessions = random_sessions(5)
+        evaluator = PerformanceEvaluator(risk_free_rate=0.03)
+        assert evaluator.evaluate(sessions, start=20300101).total_trades == 0
+        assert evaluator.evaluate(SessionFrame.from_sessions(sessions), end=20200101).total_trades == 0
+
+    def test_frame_slice(self):
+        """Test SessionFrame.slice rebases the positions table."""
+        sessions = random_sessions(10)
+        frame = SessionFrame.from_sessions(sessions)
+        part = frame.slice(3, 7)
+        expected = SessionFrame.from_sessions(sessions[3:7])
+        assert part.session.tolist() == expected.session.tolist()
+        assert part.position_offsets.tolist() == expected.position_offsets.tolist()
+        assert part.position_realized_profit.tolist() == expected.position_realized_profit.tolist()
@@ -0,0 +1,100 @@
+"""Tests for StreamingEvaluator."""
+from decimal import Decimal
+import random
+import numpy as np
+import pytest
+from evaluator import StreamingEvaluator
+from evaluator.calculators.calculator import PerformanceCalculator
+from evaluator.calculators.accumulators import RunningMoments, TopContributionTracker
+from tests.helpers import random_sessions
+
+
+def _assert_matches(result, expected):
+    for name, value in expected.model_dump().items():
+        actual = getattr(result, name)
+        if isinstance(value, float):
+            assert actual == pytest.approx(value, rel=1e-9, abs=1e-9), name
+        else:
+            assert actual == value, name
+
+
+class TestStreamingEvaluator:
+    """Tests for StreamingEvaluator."""
+
+    def test_empty(self):
+        """Test performance before any session is pushed."""
+        streaming = StreamingEvaluator(risk_free_rate=0.03)
+        assert len(streaming) == 0
+        assert streaming.performance().total_trades == 0
+
+    def test_push_matches_batch_on_every_prefix(self):
+        """Test each push matches compute_account_performance on the same prefix."""
+        sessions = random_sessions(120)
+        streaming = StreamingEvaluator(risk_free_rate=0.03)
+        for i, session in enumerate(sessions):
+            result = streaming.push(session)
+            expected = PerformanceCalculator.compute_account_performance(sessions[:i + 1], 0.03)
+            _assert_matches(result, expected)
+        assert len(streaming) == len(sessions)
+
+    def test_unfunded_first_session(self):
+        """Test first-session adjustment is applied once a funded session arrives."""
+        sessions = random_sessions(10, first_start_cash=Decimal("0"))
+        streaming = StreamingEvaluator(risk_free_rate=0.03)
+        for i, session in enumerate(sessions):
+            result = streaming.push(session)
+            expected = PerformanceCalculator.compute_account_performance(sessions[:i + 1], 0.03)
+            _assert_matches(result, expected)
+
+
+class TestAccumulators:
+    """Tests for the online accumulators."""
+
+    def test_running_moments(self):
+        """Test Welford moments match two-pass statistics."""
+        values = [3.0, -1.0, 4.0, -1.5, 9.0, -2.6]
+        moments = RunningMoments()
+        for v in values:
+            moments.add(v)
+        mean = sum(values) / len(values)
+        assert moments.mean == pytest.approx(mean)
+        assert moments.variance == pytest.approx(sum((v - mean) ** 2 for v in values) / len(values))
+        downside = [v for v in values if v < 0]
+        assert moments.downside_variance == pytest.approx(sum(v * v for v in downside) / len(downside))
+
+    def test_running_moments_merge(self):
+        """Test merging two halves equals accumulating all values."""
+        values = [3.0, -1.0, 4.0, -1.5, 9.0, -2.6, 5.0]
+        left, right, full = RunningMoments(), RunningMoments(), RunningMoments()
+        for i, v in enumerate(values):
+            (left if i < 3 else right).add(v)
+            full.add(v)
+        merged = left.merge(right)
+        assert merged.count == full.count
+        assert merged.mean == pytest.approx(full.mean)
+        assert merged.variance == pytest.approx(full.variance)
+        assert merged.downside_count == full.downside_count
+
+    def test_running_moments_of_array(self):
+        """Test building moments from an array equals accumulating its values."""
+        values = [3.0, -1.0, 4.0, -1.5, 9.0, -2.6, 5.0]
+        full = RunningMoments()
+        for v in values:
+            full.add(v)
+        moments = RunningMoments.of(np.array(values))
+        assert moments.count == full.count
+        assert moments.mean == pytest.approx(full.mean)
+        assert moments.variance == pytest.approx(full.variance)
+        assert moments.downside_variance == pytest.approx(full.downside_variance)
+        assert RunningMoments.of(np.zeros(0)).count == 0
+
+    def test_top_contribution_tracker(self):
+        """Test tracker matches sorting-based contributions."""
+        rng = random.Random(3)
+        values = [rng.uniform(0, 100) for _ in range(437)]
+        tracker = TopContributionTracker()
+        for v in values:
+            tracker.add(v)
+        total = sum(values)
+        expected = PerformanceCalculator._calculate_top_contributions(values, total)
+        assert tracker.contributions(total) == pytest.approx(expected)